@@ -4,12 +4,68 @@ import json
 import typing
 from jinja2 import Environment, PackageLoader, select_autoescape
 
-from ..const import BOT_PATHS_DIR, BOT_SCHEMAS_DIR, CACHE_DIR
+from ..const import (
+    BOT_CLIENT,
+    BOT_ENUMS_DIR,
+    BOT_LAZY,
+    BOT_PATHS_DIR,
+    BOT_SCHEMAS_DIR,
+    CACHE_DIR,
+)
 from .models import Object
 from .parser import parse_api
 from ..util import mk
 
-import msgspec
+LAZY_SCHEMAS = ["Message", "Update"]
+EAGER_SCHEMAS = [*LAZY_SCHEMAS, "User", "Chat"]
+CUSTOM_SCHEMAS = {"InputFile": "files"}
+FROZEN_PARAMS = ["reply_markup"]
+LIMITED_PATHS = {
+    "copyMessage",
+    "editMessageCaption",
+    "editMessageLiveLocation",
+    "editMessageMedia",
+    "editMessageReplyMarkup",
+    "editMessageText",
+    "forwardMessage",
+    "sendAnimation",
+    "sendAudio",
+    "sendContact",
+    "sendDice",
+    "sendDocument",
+    "sendGame",
+    "sendInvoice",
+    "sendLocation",
+    "sendMediaGroup",
+    "sendMessage",
+    "sendPhoto",
+    "sendPoll",
+    "sendSticker",
+    "sendVenue",
+    "sendVideo",
+    "sendVideoNote",
+    "sendVoice",
+}
+"""Paths sending or editing messages, which the rate limiter paces;
+sendChatAction is not one of them"""
+FROZEN_SCHEMAS = {
+    "User": "id",
+    "Chat": "id",
+    "ChatLocation": None,
+    "Location": None,
+    "BotCommand": None,
+}
+"""Schemas generated frozen and hashable, by the given field or else by
+all of them"""
+
+
+def schema_names(objects: typing.List[Object]) -> typing.List[str]:
+    return sorted(set(
+        str(t)
+        for o in objects
+        for p in [*o.params, o.response] if p
+        for t in p.types if isinstance(t, Object)
+    ))
 
 
 class Generator:
@@ -34,23 +90,52 @@ class Generator:
     #     return tmp.render(obj=obj, api=self.api)
 
     def run(self):
+        with open(str(BOT_ENUMS_DIR) + ".py", "w", encoding="utf8") as f:
+            f.write(self.get_tmp("enums.py").render(enums=self.api.enums))
         schemas = [o for o in self.api.objects if o.is_schema]
         with open(str(BOT_SCHEMAS_DIR) + ".py", "w", encoding="utf8") as f:
-            f.write(self.get_tmp("schemas.py").render(schemas=schemas))
-
-
-
-
-from .r import A, B
+            f.write(self.get_tmp("schemas.py").render(
+                schemas=schemas,
+                custom=CUSTOM_SCHEMAS,
+                enums=self.api.enums,
+                frozen=FROZEN_SCHEMAS,
+                version=self.api.version,
+            ))
+        lazy = [self.api.get(name.lower()) for name in LAZY_SCHEMAS]
+        imports = [
+            name for name in schema_names(lazy) if name not in LAZY_SCHEMAS
+        ]
+        annotations = " ".join(
+            p.lazy_annotation(LAZY_SCHEMAS) for o in lazy for p in o.params
+        )
+        typings = ["ClassVar"] + [
+            name for name in ("List", "Optional", "Union")
+            if f"{name}[" in annotations
+        ]
+        with open(BOT_LAZY, "w", encoding="utf8") as f:
+            f.write(self.get_tmp("lazy.py").render(
+                schemas=lazy,
+                lazy=LAZY_SCHEMAS,
+                eager=EAGER_SCHEMAS,
+                imports=imports,
+                typings=typings,
+            ))
+        paths = [o for o in self.api.objects if o.is_path]
+        for obj in paths:
+            for p in obj.params:
+                if p.name in FROZEN_PARAMS:
+                    p.type.types.append("Raw")
+        with open(str(BOT_PATHS_DIR) + ".py", "w", encoding="utf8") as f:
+            f.write(self.get_tmp("paths.py").render(
+                paths=paths,
+                imports=schema_names(paths),
+                limited=LIMITED_PATHS,
+            ))
+        with open(BOT_CLIENT, "w", encoding="utf8") as f:
+            f.write(self.get_tmp("client.py").render(
+                paths=paths, imports=schema_names(paths)
+            ))
 
 
 def run():
-    b = B("Hello", A(12))
-    a = A(34, b)
-
-    d = msgspec.json.encode(a)
-
-    print(d)
-
-    print(msgspec.json.decode(d, type=A))
     Generator().run()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import keyword
 import re
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 from bs4 import PageElement
 import inflection
 from markdownify import markdownify as md
@@ -47,12 +47,15 @@ class ApiType:
 
     @property
     def annotation(self):
-        ano = ", ".join(map(str, self.types))
+        return self.annotate(map(str, self.types))
+
+    def annotate(self, types: Iterable[str]) -> str:
+        ano = ", ".join(types)
         if self.optional and self.union and not self.array:
             ano += ", None"
         if self.union:
             ano = f"Union[{ano}]"
-        if self.array:
+        for _ in range(self.array):
             ano = f"List[{ano}]"
         if self.optional and not self.union:
             ano = f"Optional[{ano}]"
@@ -85,6 +88,15 @@ class Parameter:
     def types(self):
         return self.type.types
 
+    @property
+    def is_nested(self) -> bool:
+        return any(isinstance(t, Object) for t in self.types)
+
+    def lazy_annotation(self, lazy: Iterable[str]) -> str:
+        return self.type.annotate(
+            f"Lazy{t}" if str(t) in lazy else str(t) for t in self.types
+        )
+
     @property
     def alias(self) -> str:
         return self.name + ("_" if keyword.iskeyword(self.name) else "")
@@ -137,6 +149,47 @@ class Object:
     def is_schema(self):
         return self.name[0].istitle()
 
+    @property
+    def is_union(self):
+        return bool(self.childs) and all(
+            isinstance(c, Object) and c.tag for c in self.childs
+        )
+
+    @property
+    def references(self) -> Set[Object]:
+        refs = set()
+        for p in self.params:
+            for t in p.types:
+                if isinstance(t, Object):
+                    refs.add(t)
+                    refs.update(c for c in t.childs if isinstance(c, Object))
+        return refs
+
+    @property
+    def reachable(self) -> Set[Object]:
+        seen = set()
+        stack = list(self.references)
+        while stack:
+            obj = stack.pop()
+            if obj not in seen:
+                seen.add(obj)
+                stack.extend(obj.references)
+        return seen
+
+    @property
+    def is_acyclic(self) -> bool:
+        return self not in self.reachable
+
+    @property
+    def has_files(self) -> bool:
+        return any(o.name == "InputFile" for o in self.reachable)
+
+    def is_lazy(self, param: Parameter, eager: Iterable[str]) -> bool:
+        return any(
+            isinstance(t, Object) and (t is self or t.name not in eager)
+            for t in param.types
+        )
+
     @property
     def is_field(self):
         for p in self.params:
@@ -152,6 +205,12 @@ class Object:
     def snake(self) -> str:
         return inflection.underscore(self.name)
 
+    @property
+    def base(self) -> str:
+        if self.parrent and not self.parrent.is_union:
+            return self.parrent.camel
+        return "Schema"
+
     @property
     def tag(self) -> Optional[Tag]:
         for p in self.params:
@@ -199,6 +258,7 @@ class Group:
 class Api:
     version: str
     groups: List[Group] = field(default_factory=list)
+    enums: List[ApiEnum] = field(default_factory=list)
     indexed: Dict[str, Object] = field(default_factory=dict)
 
     @property
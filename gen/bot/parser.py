@@ -2,7 +2,8 @@ import operator
 import re
 import urllib.request
 from bs4 import BeautifulSoup
-from .models import Api, Tag, Group, Object, Parameter, ApiType
+import inflection
+from .models import Api, ApiEnum, Tag, Group, Object, Parameter, ApiType
 from ..const import BOT_API_HTML
 
 EMPTY_OBJECT = Object()
@@ -10,6 +11,14 @@ ETURN = "eturn"
 HREF = "href"
 ARRAY_OF = "Array of "
 OR = " or "
+ATTACH = "attach://"
+INPUT_FILE = "#inputfile"
+ENUM_PATTERN = re.compile(
+    r"\b(?:can be|one of|either)\b[^.“]*“", re.IGNORECASE
+)
+"""Phrase listing the quoted values of an enum field, in the same
+sentence, e.g. "One of “forehead”, ..." but not "Can be decrypted"."""
+ENUM_VALUE_PATTERN = re.compile(r"“([^”]+)”")
 TAG_PATTERN = re.compile(r"always “([\w/]+)”|must be <em>([\w]+)</em>")
 PY_TYPES = {
     "Integer": "int",
@@ -71,6 +80,9 @@ def parse_params(child):
                             for c in td[1].contents]))]
             )
         ))
+    for p in params:
+        if p.types == ["str"] and ATTACH in p.description.text:
+            p.type.types.insert(0, INPUT_FILE)
     params.sort(key=operator.attrgetter("type.required"), reverse=True)
     return params
 
@@ -118,7 +130,7 @@ def main_parse():
                 if child.name == "table":
                     object_.params = parse_params(child)
                 if child.name == "ul":
-                    object_.sub_objects = [li.a[HREF] for li in child.findAll("li")]
+                    object_.childs = [li.a[HREF] for li in child.findAll("li") if li.a]
             else:
                 group.descriptions.append(child.text)
     return api
@@ -148,8 +160,37 @@ def post_parsing(api: Api):
                         o.response.types[i] = api.get(rt)
 
 
+def parse_enums(api: Api):
+    for o in api.objects:
+        if not o.is_schema:
+            continue
+        for p in o.params:
+            text = p.description.text
+            if p.types != ["str"] or not ENUM_PATTERN.search(text):
+                continue
+            values = list(dict.fromkeys(ENUM_VALUE_PATTERN.findall(text)))
+            if len(values) < 2:
+                continue
+            for enum in api.enums:
+                if list(enum.enum.values()) == values:
+                    break
+            else:
+                enum = ApiEnum(
+                    name=o.camel + inflection.camelize(p.name),
+                    obj=o.name,
+                    param=p.name,
+                    desc=text,
+                    enum={
+                        re.sub(r"\W", "_", v).upper(): v for v in values
+                    },
+                )
+                api.enums.append(enum)
+            p.type.types = [enum.name]
+
+
 def parse_api():
     api = main_parse()
     api.indexing()
     post_parsing(api)
+    parse_enums(api)
     return api
@@ -12,5 +12,7 @@ BOT_API_HTML = CACHE_DIR / "bot_api.html"
 BOT_SCHEMAS_DIR = BOT / "schemas"
 BOT_PATHS_DIR = BOT / "paths"
 BOT_ENUMS_DIR = BOT / "enums"
+BOT_LAZY = BOT / "lazy.py"
+BOT_CLIENT = BOT / "client.py"
 BOT_GEN_DIR = GEN_DIR / "bot"
 BOT_CONFIG_DIR = GEN_DIR / "config"
@@ -1,9 +1,73 @@
+import dataclasses
+import enum
 import msgspec
 import typing
 
 
 field = msgspec.field
 T = typing.TypeVar("T")
+JSON_HEADERS = {"Content-Type": "application/json"}
+Handler = typing.Callable[[typing.Any], typing.Awaitable[typing.Any]]
+
+
+@dataclasses.dataclass
+class Request:
+    url: str
+    content: typing.Union[bytes, typing.AsyncIterable[bytes], None] = None
+    headers: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+class TelegramError(Exception):
+    def __init__(
+        self,
+        description: str,
+        error_code: int,
+        parameters: typing.Any = None,
+    ) -> None:
+        super().__init__(f"[{error_code}] {description}")
+        self.description = description
+        self.error_code = error_code
+        self.parameters = parameters
+
 
 class Schema(msgspec.Struct): ...
-class Path(msgspec.Struct, typing.Generic[T]): ...
+
+
+class Enum(str, enum.Enum):
+    """
+    Base of the string enums of schema fields. Decoded values are the
+    shared members, so they compare by identity, and they still behave
+    as the plain strings they are. A value missing from the enum (added
+    by a newer Bot API) becomes a new member instead of an error.
+    """
+
+    __hash__ = str.__hash__
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+    @classmethod
+    def _missing_(cls, value: typing.Any) -> typing.Any:
+        if not isinstance(value, str):
+            return None
+        member = str.__new__(cls, value)
+        member._name_ = value.upper()
+        member._value_ = value
+        return cls._value2member_map_.setdefault(value, member)
+
+
+class Wrapper:
+    """Base of handlers passing updates on to another `handler`."""
+
+    handler: Handler
+
+    @property
+    def allowed_updates(self) -> typing.Optional[typing.List[str]]:
+        return getattr(self.handler, "allowed_updates", None)
+
+
+class Path(msgspec.Struct, typing.Generic[T]):
+    limited: typing.ClassVar[bool] = False
+    """Sends a message, so counts against the per chat limits"""
+
+    def build_request(self) -> Request: ...
+    def build_result(self, data: typing.Any) -> T: ...
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Iterable, List, Optional
+
+import httpx
+
+from ._base import Path, Request, T, TelegramError
+from .filecache import FileCache
+from .ratelimit import RateLimiter
+
+
+API_URL = "https://api.telegram.org"
+
+
+class BaseClient:
+    """
+    Bot API transport. Every call goes through a single pool of
+    keep-alive HTTP/1.1 connections to the Bot API server, so TLS
+    handshakes are paid once per connection instead of once per request.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: str = API_URL,
+        pool_size: int = 100,
+        timeout: float = 60.0,
+        limiter: Optional[RateLimiter] = None,
+        file_cache: Optional[FileCache] = None,
+    ) -> None:
+        self.token = token
+        self.limiter = limiter
+        self.file_cache = file_cache
+        self.pool_size = pool_size
+        self.http = httpx.AsyncClient(
+            base_url=f"{base_url}/bot{token}",
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+            timeout=timeout,
+        )
+
+    async def __call__(self, path: Path[T]) -> T:
+        chat_id = getattr(path, "chat_id", None)
+        if self.limiter is None or not path.limited or chat_id is None:
+            return await self.fetch(path)
+        for _ in range(self.limiter.retries):
+            await self.limiter.acquire(chat_id)
+            try:
+                return await self.fetch(path)
+            except TelegramError as e:
+                if e.parameters is None or not e.parameters.retry_after:
+                    raise
+                self.limiter.pause(e.parameters.retry_after)
+        await self.limiter.acquire(chat_id)
+        return await self.fetch(path)
+
+    async def fetch(self, path: Path[T]) -> T:
+        uploads = None
+        if self.file_cache is not None:
+            path, uploads = await self.file_cache.resolve(path)
+        if not uploads:
+            return path.build_result(await self.send(path.build_request()))
+        try:
+            result = path.build_result(await self.send(path.build_request()))
+            await self.file_cache.update(uploads, result)
+        finally:
+            self.file_cache.release(uploads)
+        return result
+
+    async def send(
+        self,
+        request: Request,
+        *,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+    ) -> bytes:
+        """Post a built request and return the raw response body."""
+        response = await self.http.post(
+            request.url,
+            content=request.content,
+            headers=request.headers,
+            timeout=timeout,
+        )
+        return response.content
+
+    async def gather(
+        self,
+        paths: Iterable[Path[Any]],
+        *,
+        max_in_flight: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Call `paths` concurrently with at most `max_in_flight` requests
+        (the pool size by default) on the wire at once and return their
+        results in the order of `paths`. With `return_exceptions` a failed
+        call puts its exception in the results instead of cancelling the
+        remaining calls.
+        """
+        paths = list(paths)
+        results: List[Any] = [None] * len(paths)
+        queue = iter(enumerate(paths))
+
+        async def worker() -> None:
+            for i, path in queue:
+                try:
+                    results[i] = await self(path)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[i] = e
+
+        window = min(max_in_flight or self.pool_size, len(paths))
+        workers = [asyncio.ensure_future(worker()) for _ in range(window)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+        return results
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def __aenter__(self) -> BaseClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
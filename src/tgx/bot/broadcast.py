@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Any, Generic, Optional, Union
+
+import msgspec
+
+from ._base import JSON_HEADERS, Path, Request, T, field
+from .codec import Buffer, encode
+
+
+MARKER = "tgx:template:chat_id"
+MARKER_FIELD = f'"chat_id":"{MARKER}"'.encode()
+
+
+class Template(Generic[T]):
+    """
+    Request of `path` to be sent to many chats. The parameters other than
+    `chat_id` and `message_thread_id` are encoded once, the request for a
+    recipient is built by splicing its ids into those bytes:
+
+        template = Template(SendMessage(chat_id=0, text="Hello"))
+        await client.gather(template(chat_id) for chat_id in chat_ids)
+    """
+
+    def __init__(self, path: Path[T]) -> None:
+        if "chat_id" not in path.__struct_fields__:
+            raise ValueError(f"{type(path).__name__} has no chat_id")
+        self.path = path
+        self.threads = "message_thread_id" in path.__struct_fields__
+        changes: Any = {"chat_id": MARKER}
+        if self.threads:
+            changes["message_thread_id"] = None
+        request = msgspec.structs.replace(path, **changes).build_request()
+        if not isinstance(request.content, bytes):
+            raise ValueError("Templates of requests with files are unsupported")
+        self.url = request.url
+        body = request.content
+        start = body.index(MARKER_FIELD)
+        head = body[1:start].rstrip(b",")
+        tail = body[start + len(MARKER_FIELD):-1].lstrip(b",")
+        rest = b",".join(part for part in (head, tail) if part)
+        self.suffix = b"," + rest + b"}" if rest else b"}"
+
+    def body(
+        self,
+        chat_id: Union[int, str],
+        message_thread_id: Optional[int] = None,
+    ) -> bytes:
+        """Encoded parameters for a recipient."""
+        if isinstance(chat_id, int):
+            parts = [b'{"chat_id":', str(chat_id).encode()]
+        else:
+            parts = [b'{"chat_id":', encode(chat_id)]
+        if message_thread_id is not None:
+            if not self.threads:
+                raise ValueError(f"{self.url} has no message_thread_id")
+            parts.append(b',"message_thread_id":')
+            parts.append(str(message_thread_id).encode())
+        parts.append(self.suffix)
+        return b"".join(parts)
+
+    def __call__(
+        self,
+        chat_id: Union[int, str],
+        message_thread_id: Optional[int] = None,
+    ) -> Prepared[T]:
+        return Prepared(
+            template=self,
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        )
+
+
+class Prepared(
+    Path[T],
+    kw_only=True
+):
+    """Request of a Template for a recipient, called like any Path."""
+    template: Any = field()
+    chat_id: Union[int, str] = field()
+    message_thread_id: Optional[int] = field(default=None)
+
+    @property
+    def limited(self) -> bool:  # type: ignore[override]
+        return self.template.path.limited
+
+    def build_request(self) -> Request:
+        return Request(
+            url=self.template.url,
+            content=self.template.body(self.chat_id, self.message_thread_id),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> T:
+        return self.template.path.build_result(data)
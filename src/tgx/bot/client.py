@@ -0,0 +1,2826 @@
+from __future__ import annotations
+from typing import List, Optional, Union
+
+from msgspec import Raw
+
+from ._client import BaseClient
+from .paths import (
+    GetUpdates,
+    SetWebhook,
+    DeleteWebhook,
+    GetWebhookInfo,
+    GetMe,
+    LogOut,
+    Close,
+    SendMessage,
+    ForwardMessage,
+    CopyMessage,
+    SendPhoto,
+    SendAudio,
+    SendDocument,
+    SendVideo,
+    SendAnimation,
+    SendVoice,
+    SendVideoNote,
+    SendMediaGroup,
+    SendLocation,
+    SendVenue,
+    SendContact,
+    SendPoll,
+    SendDice,
+    SendChatAction,
+    GetUserProfilePhotos,
+    GetFile,
+    BanChatMember,
+    UnbanChatMember,
+    RestrictChatMember,
+    PromoteChatMember,
+    SetChatAdministratorCustomTitle,
+    BanChatSenderChat,
+    UnbanChatSenderChat,
+    SetChatPermissions,
+    ExportChatInviteLink,
+    CreateChatInviteLink,
+    EditChatInviteLink,
+    RevokeChatInviteLink,
+    ApproveChatJoinRequest,
+    DeclineChatJoinRequest,
+    SetChatPhoto,
+    DeleteChatPhoto,
+    SetChatTitle,
+    SetChatDescription,
+    PinChatMessage,
+    UnpinChatMessage,
+    UnpinAllChatMessages,
+    LeaveChat,
+    GetChat,
+    GetChatAdministrators,
+    GetChatMemberCount,
+    GetChatMember,
+    SetChatStickerSet,
+    DeleteChatStickerSet,
+    GetForumTopicIconStickers,
+    CreateForumTopic,
+    EditForumTopic,
+    CloseForumTopic,
+    ReopenForumTopic,
+    DeleteForumTopic,
+    UnpinAllForumTopicMessages,
+    EditGeneralForumTopic,
+    CloseGeneralForumTopic,
+    ReopenGeneralForumTopic,
+    HideGeneralForumTopic,
+    UnhideGeneralForumTopic,
+    UnpinAllGeneralForumTopicMessages,
+    AnswerCallbackQuery,
+    SetMyCommands,
+    DeleteMyCommands,
+    GetMyCommands,
+    SetMyName,
+    GetMyName,
+    SetMyDescription,
+    GetMyDescription,
+    SetMyShortDescription,
+    GetMyShortDescription,
+    SetChatMenuButton,
+    GetChatMenuButton,
+    SetMyDefaultAdministratorRights,
+    GetMyDefaultAdministratorRights,
+    EditMessageText,
+    EditMessageCaption,
+    EditMessageMedia,
+    EditMessageLiveLocation,
+    StopMessageLiveLocation,
+    EditMessageReplyMarkup,
+    StopPoll,
+    DeleteMessage,
+    SendSticker,
+    GetStickerSet,
+    GetCustomEmojiStickers,
+    UploadStickerFile,
+    CreateNewStickerSet,
+    AddStickerToSet,
+    SetStickerPositionInSet,
+    DeleteStickerFromSet,
+    SetStickerEmojiList,
+    SetStickerKeywords,
+    SetStickerMaskPosition,
+    SetStickerSetTitle,
+    SetStickerSetThumbnail,
+    SetCustomEmojiStickerSetThumbnail,
+    DeleteStickerSet,
+    AnswerInlineQuery,
+    AnswerWebAppQuery,
+    SendInvoice,
+    CreateInvoiceLink,
+    AnswerShippingQuery,
+    AnswerPreCheckoutQuery,
+    SetPassportDataErrors,
+    SendGame,
+    SetGameScore,
+    GetGameHighScores,
+)
+from .schemas import (
+    BotCommand,
+    BotCommandScope,
+    BotDescription,
+    BotName,
+    BotShortDescription,
+    Chat,
+    ChatAdministratorRights,
+    ChatInviteLink,
+    ChatMember,
+    ChatPermissions,
+    File,
+    ForceReply,
+    ForumTopic,
+    GameHighScore,
+    InlineKeyboardMarkup,
+    InlineQueryResult,
+    InlineQueryResultsButton,
+    InputFile,
+    InputMedia,
+    InputMediaAudio,
+    InputMediaDocument,
+    InputMediaPhoto,
+    InputMediaVideo,
+    InputSticker,
+    LabeledPrice,
+    MaskPosition,
+    MenuButton,
+    Message,
+    MessageEntity,
+    MessageId,
+    PassportElementError,
+    Poll,
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+    SentWebAppMessage,
+    ShippingOption,
+    Sticker,
+    StickerSet,
+    Update,
+    User,
+    UserProfilePhotos,
+    WebhookInfo,
+)
+
+
+class Client(BaseClient):
+    """
+    Bot API client with a coroutine method per Bot API method.
+    """
+
+
+    async def get_updates(
+        self,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[int] = None,
+        allowed_updates: Optional[List[str]] = None,
+    ) -> List[Update]:
+        """
+        Use this method to receive incoming updates using long polling ([w
+        iki](https://en.wikipedia.org/wiki/Push_technology#Long_polling)).
+        Returns an Array of [Update](#update) objects.
+        """
+        return await self(GetUpdates(
+            offset=offset,
+            limit=limit,
+            timeout=timeout,
+            allowed_updates=allowed_updates,
+        ))
+
+
+    async def set_webhook(
+        self,
+        *,
+        url: str,
+        certificate: Optional[InputFile] = None,
+        ip_address: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        allowed_updates: Optional[List[str]] = None,
+        drop_pending_updates: Optional[bool] = None,
+        secret_token: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to specify a URL and receive incoming updates via
+        an outgoing webhook. Whenever there is an update for the bot, we
+        will send an HTTPS POST request to the specified URL, containing a
+        JSON-serialized [Update](#update). In case of an unsuccessful
+        request, we will give up after a reasonable amount of attempts.
+        Returns *True* on success.
+        
+        If you'd like to make sure that the webhook was set by you, you
+        can specify secret data in the parameter *secret\_token*. If
+        specified, the request will contain a header “X-Telegram-Bot-Api-
+        Secret-Token” with the secret token as content.
+        """
+        return await self(SetWebhook(
+            url=url,
+            certificate=certificate,
+            ip_address=ip_address,
+            max_connections=max_connections,
+            allowed_updates=allowed_updates,
+            drop_pending_updates=drop_pending_updates,
+            secret_token=secret_token,
+        ))
+
+
+    async def delete_webhook(
+        self,
+        *,
+        drop_pending_updates: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to remove webhook integration if you decide to
+        switch back to [getUpdates](#getupdates). Returns *True* on
+        success.
+        """
+        return await self(DeleteWebhook(
+            drop_pending_updates=drop_pending_updates,
+        ))
+
+
+    async def get_webhook_info(
+        self,
+    ) -> WebhookInfo:
+        """
+        Use this method to get current webhook status. Requires no
+        parameters. On success, returns a [WebhookInfo](#webhookinfo)
+        object. If the bot is using [getUpdates](#getupdates), will return
+        an object with the *url* field empty.
+        """
+        return await self(GetWebhookInfo(
+        ))
+
+
+    async def get_me(
+        self,
+    ) -> User:
+        """
+        A simple method for testing your bot's authentication token.
+        Requires no parameters. Returns basic information about the bot in
+        form of a [User](#user) object.
+        """
+        return await self(GetMe(
+        ))
+
+
+    async def log_out(
+        self,
+    ) -> bool:
+        """
+        Use this method to log out from the cloud Bot API server before
+        launching the bot locally. You **must** log out the bot before
+        running it locally, otherwise there is no guarantee that the bot
+        will receive updates. After a successful call, you can immediately
+        log in on a local server, but will not be able to log in back to
+        the cloud Bot API server for 10 minutes. Returns *True* on
+        success. Requires no parameters.
+        """
+        return await self(LogOut(
+        ))
+
+
+    async def close(
+        self,
+    ) -> bool:
+        """
+        Use this method to close the bot instance before moving it from
+        one local server to another. You need to delete the webhook before
+        calling this method to ensure that the bot isn't launched again
+        after server restart. The method will return error 429 in the
+        first 10 minutes after the bot is launched. Returns *True* on
+        success. Requires no parameters.
+        """
+        return await self(Close(
+        ))
+
+
+    async def send_message(
+        self,
+        *,
+        chat_id: Union[int, str],
+        text: str,
+        message_thread_id: Optional[int] = None,
+        parse_mode: Optional[str] = None,
+        entities: Optional[List[MessageEntity]] = None,
+        disable_web_page_preview: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send text messages. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendMessage(
+            chat_id=chat_id,
+            text=text,
+            message_thread_id=message_thread_id,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_web_page_preview=disable_web_page_preview,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def forward_message(
+        self,
+        *,
+        chat_id: Union[int, str],
+        from_chat_id: Union[int, str],
+        message_id: int,
+        message_thread_id: Optional[int] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+    ) -> Message:
+        """
+        Use this method to forward messages of any kind. Service messages
+        can't be forwarded. On success, the sent [Message](#message) is
+        returned.
+        """
+        return await self(ForwardMessage(
+            chat_id=chat_id,
+            from_chat_id=from_chat_id,
+            message_id=message_id,
+            message_thread_id=message_thread_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+        ))
+
+
+    async def copy_message(
+        self,
+        *,
+        chat_id: Union[int, str],
+        from_chat_id: Union[int, str],
+        message_id: int,
+        message_thread_id: Optional[int] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> MessageId:
+        """
+        Use this method to copy messages of any kind. Service messages and
+        invoice messages can't be copied. A quiz [poll](#poll) can be
+        copied only if the value of the field *correct\_option\_id* is
+        known to the bot. The method is analogous to the method
+        [forwardMessage](#forwardmessage), but the copied message doesn't
+        have a link to the original message. Returns the
+        [MessageId](#messageid) of the sent message on success.
+        """
+        return await self(CopyMessage(
+            chat_id=chat_id,
+            from_chat_id=from_chat_id,
+            message_id=message_id,
+            message_thread_id=message_thread_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_photo(
+        self,
+        *,
+        chat_id: Union[int, str],
+        photo: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        has_spoiler: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send photos. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendPhoto(
+            chat_id=chat_id,
+            photo=photo,
+            message_thread_id=message_thread_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            has_spoiler=has_spoiler,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_audio(
+        self,
+        *,
+        chat_id: Union[int, str],
+        audio: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        duration: Optional[int] = None,
+        performer: Optional[str] = None,
+        title: Optional[str] = None,
+        thumbnail: Union[InputFile, str, None] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send audio files, if you want Telegram clients
+        to display them in the music player. Your audio must be in the
+        .MP3 or .M4A format. On success, the sent [Message](#message) is
+        returned. Bots can currently send audio files of up to 50 MB in
+        size, this limit may be changed in the future.
+        
+        For sending voice messages, use the [sendVoice](#sendvoice) method
+        instead.
+        """
+        return await self(SendAudio(
+            chat_id=chat_id,
+            audio=audio,
+            message_thread_id=message_thread_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            duration=duration,
+            performer=performer,
+            title=title,
+            thumbnail=thumbnail,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_document(
+        self,
+        *,
+        chat_id: Union[int, str],
+        document: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        thumbnail: Union[InputFile, str, None] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        disable_content_type_detection: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send general files. On success, the sent
+        [Message](#message) is returned. Bots can currently send files of
+        any type of up to 50 MB in size, this limit may be changed in the
+        future.
+        """
+        return await self(SendDocument(
+            chat_id=chat_id,
+            document=document,
+            message_thread_id=message_thread_id,
+            thumbnail=thumbnail,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            disable_content_type_detection=disable_content_type_detection,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_video(
+        self,
+        *,
+        chat_id: Union[int, str],
+        video: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        duration: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        thumbnail: Union[InputFile, str, None] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        has_spoiler: Optional[bool] = None,
+        supports_streaming: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send video files, Telegram clients support
+        MPEG4 videos (other formats may be sent as [Document](#document)).
+        On success, the sent [Message](#message) is returned. Bots can
+        currently send video files of up to 50 MB in size, this limit may
+        be changed in the future.
+        """
+        return await self(SendVideo(
+            chat_id=chat_id,
+            video=video,
+            message_thread_id=message_thread_id,
+            duration=duration,
+            width=width,
+            height=height,
+            thumbnail=thumbnail,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            has_spoiler=has_spoiler,
+            supports_streaming=supports_streaming,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_animation(
+        self,
+        *,
+        chat_id: Union[int, str],
+        animation: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        duration: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        thumbnail: Union[InputFile, str, None] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        has_spoiler: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send animation files (GIF or H.264/MPEG-4 AVC
+        video without sound). On success, the sent [Message](#message) is
+        returned. Bots can currently send animation files of up to 50 MB
+        in size, this limit may be changed in the future.
+        """
+        return await self(SendAnimation(
+            chat_id=chat_id,
+            animation=animation,
+            message_thread_id=message_thread_id,
+            duration=duration,
+            width=width,
+            height=height,
+            thumbnail=thumbnail,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            has_spoiler=has_spoiler,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_voice(
+        self,
+        *,
+        chat_id: Union[int, str],
+        voice: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        duration: Optional[int] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send audio files, if you want Telegram clients
+        to display the file as a playable voice message. For this to work,
+        your audio must be in an .OGG file encoded with OPUS (other
+        formats may be sent as [Audio](#audio) or [Document](#document)).
+        On success, the sent [Message](#message) is returned. Bots can
+        currently send voice messages of up to 50 MB in size, this limit
+        may be changed in the future.
+        """
+        return await self(SendVoice(
+            chat_id=chat_id,
+            voice=voice,
+            message_thread_id=message_thread_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            duration=duration,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_video_note(
+        self,
+        *,
+        chat_id: Union[int, str],
+        video_note: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        duration: Optional[int] = None,
+        length: Optional[int] = None,
+        thumbnail: Union[InputFile, str, None] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        As of [v.4.0](https://telegram.org/blog/video-messages-and-
+        telescope), Telegram clients support rounded square MPEG4 videos
+        of up to 1 minute long. Use this method to send video messages. On
+        success, the sent [Message](#message) is returned.
+        """
+        return await self(SendVideoNote(
+            chat_id=chat_id,
+            video_note=video_note,
+            message_thread_id=message_thread_id,
+            duration=duration,
+            length=length,
+            thumbnail=thumbnail,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_media_group(
+        self,
+        *,
+        chat_id: Union[int, str],
+        media: List[Union[InputMediaAudio, InputMediaDocument, InputMediaPhoto, InputMediaVideo]],
+        message_thread_id: Optional[int] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+    ) -> List[Message]:
+        """
+        Use this method to send a group of photos, videos, documents or
+        audios as an album. Documents and audio files can be only grouped
+        in an album with messages of the same type. On success, an array
+        of [Messages](#message) that were sent is returned.
+        """
+        return await self(SendMediaGroup(
+            chat_id=chat_id,
+            media=media,
+            message_thread_id=message_thread_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+        ))
+
+
+    async def send_location(
+        self,
+        *,
+        chat_id: Union[int, str],
+        latitude: float,
+        longitude: float,
+        message_thread_id: Optional[int] = None,
+        horizontal_accuracy: Optional[float] = None,
+        live_period: Optional[int] = None,
+        heading: Optional[int] = None,
+        proximity_alert_radius: Optional[int] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send point on the map. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendLocation(
+            chat_id=chat_id,
+            latitude=latitude,
+            longitude=longitude,
+            message_thread_id=message_thread_id,
+            horizontal_accuracy=horizontal_accuracy,
+            live_period=live_period,
+            heading=heading,
+            proximity_alert_radius=proximity_alert_radius,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_venue(
+        self,
+        *,
+        chat_id: Union[int, str],
+        latitude: float,
+        longitude: float,
+        title: str,
+        address: str,
+        message_thread_id: Optional[int] = None,
+        foursquare_id: Optional[str] = None,
+        foursquare_type: Optional[str] = None,
+        google_place_id: Optional[str] = None,
+        google_place_type: Optional[str] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send information about a venue. On success, the
+        sent [Message](#message) is returned.
+        """
+        return await self(SendVenue(
+            chat_id=chat_id,
+            latitude=latitude,
+            longitude=longitude,
+            title=title,
+            address=address,
+            message_thread_id=message_thread_id,
+            foursquare_id=foursquare_id,
+            foursquare_type=foursquare_type,
+            google_place_id=google_place_id,
+            google_place_type=google_place_type,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_contact(
+        self,
+        *,
+        chat_id: Union[int, str],
+        phone_number: str,
+        first_name: str,
+        message_thread_id: Optional[int] = None,
+        last_name: Optional[str] = None,
+        vcard: Optional[str] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send phone contacts. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendContact(
+            chat_id=chat_id,
+            phone_number=phone_number,
+            first_name=first_name,
+            message_thread_id=message_thread_id,
+            last_name=last_name,
+            vcard=vcard,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_poll(
+        self,
+        *,
+        chat_id: Union[int, str],
+        question: str,
+        options: List[str],
+        message_thread_id: Optional[int] = None,
+        is_anonymous: Optional[bool] = None,
+        type: Optional[str] = None,
+        allows_multiple_answers: Optional[bool] = None,
+        correct_option_id: Optional[int] = None,
+        explanation: Optional[str] = None,
+        explanation_parse_mode: Optional[str] = None,
+        explanation_entities: Optional[List[MessageEntity]] = None,
+        open_period: Optional[int] = None,
+        close_date: Optional[int] = None,
+        is_closed: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send a native poll. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendPoll(
+            chat_id=chat_id,
+            question=question,
+            options=options,
+            message_thread_id=message_thread_id,
+            is_anonymous=is_anonymous,
+            type=type,
+            allows_multiple_answers=allows_multiple_answers,
+            correct_option_id=correct_option_id,
+            explanation=explanation,
+            explanation_parse_mode=explanation_parse_mode,
+            explanation_entities=explanation_entities,
+            open_period=open_period,
+            close_date=close_date,
+            is_closed=is_closed,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_dice(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_thread_id: Optional[int] = None,
+        emoji: Optional[str] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send an animated emoji that will display a
+        random value. On success, the sent [Message](#message) is
+        returned.
+        """
+        return await self(SendDice(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+            emoji=emoji,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def send_chat_action(
+        self,
+        *,
+        chat_id: Union[int, str],
+        action: str,
+        message_thread_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Use this method when you need to tell the user that something is
+        happening on the bot's side. The status is set for 5 seconds or
+        less (when a message arrives from your bot, Telegram clients clear
+        its typing status). Returns *True* on success.
+        
+        We only recommend using this method when a response from the bot
+        will take a **noticeable** amount of time to arrive.
+        """
+        return await self(SendChatAction(
+            chat_id=chat_id,
+            action=action,
+            message_thread_id=message_thread_id,
+        ))
+
+
+    async def get_user_profile_photos(
+        self,
+        *,
+        user_id: int,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> UserProfilePhotos:
+        """
+        Use this method to get a list of profile pictures for a user.
+        Returns a [UserProfilePhotos](#userprofilephotos) object.
+        """
+        return await self(GetUserProfilePhotos(
+            user_id=user_id,
+            offset=offset,
+            limit=limit,
+        ))
+
+
+    async def get_file(
+        self,
+        *,
+        file_id: str,
+    ) -> File:
+        """
+        Use this method to get basic information about a file and prepare
+        it for downloading. For the moment, bots can download files of up
+        to 20MB in size. On success, a [File](#file) object is returned.
+        The file can then be downloaded via the link
+        `https://api.telegram.org/file/bot<token>/<file_path>`, where
+        `<file_path>` is taken from the response. It is guaranteed that
+        the link will be valid for at least 1 hour. When the link expires,
+        a new one can be requested by calling [getFile](#getfile) again.
+        
+        **Note:** This function may not preserve the original file name
+        and MIME type. You should save the file's MIME type and name (if
+        available) when the File object is received.
+        """
+        return await self(GetFile(
+            file_id=file_id,
+        ))
+
+
+    async def ban_chat_member(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+        until_date: Optional[int] = None,
+        revoke_messages: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to ban a user in a group, a supergroup or a
+        channel. In the case of supergroups and channels, the user will
+        not be able to return to the chat on their own using invite links,
+        etc., unless [unbanned](#unbanchatmember) first. The bot must be
+        an administrator in the chat for this to work and must have the
+        appropriate administrator rights. Returns *True* on success.
+        """
+        return await self(BanChatMember(
+            chat_id=chat_id,
+            user_id=user_id,
+            until_date=until_date,
+            revoke_messages=revoke_messages,
+        ))
+
+
+    async def unban_chat_member(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+        only_if_banned: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to unban a previously banned user in a supergroup
+        or channel. The user will **not** return to the group or channel
+        automatically, but will be able to join via link, etc. The bot
+        must be an administrator for this to work. By default, this method
+        guarantees that after the call the user is not a member of the
+        chat, but will be able to join it. So if the user is a member of
+        the chat they will also be **removed** from the chat. If you don't
+        want this, use the parameter *only\_if\_banned*. Returns *True* on
+        success.
+        """
+        return await self(UnbanChatMember(
+            chat_id=chat_id,
+            user_id=user_id,
+            only_if_banned=only_if_banned,
+        ))
+
+
+    async def restrict_chat_member(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+        permissions: ChatPermissions,
+        use_independent_chat_permissions: Optional[bool] = None,
+        until_date: Optional[int] = None,
+    ) -> bool:
+        """
+        Use this method to restrict a user in a supergroup. The bot must
+        be an administrator in the supergroup for this to work and must
+        have the appropriate administrator rights. Pass *True* for all
+        permissions to lift restrictions from a user. Returns *True* on
+        success.
+        """
+        return await self(RestrictChatMember(
+            chat_id=chat_id,
+            user_id=user_id,
+            permissions=permissions,
+            use_independent_chat_permissions=use_independent_chat_permissions,
+            until_date=until_date,
+        ))
+
+
+    async def promote_chat_member(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+        is_anonymous: Optional[bool] = None,
+        can_manage_chat: Optional[bool] = None,
+        can_post_messages: Optional[bool] = None,
+        can_edit_messages: Optional[bool] = None,
+        can_delete_messages: Optional[bool] = None,
+        can_manage_video_chats: Optional[bool] = None,
+        can_restrict_members: Optional[bool] = None,
+        can_promote_members: Optional[bool] = None,
+        can_change_info: Optional[bool] = None,
+        can_invite_users: Optional[bool] = None,
+        can_pin_messages: Optional[bool] = None,
+        can_manage_topics: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to promote or demote a user in a supergroup or a
+        channel. The bot must be an administrator in the chat for this to
+        work and must have the appropriate administrator rights. Pass
+        *False* for all boolean parameters to demote a user. Returns
+        *True* on success.
+        """
+        return await self(PromoteChatMember(
+            chat_id=chat_id,
+            user_id=user_id,
+            is_anonymous=is_anonymous,
+            can_manage_chat=can_manage_chat,
+            can_post_messages=can_post_messages,
+            can_edit_messages=can_edit_messages,
+            can_delete_messages=can_delete_messages,
+            can_manage_video_chats=can_manage_video_chats,
+            can_restrict_members=can_restrict_members,
+            can_promote_members=can_promote_members,
+            can_change_info=can_change_info,
+            can_invite_users=can_invite_users,
+            can_pin_messages=can_pin_messages,
+            can_manage_topics=can_manage_topics,
+        ))
+
+
+    async def set_chat_administrator_custom_title(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+        custom_title: str,
+    ) -> bool:
+        """
+        Use this method to set a custom title for an administrator in a
+        supergroup promoted by the bot. Returns *True* on success.
+        """
+        return await self(SetChatAdministratorCustomTitle(
+            chat_id=chat_id,
+            user_id=user_id,
+            custom_title=custom_title,
+        ))
+
+
+    async def ban_chat_sender_chat(
+        self,
+        *,
+        chat_id: Union[int, str],
+        sender_chat_id: int,
+    ) -> bool:
+        """
+        Use this method to ban a channel chat in a supergroup or a
+        channel. Until the chat is [unbanned](#unbanchatsenderchat), the
+        owner of the banned chat won't be able to send messages on behalf
+        of **any of their channels**. The bot must be an administrator in
+        the supergroup or channel for this to work and must have the
+        appropriate administrator rights. Returns *True* on success.
+        """
+        return await self(BanChatSenderChat(
+            chat_id=chat_id,
+            sender_chat_id=sender_chat_id,
+        ))
+
+
+    async def unban_chat_sender_chat(
+        self,
+        *,
+        chat_id: Union[int, str],
+        sender_chat_id: int,
+    ) -> bool:
+        """
+        Use this method to unban a previously banned channel chat in a
+        supergroup or channel. The bot must be an administrator for this
+        to work and must have the appropriate administrator rights.
+        Returns *True* on success.
+        """
+        return await self(UnbanChatSenderChat(
+            chat_id=chat_id,
+            sender_chat_id=sender_chat_id,
+        ))
+
+
+    async def set_chat_permissions(
+        self,
+        *,
+        chat_id: Union[int, str],
+        permissions: ChatPermissions,
+        use_independent_chat_permissions: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to set default chat permissions for all members.
+        The bot must be an administrator in the group or a supergroup for
+        this to work and must have the *can\_restrict\_members*
+        administrator rights. Returns *True* on success.
+        """
+        return await self(SetChatPermissions(
+            chat_id=chat_id,
+            permissions=permissions,
+            use_independent_chat_permissions=use_independent_chat_permissions,
+        ))
+
+
+    async def export_chat_invite_link(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> str:
+        """
+        Use this method to generate a new primary invite link for a chat;
+        any previously generated primary link is revoked. The bot must be
+        an administrator in the chat for this to work and must have the
+        appropriate administrator rights. Returns the new invite link as
+        *String* on success.
+        """
+        return await self(ExportChatInviteLink(
+            chat_id=chat_id,
+        ))
+
+
+    async def create_chat_invite_link(
+        self,
+        *,
+        chat_id: Union[int, str],
+        name: Optional[str] = None,
+        expire_date: Optional[int] = None,
+        member_limit: Optional[int] = None,
+        creates_join_request: Optional[bool] = None,
+    ) -> ChatInviteLink:
+        """
+        Use this method to create an additional invite link for a chat.
+        The bot must be an administrator in the chat for this to work and
+        must have the appropriate administrator rights. The link can be
+        revoked using the method
+        [revokeChatInviteLink](#revokechatinvitelink). Returns the new
+        invite link as [ChatInviteLink](#chatinvitelink) object.
+        """
+        return await self(CreateChatInviteLink(
+            chat_id=chat_id,
+            name=name,
+            expire_date=expire_date,
+            member_limit=member_limit,
+            creates_join_request=creates_join_request,
+        ))
+
+
+    async def edit_chat_invite_link(
+        self,
+        *,
+        chat_id: Union[int, str],
+        invite_link: str,
+        name: Optional[str] = None,
+        expire_date: Optional[int] = None,
+        member_limit: Optional[int] = None,
+        creates_join_request: Optional[bool] = None,
+    ) -> ChatInviteLink:
+        """
+        Use this method to edit a non-primary invite link created by the
+        bot. The bot must be an administrator in the chat for this to work
+        and must have the appropriate administrator rights. Returns the
+        edited invite link as a [ChatInviteLink](#chatinvitelink) object.
+        """
+        return await self(EditChatInviteLink(
+            chat_id=chat_id,
+            invite_link=invite_link,
+            name=name,
+            expire_date=expire_date,
+            member_limit=member_limit,
+            creates_join_request=creates_join_request,
+        ))
+
+
+    async def revoke_chat_invite_link(
+        self,
+        *,
+        chat_id: Union[int, str],
+        invite_link: str,
+    ) -> ChatInviteLink:
+        """
+        Use this method to revoke an invite link created by the bot. If
+        the primary link is revoked, a new link is automatically
+        generated. The bot must be an administrator in the chat for this
+        to work and must have the appropriate administrator rights.
+        Returns the revoked invite link as
+        [ChatInviteLink](#chatinvitelink) object.
+        """
+        return await self(RevokeChatInviteLink(
+            chat_id=chat_id,
+            invite_link=invite_link,
+        ))
+
+
+    async def approve_chat_join_request(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+    ) -> bool:
+        """
+        Use this method to approve a chat join request. The bot must be an
+        administrator in the chat for this to work and must have the
+        *can\_invite\_users* administrator right. Returns *True* on
+        success.
+        """
+        return await self(ApproveChatJoinRequest(
+            chat_id=chat_id,
+            user_id=user_id,
+        ))
+
+
+    async def decline_chat_join_request(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+    ) -> bool:
+        """
+        Use this method to decline a chat join request. The bot must be an
+        administrator in the chat for this to work and must have the
+        *can\_invite\_users* administrator right. Returns *True* on
+        success.
+        """
+        return await self(DeclineChatJoinRequest(
+            chat_id=chat_id,
+            user_id=user_id,
+        ))
+
+
+    async def set_chat_photo(
+        self,
+        *,
+        chat_id: Union[int, str],
+        photo: InputFile,
+    ) -> bool:
+        """
+        Use this method to set a new profile photo for the chat. Photos
+        can't be changed for private chats. The bot must be an
+        administrator in the chat for this to work and must have the
+        appropriate administrator rights. Returns *True* on success.
+        """
+        return await self(SetChatPhoto(
+            chat_id=chat_id,
+            photo=photo,
+        ))
+
+
+    async def delete_chat_photo(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to delete a chat photo. Photos can't be changed
+        for private chats. The bot must be an administrator in the chat
+        for this to work and must have the appropriate administrator
+        rights. Returns *True* on success.
+        """
+        return await self(DeleteChatPhoto(
+            chat_id=chat_id,
+        ))
+
+
+    async def set_chat_title(
+        self,
+        *,
+        chat_id: Union[int, str],
+        title: str,
+    ) -> bool:
+        """
+        Use this method to change the title of a chat. Titles can't be
+        changed for private chats. The bot must be an administrator in the
+        chat for this to work and must have the appropriate administrator
+        rights. Returns *True* on success.
+        """
+        return await self(SetChatTitle(
+            chat_id=chat_id,
+            title=title,
+        ))
+
+
+    async def set_chat_description(
+        self,
+        *,
+        chat_id: Union[int, str],
+        description: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to change the description of a group, a supergroup
+        or a channel. The bot must be an administrator in the chat for
+        this to work and must have the appropriate administrator rights.
+        Returns *True* on success.
+        """
+        return await self(SetChatDescription(
+            chat_id=chat_id,
+            description=description,
+        ))
+
+
+    async def pin_chat_message(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_id: int,
+        disable_notification: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to add a message to the list of pinned messages in
+        a chat. If the chat is not a private chat, the bot must be an
+        administrator in the chat for this to work and must have the
+        'can\_pin\_messages' administrator right in a supergroup or
+        'can\_edit\_messages' administrator right in a channel. Returns
+        *True* on success.
+        """
+        return await self(PinChatMessage(
+            chat_id=chat_id,
+            message_id=message_id,
+            disable_notification=disable_notification,
+        ))
+
+
+    async def unpin_chat_message(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Use this method to remove a message from the list of pinned
+        messages in a chat. If the chat is not a private chat, the bot
+        must be an administrator in the chat for this to work and must
+        have the 'can\_pin\_messages' administrator right in a supergroup
+        or 'can\_edit\_messages' administrator right in a channel. Returns
+        *True* on success.
+        """
+        return await self(UnpinChatMessage(
+            chat_id=chat_id,
+            message_id=message_id,
+        ))
+
+
+    async def unpin_all_chat_messages(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to clear the list of pinned messages in a chat. If
+        the chat is not a private chat, the bot must be an administrator
+        in the chat for this to work and must have the
+        'can\_pin\_messages' administrator right in a supergroup or
+        'can\_edit\_messages' administrator right in a channel. Returns
+        *True* on success.
+        """
+        return await self(UnpinAllChatMessages(
+            chat_id=chat_id,
+        ))
+
+
+    async def leave_chat(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method for your bot to leave a group, supergroup or
+        channel. Returns *True* on success.
+        """
+        return await self(LeaveChat(
+            chat_id=chat_id,
+        ))
+
+
+    async def get_chat(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> Chat:
+        """
+        Use this method to get up to date information about the chat
+        (current name of the user for one-on-one conversations, current
+        username of a user, group or channel, etc.). Returns a
+        [Chat](#chat) object on success.
+        """
+        return await self(GetChat(
+            chat_id=chat_id,
+        ))
+
+
+    async def get_chat_administrators(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> List[ChatMember]:
+        """
+        Use this method to get a list of administrators in a chat, which
+        aren't bots. Returns an Array of [ChatMember](#chatmember)
+        objects.
+        """
+        return await self(GetChatAdministrators(
+            chat_id=chat_id,
+        ))
+
+
+    async def get_chat_member_count(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> int:
+        """
+        Use this method to get the number of members in a chat. Returns
+        *Int* on success.
+        """
+        return await self(GetChatMemberCount(
+            chat_id=chat_id,
+        ))
+
+
+    async def get_chat_member(
+        self,
+        *,
+        chat_id: Union[int, str],
+        user_id: int,
+    ) -> ChatMember:
+        """
+        Use this method to get information about a member of a chat. The
+        method is only guaranteed to work for other users if the bot is an
+        administrator in the chat. Returns a [ChatMember](#chatmember)
+        object on success.
+        """
+        return await self(GetChatMember(
+            chat_id=chat_id,
+            user_id=user_id,
+        ))
+
+
+    async def set_chat_sticker_set(
+        self,
+        *,
+        chat_id: Union[int, str],
+        sticker_set_name: str,
+    ) -> bool:
+        """
+        Use this method to set a new group sticker set for a supergroup.
+        The bot must be an administrator in the chat for this to work and
+        must have the appropriate administrator rights. Use the field
+        *can\_set\_sticker\_set* optionally returned in
+        [getChat](#getchat) requests to check if the bot can use this
+        method. Returns *True* on success.
+        """
+        return await self(SetChatStickerSet(
+            chat_id=chat_id,
+            sticker_set_name=sticker_set_name,
+        ))
+
+
+    async def delete_chat_sticker_set(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to delete a group sticker set from a supergroup.
+        The bot must be an administrator in the chat for this to work and
+        must have the appropriate administrator rights. Use the field
+        *can\_set\_sticker\_set* optionally returned in
+        [getChat](#getchat) requests to check if the bot can use this
+        method. Returns *True* on success.
+        """
+        return await self(DeleteChatStickerSet(
+            chat_id=chat_id,
+        ))
+
+
+    async def get_forum_topic_icon_stickers(
+        self,
+    ) -> List[Sticker]:
+        """
+        Use this method to get custom emoji stickers, which can be used as
+        a forum topic icon by any user. Requires no parameters. Returns an
+        Array of [Sticker](#sticker) objects.
+        """
+        return await self(GetForumTopicIconStickers(
+        ))
+
+
+    async def create_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+        name: str,
+        icon_color: Optional[int] = None,
+        icon_custom_emoji_id: Optional[str] = None,
+    ) -> ForumTopic:
+        """
+        Use this method to create a topic in a forum supergroup chat. The
+        bot must be an administrator in the chat for this to work and must
+        have the *can\_manage\_topics* administrator rights. Returns
+        information about the created topic as a [ForumTopic](#forumtopic)
+        object.
+        """
+        return await self(CreateForumTopic(
+            chat_id=chat_id,
+            name=name,
+            icon_color=icon_color,
+            icon_custom_emoji_id=icon_custom_emoji_id,
+        ))
+
+
+    async def edit_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_thread_id: int,
+        name: Optional[str] = None,
+        icon_custom_emoji_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to edit name and icon of a topic in a forum
+        supergroup chat. The bot must be an administrator in the chat for
+        this to work and must have *can\_manage\_topics* administrator
+        rights, unless it is the creator of the topic. Returns *True* on
+        success.
+        """
+        return await self(EditForumTopic(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+            name=name,
+            icon_custom_emoji_id=icon_custom_emoji_id,
+        ))
+
+
+    async def close_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_thread_id: int,
+    ) -> bool:
+        """
+        Use this method to close an open topic in a forum supergroup chat.
+        The bot must be an administrator in the chat for this to work and
+        must have the *can\_manage\_topics* administrator rights, unless
+        it is the creator of the topic. Returns *True* on success.
+        """
+        return await self(CloseForumTopic(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        ))
+
+
+    async def reopen_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_thread_id: int,
+    ) -> bool:
+        """
+        Use this method to reopen a closed topic in a forum supergroup
+        chat. The bot must be an administrator in the chat for this to
+        work and must have the *can\_manage\_topics* administrator rights,
+        unless it is the creator of the topic. Returns *True* on success.
+        """
+        return await self(ReopenForumTopic(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        ))
+
+
+    async def delete_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_thread_id: int,
+    ) -> bool:
+        """
+        Use this method to delete a forum topic along with all its
+        messages in a forum supergroup chat. The bot must be an
+        administrator in the chat for this to work and must have the
+        *can\_delete\_messages* administrator rights. Returns *True* on
+        success.
+        """
+        return await self(DeleteForumTopic(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        ))
+
+
+    async def unpin_all_forum_topic_messages(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_thread_id: int,
+    ) -> bool:
+        """
+        Use this method to clear the list of pinned messages in a forum
+        topic. The bot must be an administrator in the chat for this to
+        work and must have the *can\_pin\_messages* administrator right in
+        the supergroup. Returns *True* on success.
+        """
+        return await self(UnpinAllForumTopicMessages(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        ))
+
+
+    async def edit_general_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+        name: str,
+    ) -> bool:
+        """
+        Use this method to edit the name of the 'General' topic in a forum
+        supergroup chat. The bot must be an administrator in the chat for
+        this to work and must have *can\_manage\_topics* administrator
+        rights. Returns *True* on success.
+        """
+        return await self(EditGeneralForumTopic(
+            chat_id=chat_id,
+            name=name,
+        ))
+
+
+    async def close_general_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to close an open 'General' topic in a forum
+        supergroup chat. The bot must be an administrator in the chat for
+        this to work and must have the *can\_manage\_topics* administrator
+        rights. Returns *True* on success.
+        """
+        return await self(CloseGeneralForumTopic(
+            chat_id=chat_id,
+        ))
+
+
+    async def reopen_general_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to reopen a closed 'General' topic in a forum
+        supergroup chat. The bot must be an administrator in the chat for
+        this to work and must have the *can\_manage\_topics* administrator
+        rights. The topic will be automatically unhidden if it was hidden.
+        Returns *True* on success.
+        """
+        return await self(ReopenGeneralForumTopic(
+            chat_id=chat_id,
+        ))
+
+
+    async def hide_general_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to hide the 'General' topic in a forum supergroup
+        chat. The bot must be an administrator in the chat for this to
+        work and must have the *can\_manage\_topics* administrator rights.
+        The topic will be automatically closed if it was open. Returns
+        *True* on success.
+        """
+        return await self(HideGeneralForumTopic(
+            chat_id=chat_id,
+        ))
+
+
+    async def unhide_general_forum_topic(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to unhide the 'General' topic in a forum
+        supergroup chat. The bot must be an administrator in the chat for
+        this to work and must have the *can\_manage\_topics* administrator
+        rights. Returns *True* on success.
+        """
+        return await self(UnhideGeneralForumTopic(
+            chat_id=chat_id,
+        ))
+
+
+    async def unpin_all_general_forum_topic_messages(
+        self,
+        *,
+        chat_id: Union[int, str],
+    ) -> bool:
+        """
+        Use this method to clear the list of pinned messages in a General
+        forum topic. The bot must be an administrator in the chat for this
+        to work and must have the *can\_pin\_messages* administrator right
+        in the supergroup. Returns *True* on success.
+        """
+        return await self(UnpinAllGeneralForumTopicMessages(
+            chat_id=chat_id,
+        ))
+
+
+    async def answer_callback_query(
+        self,
+        *,
+        callback_query_id: str,
+        text: Optional[str] = None,
+        show_alert: Optional[bool] = None,
+        url: Optional[str] = None,
+        cache_time: Optional[int] = None,
+    ) -> bool:
+        """
+        Use this method to send answers to callback queries sent from
+        [inline keyboards](/bots/features#inline-keyboards). The answer
+        will be displayed to the user as a notification at the top of the
+        chat screen or as an alert. On success, *True* is returned.
+        """
+        return await self(AnswerCallbackQuery(
+            callback_query_id=callback_query_id,
+            text=text,
+            show_alert=show_alert,
+            url=url,
+            cache_time=cache_time,
+        ))
+
+
+    async def set_my_commands(
+        self,
+        *,
+        commands: List[BotCommand],
+        scope: Optional[BotCommandScope] = None,
+        language_code: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to change the list of the bot's commands. See
+        [this manual](/bots/features#commands) for more details about bot
+        commands. Returns *True* on success.
+        """
+        return await self(SetMyCommands(
+            commands=commands,
+            scope=scope,
+            language_code=language_code,
+        ))
+
+
+    async def delete_my_commands(
+        self,
+        *,
+        scope: Optional[BotCommandScope] = None,
+        language_code: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to delete the list of the bot's commands for the
+        given scope and user language. After deletion, [higher level
+        commands](#determining-list-of-commands) will be shown to affected
+        users. Returns *True* on success.
+        """
+        return await self(DeleteMyCommands(
+            scope=scope,
+            language_code=language_code,
+        ))
+
+
+    async def get_my_commands(
+        self,
+        *,
+        scope: Optional[BotCommandScope] = None,
+        language_code: Optional[str] = None,
+    ) -> List[BotCommand]:
+        """
+        Use this method to get the current list of the bot's commands for
+        the given scope and user language. Returns an Array of
+        [BotCommand](#botcommand) objects. If commands aren't set, an
+        empty list is returned.
+        """
+        return await self(GetMyCommands(
+            scope=scope,
+            language_code=language_code,
+        ))
+
+
+    async def set_my_name(
+        self,
+        *,
+        name: Optional[str] = None,
+        language_code: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to change the bot's name. Returns *True* on
+        success.
+        """
+        return await self(SetMyName(
+            name=name,
+            language_code=language_code,
+        ))
+
+
+    async def get_my_name(
+        self,
+        *,
+        language_code: Optional[str] = None,
+    ) -> BotName:
+        """
+        Use this method to get the current bot name for the given user
+        language. Returns [BotName](#botname) on success.
+        """
+        return await self(GetMyName(
+            language_code=language_code,
+        ))
+
+
+    async def set_my_description(
+        self,
+        *,
+        description: Optional[str] = None,
+        language_code: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to change the bot's description, which is shown in
+        the chat with the bot if the chat is empty. Returns *True* on
+        success.
+        """
+        return await self(SetMyDescription(
+            description=description,
+            language_code=language_code,
+        ))
+
+
+    async def get_my_description(
+        self,
+        *,
+        language_code: Optional[str] = None,
+    ) -> BotDescription:
+        """
+        Use this method to get the current bot description for the given
+        user language. Returns [BotDescription](#botdescription) on
+        success.
+        """
+        return await self(GetMyDescription(
+            language_code=language_code,
+        ))
+
+
+    async def set_my_short_description(
+        self,
+        *,
+        short_description: Optional[str] = None,
+        language_code: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to change the bot's short description, which is
+        shown on the bot's profile page and is sent together with the link
+        when users share the bot. Returns *True* on success.
+        """
+        return await self(SetMyShortDescription(
+            short_description=short_description,
+            language_code=language_code,
+        ))
+
+
+    async def get_my_short_description(
+        self,
+        *,
+        language_code: Optional[str] = None,
+    ) -> BotShortDescription:
+        """
+        Use this method to get the current bot short description for the
+        given user language. Returns
+        [BotShortDescription](#botshortdescription) on success.
+        """
+        return await self(GetMyShortDescription(
+            language_code=language_code,
+        ))
+
+
+    async def set_chat_menu_button(
+        self,
+        *,
+        chat_id: Optional[int] = None,
+        menu_button: Optional[MenuButton] = None,
+    ) -> bool:
+        """
+        Use this method to change the bot's menu button in a private chat,
+        or the default menu button. Returns *True* on success.
+        """
+        return await self(SetChatMenuButton(
+            chat_id=chat_id,
+            menu_button=menu_button,
+        ))
+
+
+    async def get_chat_menu_button(
+        self,
+        *,
+        chat_id: Optional[int] = None,
+    ) -> MenuButton:
+        """
+        Use this method to get the current value of the bot's menu button
+        in a private chat, or the default menu button. Returns
+        [MenuButton](#menubutton) on success.
+        """
+        return await self(GetChatMenuButton(
+            chat_id=chat_id,
+        ))
+
+
+    async def set_my_default_administrator_rights(
+        self,
+        *,
+        rights: Optional[ChatAdministratorRights] = None,
+        for_channels: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to change the default administrator rights
+        requested by the bot when it's added as an administrator to groups
+        or channels. These rights will be suggested to users, but they are
+        free to modify the list before adding the bot. Returns *True* on
+        success.
+        """
+        return await self(SetMyDefaultAdministratorRights(
+            rights=rights,
+            for_channels=for_channels,
+        ))
+
+
+    async def get_my_default_administrator_rights(
+        self,
+        *,
+        for_channels: Optional[bool] = None,
+    ) -> ChatAdministratorRights:
+        """
+        Use this method to get the current default administrator rights of
+        the bot. Returns
+        [ChatAdministratorRights](#chatadministratorrights) on success.
+        """
+        return await self(GetMyDefaultAdministratorRights(
+            for_channels=for_channels,
+        ))
+
+
+    async def edit_message_text(
+        self,
+        *,
+        text: str,
+        chat_id: Union[int, str, None] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        entities: Optional[List[MessageEntity]] = None,
+        disable_web_page_preview: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to edit text and [game](#games) messages. On
+        success, if the edited message is not an inline message, the
+        edited [Message](#message) is returned, otherwise *True* is
+        returned.
+        """
+        return await self(EditMessageText(
+            text=text,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_web_page_preview=disable_web_page_preview,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def edit_message_caption(
+        self,
+        *,
+        chat_id: Union[int, str, None] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        caption_entities: Optional[List[MessageEntity]] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to edit captions of messages. On success, if the
+        edited message is not an inline message, the edited
+        [Message](#message) is returned, otherwise *True* is returned.
+        """
+        return await self(EditMessageCaption(
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def edit_message_media(
+        self,
+        *,
+        media: InputMedia,
+        chat_id: Union[int, str, None] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to edit animation, audio, document, photo, or
+        video messages. If a message is part of a message album, then it
+        can be edited only to an audio for audio albums, only to a
+        document for document albums and to a photo or a video otherwise.
+        When an inline message is edited, a new file can't be uploaded;
+        use a previously uploaded file via its file\_id or specify a URL.
+        On success, if the edited message is not an inline message, the
+        edited [Message](#message) is returned, otherwise *True* is
+        returned.
+        """
+        return await self(EditMessageMedia(
+            media=media,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def edit_message_live_location(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        chat_id: Union[int, str, None] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+        horizontal_accuracy: Optional[float] = None,
+        heading: Optional[int] = None,
+        proximity_alert_radius: Optional[int] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to edit live location messages. A location can be
+        edited until its *live\_period* expires or editing is explicitly
+        disabled by a call to
+        [stopMessageLiveLocation](#stopmessagelivelocation). On success,
+        if the edited message is not an inline message, the edited
+        [Message](#message) is returned, otherwise *True* is returned.
+        """
+        return await self(EditMessageLiveLocation(
+            latitude=latitude,
+            longitude=longitude,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            horizontal_accuracy=horizontal_accuracy,
+            heading=heading,
+            proximity_alert_radius=proximity_alert_radius,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def stop_message_live_location(
+        self,
+        *,
+        chat_id: Union[int, str, None] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to stop updating a live location message before
+        *live\_period* expires. On success, if the message is not an
+        inline message, the edited [Message](#message) is returned,
+        otherwise *True* is returned.
+        """
+        return await self(StopMessageLiveLocation(
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def edit_message_reply_markup(
+        self,
+        *,
+        chat_id: Union[int, str, None] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to edit only the reply markup of messages. On
+        success, if the edited message is not an inline message, the
+        edited [Message](#message) is returned, otherwise *True* is
+        returned.
+        """
+        return await self(EditMessageReplyMarkup(
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def stop_poll(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_id: int,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Poll:
+        """
+        Use this method to stop a poll which was sent by the bot. On
+        success, the stopped [Poll](#poll) is returned.
+        """
+        return await self(StopPoll(
+            chat_id=chat_id,
+            message_id=message_id,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def delete_message(
+        self,
+        *,
+        chat_id: Union[int, str],
+        message_id: int,
+    ) -> bool:
+        """
+        Use this method to delete a message, including service messages,
+        with the following limitations:
+        
+        - A message can only be deleted if it was sent less than 48 hours
+        ago.
+        
+        - Service messages about a supergroup, channel, or forum topic
+        creation can't be deleted.
+        
+        - A dice message in a private chat can only be deleted if it was
+        sent more than 24 hours ago.
+        
+        - Bots can delete outgoing messages in private chats, groups, and
+        supergroups.
+        
+        - Bots can delete incoming messages in private chats.
+        
+        - Bots granted *can\_post\_messages* permissions can delete
+        outgoing messages in channels.
+        
+        - If the bot is an administrator of a group, it can delete any
+        message there.
+        
+        - If the bot has *can\_delete\_messages* permission in a
+        supergroup or a channel, it can delete any message there.
+        
+        Returns *True* on success.
+        """
+        return await self(DeleteMessage(
+            chat_id=chat_id,
+            message_id=message_id,
+        ))
+
+
+    async def send_sticker(
+        self,
+        *,
+        chat_id: Union[int, str],
+        sticker: Union[InputFile, str],
+        message_thread_id: Optional[int] = None,
+        emoji: Optional[str] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send static .WEBP,
+        [animated](https://telegram.org/blog/animated-stickers) .TGS, or
+        [video](https://telegram.org/blog/video-stickers-better-reactions)
+        .WEBM stickers. On success, the sent [Message](#message) is
+        returned.
+        """
+        return await self(SendSticker(
+            chat_id=chat_id,
+            sticker=sticker,
+            message_thread_id=message_thread_id,
+            emoji=emoji,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def get_sticker_set(
+        self,
+        *,
+        name: str,
+    ) -> StickerSet:
+        """
+        Use this method to get a sticker set. On success, a
+        [StickerSet](#stickerset) object is returned.
+        """
+        return await self(GetStickerSet(
+            name=name,
+        ))
+
+
+    async def get_custom_emoji_stickers(
+        self,
+        *,
+        custom_emoji_ids: List[str],
+    ) -> List[Sticker]:
+        """
+        Use this method to get information about custom emoji stickers by
+        their identifiers. Returns an Array of [Sticker](#sticker)
+        objects.
+        """
+        return await self(GetCustomEmojiStickers(
+            custom_emoji_ids=custom_emoji_ids,
+        ))
+
+
+    async def upload_sticker_file(
+        self,
+        *,
+        user_id: int,
+        sticker: InputFile,
+        sticker_format: str,
+    ) -> File:
+        """
+        Use this method to upload a file with a sticker for later use in
+        the [createNewStickerSet](#createnewstickerset) and
+        [addStickerToSet](#addstickertoset) methods (the file can be used
+        multiple times). Returns the uploaded [File](#file) on success.
+        """
+        return await self(UploadStickerFile(
+            user_id=user_id,
+            sticker=sticker,
+            sticker_format=sticker_format,
+        ))
+
+
+    async def create_new_sticker_set(
+        self,
+        *,
+        user_id: int,
+        name: str,
+        title: str,
+        stickers: List[InputSticker],
+        sticker_format: str,
+        sticker_type: Optional[str] = None,
+        needs_repainting: Optional[bool] = None,
+    ) -> bool:
+        """
+        Use this method to create a new sticker set owned by a user. The
+        bot will be able to edit the sticker set thus created. Returns
+        *True* on success.
+        """
+        return await self(CreateNewStickerSet(
+            user_id=user_id,
+            name=name,
+            title=title,
+            stickers=stickers,
+            sticker_format=sticker_format,
+            sticker_type=sticker_type,
+            needs_repainting=needs_repainting,
+        ))
+
+
+    async def add_sticker_to_set(
+        self,
+        *,
+        user_id: int,
+        name: str,
+        sticker: InputSticker,
+    ) -> bool:
+        """
+        Use this method to add a new sticker to a set created by the bot.
+        The format of the added sticker must match the format of the other
+        stickers in the set. Emoji sticker sets can have up to 200
+        stickers. Animated and video sticker sets can have up to 50
+        stickers. Static sticker sets can have up to 120 stickers. Returns
+        *True* on success.
+        """
+        return await self(AddStickerToSet(
+            user_id=user_id,
+            name=name,
+            sticker=sticker,
+        ))
+
+
+    async def set_sticker_position_in_set(
+        self,
+        *,
+        sticker: str,
+        position: int,
+    ) -> bool:
+        """
+        Use this method to move a sticker in a set created by the bot to a
+        specific position. Returns *True* on success.
+        """
+        return await self(SetStickerPositionInSet(
+            sticker=sticker,
+            position=position,
+        ))
+
+
+    async def delete_sticker_from_set(
+        self,
+        *,
+        sticker: str,
+    ) -> bool:
+        """
+        Use this method to delete a sticker from a set created by the bot.
+        Returns *True* on success.
+        """
+        return await self(DeleteStickerFromSet(
+            sticker=sticker,
+        ))
+
+
+    async def set_sticker_emoji_list(
+        self,
+        *,
+        sticker: str,
+        emoji_list: List[str],
+    ) -> bool:
+        """
+        Use this method to change the list of emoji assigned to a regular
+        or custom emoji sticker. The sticker must belong to a sticker set
+        created by the bot. Returns *True* on success.
+        """
+        return await self(SetStickerEmojiList(
+            sticker=sticker,
+            emoji_list=emoji_list,
+        ))
+
+
+    async def set_sticker_keywords(
+        self,
+        *,
+        sticker: str,
+        keywords: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Use this method to change search keywords assigned to a regular or
+        custom emoji sticker. The sticker must belong to a sticker set
+        created by the bot. Returns *True* on success.
+        """
+        return await self(SetStickerKeywords(
+            sticker=sticker,
+            keywords=keywords,
+        ))
+
+
+    async def set_sticker_mask_position(
+        self,
+        *,
+        sticker: str,
+        mask_position: Optional[MaskPosition] = None,
+    ) -> bool:
+        """
+        Use this method to change the [mask position](#maskposition) of a
+        mask sticker. The sticker must belong to a sticker set that was
+        created by the bot. Returns *True* on success.
+        """
+        return await self(SetStickerMaskPosition(
+            sticker=sticker,
+            mask_position=mask_position,
+        ))
+
+
+    async def set_sticker_set_title(
+        self,
+        *,
+        name: str,
+        title: str,
+    ) -> bool:
+        """
+        Use this method to set the title of a created sticker set. Returns
+        *True* on success.
+        """
+        return await self(SetStickerSetTitle(
+            name=name,
+            title=title,
+        ))
+
+
+    async def set_sticker_set_thumbnail(
+        self,
+        *,
+        name: str,
+        user_id: int,
+        thumbnail: Union[InputFile, str, None] = None,
+    ) -> bool:
+        """
+        Use this method to set the thumbnail of a regular or mask sticker
+        set. The format of the thumbnail file must match the format of the
+        stickers in the set. Returns *True* on success.
+        """
+        return await self(SetStickerSetThumbnail(
+            name=name,
+            user_id=user_id,
+            thumbnail=thumbnail,
+        ))
+
+
+    async def set_custom_emoji_sticker_set_thumbnail(
+        self,
+        *,
+        name: str,
+        custom_emoji_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Use this method to set the thumbnail of a custom emoji sticker
+        set. Returns *True* on success.
+        """
+        return await self(SetCustomEmojiStickerSetThumbnail(
+            name=name,
+            custom_emoji_id=custom_emoji_id,
+        ))
+
+
+    async def delete_sticker_set(
+        self,
+        *,
+        name: str,
+    ) -> bool:
+        """
+        Use this method to delete a sticker set that was created by the
+        bot. Returns *True* on success.
+        """
+        return await self(DeleteStickerSet(
+            name=name,
+        ))
+
+
+    async def answer_inline_query(
+        self,
+        *,
+        inline_query_id: str,
+        results: List[InlineQueryResult],
+        cache_time: Optional[int] = None,
+        is_personal: Optional[bool] = None,
+        next_offset: Optional[str] = None,
+        button: Optional[InlineQueryResultsButton] = None,
+    ) -> bool:
+        """
+        Use this method to send answers to an inline query. On success,
+        *True* is returned.
+        
+        No more than **50** results per query are allowed.
+        """
+        return await self(AnswerInlineQuery(
+            inline_query_id=inline_query_id,
+            results=results,
+            cache_time=cache_time,
+            is_personal=is_personal,
+            next_offset=next_offset,
+            button=button,
+        ))
+
+
+    async def answer_web_app_query(
+        self,
+        *,
+        web_app_query_id: str,
+        result: InlineQueryResult,
+    ) -> SentWebAppMessage:
+        """
+        Use this method to set the result of an interaction with a [Web
+        App](/bots/webapps) and send a corresponding message on behalf of
+        the user to the chat from which the query originated. On success,
+        a [SentWebAppMessage](#sentwebappmessage) object is returned.
+        """
+        return await self(AnswerWebAppQuery(
+            web_app_query_id=web_app_query_id,
+            result=result,
+        ))
+
+
+    async def send_invoice(
+        self,
+        *,
+        chat_id: Union[int, str],
+        title: str,
+        description: str,
+        payload: str,
+        provider_token: str,
+        currency: str,
+        prices: List[LabeledPrice],
+        message_thread_id: Optional[int] = None,
+        max_tip_amount: Optional[int] = None,
+        suggested_tip_amounts: Optional[List[int]] = None,
+        start_parameter: Optional[str] = None,
+        provider_data: Optional[str] = None,
+        photo_url: Optional[str] = None,
+        photo_size: Optional[int] = None,
+        photo_width: Optional[int] = None,
+        photo_height: Optional[int] = None,
+        need_name: Optional[bool] = None,
+        need_phone_number: Optional[bool] = None,
+        need_email: Optional[bool] = None,
+        need_shipping_address: Optional[bool] = None,
+        send_phone_number_to_provider: Optional[bool] = None,
+        send_email_to_provider: Optional[bool] = None,
+        is_flexible: Optional[bool] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send invoices. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendInvoice(
+            chat_id=chat_id,
+            title=title,
+            description=description,
+            payload=payload,
+            provider_token=provider_token,
+            currency=currency,
+            prices=prices,
+            message_thread_id=message_thread_id,
+            max_tip_amount=max_tip_amount,
+            suggested_tip_amounts=suggested_tip_amounts,
+            start_parameter=start_parameter,
+            provider_data=provider_data,
+            photo_url=photo_url,
+            photo_size=photo_size,
+            photo_width=photo_width,
+            photo_height=photo_height,
+            need_name=need_name,
+            need_phone_number=need_phone_number,
+            need_email=need_email,
+            need_shipping_address=need_shipping_address,
+            send_phone_number_to_provider=send_phone_number_to_provider,
+            send_email_to_provider=send_email_to_provider,
+            is_flexible=is_flexible,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def create_invoice_link(
+        self,
+        *,
+        title: str,
+        description: str,
+        payload: str,
+        provider_token: str,
+        currency: str,
+        prices: List[LabeledPrice],
+        max_tip_amount: Optional[int] = None,
+        suggested_tip_amounts: Optional[List[int]] = None,
+        provider_data: Optional[str] = None,
+        photo_url: Optional[str] = None,
+        photo_size: Optional[int] = None,
+        photo_width: Optional[int] = None,
+        photo_height: Optional[int] = None,
+        need_name: Optional[bool] = None,
+        need_phone_number: Optional[bool] = None,
+        need_email: Optional[bool] = None,
+        need_shipping_address: Optional[bool] = None,
+        send_phone_number_to_provider: Optional[bool] = None,
+        send_email_to_provider: Optional[bool] = None,
+        is_flexible: Optional[bool] = None,
+    ) -> str:
+        """
+        Use this method to create a link for an invoice. Returns the
+        created invoice link as *String* on success.
+        """
+        return await self(CreateInvoiceLink(
+            title=title,
+            description=description,
+            payload=payload,
+            provider_token=provider_token,
+            currency=currency,
+            prices=prices,
+            max_tip_amount=max_tip_amount,
+            suggested_tip_amounts=suggested_tip_amounts,
+            provider_data=provider_data,
+            photo_url=photo_url,
+            photo_size=photo_size,
+            photo_width=photo_width,
+            photo_height=photo_height,
+            need_name=need_name,
+            need_phone_number=need_phone_number,
+            need_email=need_email,
+            need_shipping_address=need_shipping_address,
+            send_phone_number_to_provider=send_phone_number_to_provider,
+            send_email_to_provider=send_email_to_provider,
+            is_flexible=is_flexible,
+        ))
+
+
+    async def answer_shipping_query(
+        self,
+        *,
+        shipping_query_id: str,
+        ok: bool,
+        shipping_options: Optional[List[ShippingOption]] = None,
+        error_message: Optional[str] = None,
+    ) -> bool:
+        """
+        If you sent an invoice requesting a shipping address and the
+        parameter *is\_flexible* was specified, the Bot API will send an
+        [Update](#update) with a *shipping\_query* field to the bot. Use
+        this method to reply to shipping queries. On success, *True* is
+        returned.
+        """
+        return await self(AnswerShippingQuery(
+            shipping_query_id=shipping_query_id,
+            ok=ok,
+            shipping_options=shipping_options,
+            error_message=error_message,
+        ))
+
+
+    async def answer_pre_checkout_query(
+        self,
+        *,
+        pre_checkout_query_id: str,
+        ok: bool,
+        error_message: Optional[str] = None,
+    ) -> bool:
+        """
+        Once the user has confirmed their payment and shipping details,
+        the Bot API sends the final confirmation in the form of an
+        [Update](#update) with the field *pre\_checkout\_query*. Use this
+        method to respond to such pre-checkout queries. On success, *True*
+        is returned. **Note:** The Bot API must receive an answer within
+        10 seconds after the pre-checkout query was sent.
+        """
+        return await self(AnswerPreCheckoutQuery(
+            pre_checkout_query_id=pre_checkout_query_id,
+            ok=ok,
+            error_message=error_message,
+        ))
+
+
+    async def set_passport_data_errors(
+        self,
+        *,
+        user_id: int,
+        errors: List[PassportElementError],
+    ) -> bool:
+        """
+        Informs a user that some of the Telegram Passport elements they
+        provided contains errors. The user will not be able to re-submit
+        their Passport to you until the errors are fixed (the contents of
+        the field for which you returned the error must change). Returns
+        *True* on success.
+        
+        Use this if the data submitted by the user doesn't satisfy the
+        standards your service requires for any reason. For example, if a
+        birthday date seems invalid, a submitted document is blurry, a
+        scan shows evidence of tampering, etc. Supply some details in the
+        error message to make sure the user knows how to correct the
+        issues.
+        """
+        return await self(SetPassportDataErrors(
+            user_id=user_id,
+            errors=errors,
+        ))
+
+
+    async def send_game(
+        self,
+        *,
+        chat_id: int,
+        game_short_name: str,
+        message_thread_id: Optional[int] = None,
+        disable_notification: Optional[bool] = None,
+        protect_content: Optional[bool] = None,
+        reply_to_message_id: Optional[int] = None,
+        allow_sending_without_reply: Optional[bool] = None,
+        reply_markup: Union[InlineKeyboardMarkup, Raw, None] = None,
+    ) -> Message:
+        """
+        Use this method to send a game. On success, the sent
+        [Message](#message) is returned.
+        """
+        return await self(SendGame(
+            chat_id=chat_id,
+            game_short_name=game_short_name,
+            message_thread_id=message_thread_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+        ))
+
+
+    async def set_game_score(
+        self,
+        *,
+        user_id: int,
+        score: int,
+        force: Optional[bool] = None,
+        disable_edit_message: Optional[bool] = None,
+        chat_id: Optional[int] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+    ) -> Union[Message, bool]:
+        """
+        Use this method to set the score of the specified user in a game
+        message. On success, if the message is not an inline message, the
+        [Message](#message) is returned, otherwise *True* is returned.
+        Returns an error, if the new score is not greater than the user's
+        current score in the chat and *force* is *False*.
+        """
+        return await self(SetGameScore(
+            user_id=user_id,
+            score=score,
+            force=force,
+            disable_edit_message=disable_edit_message,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+        ))
+
+
+    async def get_game_high_scores(
+        self,
+        *,
+        user_id: int,
+        chat_id: Optional[int] = None,
+        message_id: Optional[int] = None,
+        inline_message_id: Optional[str] = None,
+    ) -> List[GameHighScore]:
+        """
+        Use this method to get data for high score tables. Will return the
+        score of the specified user and several of their neighbors in a
+        game. Returns an Array of [GameHighScore](#gamehighscore) objects.
+        """
+        return await self(GetGameHighScores(
+            user_id=user_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+        ))
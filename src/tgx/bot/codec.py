@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import functools
+import typing
+from typing import Any, Generic, List, Optional, Union
+
+import msgspec
+
+from ._base import Schema, T, TelegramError, field
+from .schemas import ResponseParameters, Update
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class Result(
+    Schema,
+    Generic[T],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Response envelope of every Bot API method. If `ok` is True the
+    request was successful and `result` holds the method result,
+    otherwise `description` explains the error.
+    """
+    ok: bool = field()
+    """True, if the request was successful"""
+    result: Optional[T] = field(default=None)
+    """Optional. Result of the query"""
+    description: Optional[str] = field(default=None)
+    """Optional. Human-readable description of the result"""
+    error_code: Optional[int] = field(default=None)
+    """Optional. Error code of an unsuccessful request"""
+    parameters: Optional[ResponseParameters] = field(default=None)
+    """Optional. Information that helps to automatically handle the error"""
+
+    def unwrap(self) -> T:
+        """Return `result` or raise TelegramError if the request failed."""
+        if not self.ok:
+            raise TelegramError(
+                self.description or "",
+                self.error_code or 0,
+                self.parameters,
+            )
+        return self.result  # type: ignore[return-value]
+
+
+encoder = msgspec.json.Encoder()
+encode = encoder.encode
+
+
+@functools.lru_cache(maxsize=None)
+def get_decoder(type: Any) -> msgspec.json.Decoder:
+    """Return a shared json decoder for `type`, built on first use."""
+    return msgspec.json.Decoder(type)
+
+
+def result_decoder(type: typing.Type[T]) -> msgspec.json.Decoder[Result[T]]:
+    """Return a shared decoder of `Result[type]` responses."""
+    return get_decoder(Result[type])
+
+
+update_decoder: msgspec.json.Decoder[Update] = get_decoder(Update)
+updates_decoder: msgspec.json.Decoder[Result[List[Update]]] = result_decoder(
+    List[Update]
+)
+
+
+def decode_update(data: Buffer) -> Update:
+    """Decode a single Update, e.g. a webhook request body."""
+    return update_decoder.decode(data)
+
+
+def decode_updates(data: Buffer) -> Result[List[Update]]:
+    """Decode a getUpdates response body."""
+    return updates_decoder.decode(data)
+
+
+def decode_result(data: Buffer, type: typing.Type[T]) -> Result[T]:
+    """Decode a response body of a method returning `type`."""
+    return result_decoder(type).decode(data)
+
+
+EMPTY = msgspec.Raw()
+"""Default of a raw field which is missing in the decoded json"""
+
+
+class Lazy(Generic[T]):
+    """
+    Descriptor of a lazily decoded field. The raw json is stored in the
+    `_<name>` struct field and decoded on first access into the type
+    annotated as `ClassVar[Lazy[...]]` for `<name>`, the decoded value
+    replaces the raw one.
+    """
+
+    def __init__(self) -> None:
+        self.owner: Any = None
+        self.name = ""
+        self.attr = ""
+        self.decoder: Optional[msgspec.json.Decoder[T]] = None
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.owner = owner
+        self.name = name
+        self.attr = f"_{name}"
+
+    def get_decoder(self) -> msgspec.json.Decoder[T]:
+        if self.decoder is None:
+            hint = typing.get_type_hints(self.owner)[self.name]
+            # ClassVar[Lazy[type]]
+            lazy, = typing.get_args(hint)
+            self.decoder = get_decoder(typing.get_args(lazy)[0])
+        return self.decoder
+
+    @typing.overload
+    def __get__(self, obj: None, owner: Any = None) -> Lazy[T]:
+        ...
+
+    @typing.overload
+    def __get__(self, obj: object, owner: Any = None) -> T:
+        ...
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj, self.attr)
+        if value.__class__ is msgspec.Raw:
+            if not value:
+                return None
+            value = self.get_decoder().decode(value)
+            setattr(obj, self.attr, value)
+        return value
+
+    def __set__(self, obj: Any, value: T) -> None:
+        setattr(obj, self.attr, value)
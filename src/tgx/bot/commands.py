@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ._base import Handler
+from .entities import utf16_slice
+
+
+def parse_command(
+    message: Any,
+    username: Optional[str] = None,
+) -> Optional[Tuple[str, str]]:
+    """
+    Return the command of `message` without the slash and the text after
+    it, from the bot_command entity at the start of the text. Commands
+    addressed to a bot other than `username` (`/cmd@otherbot`) are None.
+    """
+    entities = message.entities
+    if not entities:
+        return None
+    entity = entities[0]
+    if entity.offset != 0 or entity.type != "bot_command":
+        return None
+    text = message.text
+    command = utf16_slice(text, 0, entity.length)
+    args = text[len(command):].strip()
+    command, _, mention = command[1:].partition("@")
+    if mention and username is not None and mention.lower() != username:
+        return None
+    return command.lower(), args
+
+
+class CommandRouter:
+    """
+    Routes messages by their bot command with a single dict lookup, the
+    command is taken from the bot_command entity so the text is never
+    matched against the registered commands. Use it as a message handler
+    with `check` of a Dispatcher route.
+    """
+
+    def __init__(self, username: Optional[str] = None) -> None:
+        self.username = username.lower() if username else None
+        self.handlers: Dict[str, Handler] = {}
+
+    def register(self, command: str, handler: Handler) -> Handler:
+        """Handle `/command` with `handler`."""
+        self.handlers[command.lstrip("/").lower()] = handler
+        return handler
+
+    def on(self, command: str) -> Callable[[Handler], Handler]:
+        """Decorator form of `register`."""
+        def decorator(handler: Handler) -> Handler:
+            return self.register(command, handler)
+        return decorator
+
+    def find(self, message: Any) -> Optional[Handler]:
+        command = parse_command(message, self.username)
+        if command is None:
+            return None
+        return self.handlers.get(command[0])
+
+    def check(self, message: Any) -> bool:
+        """Whether `message` is a command of the router."""
+        return self.find(message) is not None
+
+    async def __call__(self, message: Any) -> Any:
+        handler = self.find(message)
+        if handler is None:
+            return None
+        return await handler(message)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Optional, Tuple
+
+from ._base import Handler, Wrapper
+
+
+class UpdateWindow:
+    """
+    Update ids seen recently, as a bitmap of the `size` ids up to the
+    highest one: bit `i` is set if `high - i` was seen. Update ids are
+    sequential, so it stays a fixed size however many updates pass.
+
+    An id more than `size` below the highest is either a stale
+    redelivery or the random restart of the sequence Telegram makes
+    after a week without updates. Such ids are let through and tracked
+    in a window of their own, which replaces the current one only once
+    it has `restart_after` new ids, so a single old id doesn't wipe the
+    recent ones.
+
+    With `path` the highest id is stored there every `save_every` new ids
+    and by `close`, and loaded on start, all the ids up to it count as
+    seen. The file is a few bytes written synchronously by `add`; call
+    `close` (or `DedupHandler.close`, which runs it in the executor) on
+    shutdown so the ids added since the last save aren't handled again.
+    """
+
+    def __init__(
+        self,
+        size: int = 4096,
+        *,
+        path: Optional[str] = None,
+        save_every: int = 100,
+        restart_after: int = 3,
+    ) -> None:
+        self.size = size
+        self.mask = (1 << size) - 1
+        self.path = path
+        self.save_every = save_every
+        self.restart_after = restart_after
+        self.unsaved = 0
+        self.high: Optional[int] = None
+        self.bits = 0
+        self.restart: Optional[Tuple[int, int, int]] = None
+        """Window of the ids below the current one and its count of ids"""
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                self.high = int(f.read())
+            self.bits = self.mask
+
+    def record(self, high: int, bits: int, update_id: int) -> Tuple[int, int, bool]:
+        """Add `update_id` to the window (`high`, `bits`) it isn't below."""
+        if update_id > high:
+            if update_id - high >= self.size:
+                return update_id, 1, True
+            return update_id, (bits << (update_id - high) | 1) & self.mask, True
+        bit = 1 << (high - update_id)
+        if bits & bit:
+            return high, bits, False
+        return high, bits | bit, True
+
+    def add(self, update_id: int) -> bool:
+        """Record `update_id`, returns False if it was seen before."""
+        if self.high is None:
+            self.high, self.bits, new = update_id, 1, True
+        elif update_id > self.high - self.size:
+            self.high, self.bits, new = self.record(self.high, self.bits, update_id)
+            self.restart = None
+        else:
+            new = self.add_restart(update_id)
+        if new and self.path is not None:
+            self.unsaved += 1
+            if self.unsaved >= self.save_every:
+                self.save()
+        return new
+
+    def add_restart(self, update_id: int) -> bool:
+        restart = self.restart
+        if restart is not None and update_id > restart[0] - self.size:
+            high, bits, new = self.record(restart[0], restart[1], update_id)
+            count = restart[2] + new
+        else:
+            high, bits, new, count = update_id, 1, True, 1
+        if count >= self.restart_after:
+            self.high, self.bits, self.restart = high, bits, None
+        else:
+            self.restart = high, bits, count
+        return new
+
+    def save(self) -> None:
+        """Store the highest id, replacing the file atomically."""
+        if self.path is None or self.high is None:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(self.high))
+        os.replace(tmp, self.path)
+        self.unsaved = 0
+
+    def flush(self) -> None:
+        """Save the highest id if new ids were added since the last save."""
+        if self.unsaved:
+            self.save()
+
+    def close(self) -> None:
+        self.flush()
+
+
+class DedupHandler(Wrapper):
+    """
+    Passes to `handler` only updates whose update_id is new to `window`.
+    Call `close` once updates stop coming to save the window.
+    """
+
+    def __init__(self, handler: Handler, window: Optional[UpdateWindow] = None) -> None:
+        self.handler = handler
+        self.window = window or UpdateWindow()
+
+    async def __call__(self, update: Any) -> Any:
+        if not self.window.add(update.update_id):
+            return None
+        return await self.handler(update)
+
+    async def flush(self) -> None:
+        """Save the window without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.window.flush)
+
+    async def close(self) -> None:
+        await self.flush()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ._base import Handler
+from .filters import Check, Filter, Matcher, compile_routes
+from .schemas import Update
+
+
+Route = Tuple[Union[Filter, Check, None], Handler]
+Table = Tuple[Tuple[str, Matcher, Tuple[Handler, ...]], ...]
+
+UPDATE_TYPES = tuple(
+    name for name in Update.__struct_fields__ if name != "update_id"
+)
+"""Mutually exclusive optional fields of Update, one of them is set"""
+
+
+class Dispatcher:
+    """
+    Routes updates to the handlers registered for the type of update,
+    i.e. the field of Update which is set. The routing table holds only
+    the registered types, so an update is matched by checking those
+    fields alone, and `allowed_updates` lets Telegram skip the others.
+    Routes of a type are tried in order and the first one whose `check`
+    passes handles the event, its result is returned. The checks of a
+    type are compiled into a single matcher on the first update after a
+    route is added, see `compile_routes`.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, List[Route]] = {}
+        self.table: Optional[Table] = None
+
+    def register(
+        self,
+        type: str,
+        handler: Handler,
+        check: Union[Filter, Check, None] = None,
+    ) -> Handler:
+        """Handle the `type` field of updates with `handler`."""
+        if type not in UPDATE_TYPES:
+            raise ValueError(f"Unknown update type {type!r}")
+        self.routes.setdefault(type, []).append((check, handler))
+        self.table = None
+        return handler
+
+    def on(
+        self,
+        type: str,
+        check: Union[Filter, Check, None] = None,
+    ) -> Callable[[Handler], Handler]:
+        """Decorator form of `register`."""
+        def decorator(handler: Handler) -> Handler:
+            return self.register(type, handler, check)
+        return decorator
+
+    @property
+    def allowed_updates(self) -> Optional[List[str]]:
+        """
+        Update types with handlers, for getUpdates and setWebhook. None
+        without routes: Telegram takes an empty list for all the types
+        but chat_member, not for none of them.
+        """
+        return list(self.routes) or None
+
+    def build(self) -> Table:
+        self.table = tuple(
+            (
+                name,
+                compile_routes([check for check, _ in routes]),
+                tuple(handler for _, handler in routes),
+            )
+            for name, routes in self.routes.items()
+        )
+        return self.table
+
+    async def __call__(self, update: Any) -> Any:
+        for name, match, handlers in self.table or self.build():
+            event = getattr(update, name)
+            if event is not None:
+                i = match(event)
+                return None if i < 0 else await handlers[i](event)
+        return None
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import abc
+import functools
+import html
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+@functools.lru_cache(maxsize=1024)
+def utf16(text: str) -> bytes:
+    """UTF-16 encoding of `text`, shared by the entities of a message."""
+    return text.encode("utf-16-le")
+
+
+def utf16_slice(text: str, offset: int, length: int) -> str:
+    """
+    Slice `text` by the UTF-16 code unit `offset` and `length` of a
+    MessageEntity. Characters outside the BMP (e.g. most emoji) take two
+    code units, so python indexes only match for BMP-only text.
+    """
+    if text.isascii():
+        return text[offset:offset + length]
+    data = utf16(text)
+    return data[2 * offset:2 * (offset + length)].decode("utf-16-le")
+
+
+def entity_texts(text: str, entities: Sequence[Any]) -> List[str]:
+    """Texts of `entities`, encoding `text` once."""
+    return [utf16_slice(text, e.offset, e.length) for e in entities]
+
+
+CODE = frozenset(("code", "pre"))
+
+
+class Renderer(abc.ABC):
+    """
+    Markup of entities, see `render`. Text is escaped as code inside code
+    entities and as quoted lines inside blockquotes.
+    """
+
+    @abc.abstractmethod
+    def escape(self, text: str, code: bool, quote: bool) -> str: ...
+
+    @abc.abstractmethod
+    def open(self, entity: Any) -> str: ...
+
+    @abc.abstractmethod
+    def close(self, entity: Any) -> str: ...
+
+
+class HTML(Renderer):
+    TAGS = {
+        "bold": "b",
+        "italic": "i",
+        "underline": "u",
+        "strikethrough": "s",
+        "spoiler": "tg-spoiler",
+        "code": "code",
+        "blockquote": "blockquote",
+    }
+
+    def escape(self, text: str, code: bool, quote: bool) -> str:
+        return html.escape(text, quote=False)
+
+    def open(self, entity: Any) -> str:
+        type = entity.type
+        if type in self.TAGS:
+            return f"<{self.TAGS[type]}>"
+        if type == "pre":
+            if entity.language:
+                language = html.escape(entity.language)
+                return f'<pre><code class="language-{language}">'
+            return "<pre>"
+        if type == "text_link":
+            return f'<a href="{html.escape(entity.url)}">'
+        if type == "text_mention":
+            return f'<a href="tg://user?id={entity.user.id}">'
+        if type == "custom_emoji":
+            return f'<tg-emoji emoji-id="{entity.custom_emoji_id}">'
+        return ""
+
+    def close(self, entity: Any) -> str:
+        type = entity.type
+        if type in self.TAGS:
+            return f"</{self.TAGS[type]}>"
+        if type == "pre":
+            return "</code></pre>" if entity.language else "</pre>"
+        if type in ("text_link", "text_mention"):
+            return "</a>"
+        if type == "custom_emoji":
+            return "</tg-emoji>"
+        return ""
+
+
+class Markdown(Renderer):
+    """MarkdownV2 markup. Each line of a blockquote starts with `>`."""
+
+    MARKS = {
+        "bold": "*",
+        "italic": "_",
+        "underline": "__",
+        "strikethrough": "~",
+        "spoiler": "||",
+        "code": "`",
+    }
+    SPECIAL = str.maketrans({c: f"\\{c}" for c in "_*[]()~`>#+-=|{}.!\\"})
+    CODE_SPECIAL = str.maketrans({c: f"\\{c}" for c in "`\\"})
+    URL_SPECIAL = str.maketrans({c: f"\\{c}" for c in ")\\"})
+
+    def escape(self, text: str, code: bool, quote: bool) -> str:
+        text = text.translate(self.CODE_SPECIAL if code else self.SPECIAL)
+        return text.replace("\n", "\n>") if quote else text
+
+    def open(self, entity: Any) -> str:
+        type = entity.type
+        if type in self.MARKS:
+            return self.MARKS[type]
+        if type == "blockquote":
+            return ">"
+        if type == "pre":
+            return f"```{entity.language or ''}\n"
+        if type in ("text_link", "text_mention"):
+            return "["
+        if type == "custom_emoji":
+            return "!["
+        return ""
+
+    def close(self, entity: Any) -> str:
+        type = entity.type
+        if type in self.MARKS:
+            return self.MARKS[type]
+        if type == "pre":
+            return "\n```"
+        if type == "text_link":
+            return f"]({entity.url.translate(self.URL_SPECIAL)})"
+        if type == "text_mention":
+            return f"](tg://user?id={entity.user.id})"
+        if type == "custom_emoji":
+            return f"](tg://emoji?id={entity.custom_emoji_id})"
+        return ""
+
+
+def render(text: str, entities: Optional[Sequence[Any]], renderer: Renderer) -> str:
+    """
+    Render `text` with its `entities` in a single pass over the text: the
+    segments between entity boundaries are decoded from the UTF-16 text
+    once each and escaped, the markup of entities is put around them.
+    """
+    if not entities:
+        return renderer.escape(text, False, False)
+    segment: Callable[[int, int], str]
+    if text.isascii():
+        def segment(start: int, stop: int) -> str:
+            return text[start:stop]
+        end = len(text)
+    else:
+        data = utf16(text)
+        def segment(start: int, stop: int) -> str:
+            return data[2 * start:2 * stop].decode("utf-16-le")
+        end = len(data) // 2
+    out: List[str] = []
+    stack: List[Tuple[int, Any]] = []
+    pos = 0
+    code = 0
+    quote = 0
+
+    def advance(to: int) -> None:
+        nonlocal pos, code, quote
+        while stack and stack[-1][0] <= to:
+            stop, entity = stack.pop()
+            out.append(renderer.escape(segment(pos, stop), code > 0, quote > 0))
+            out.append(renderer.close(entity))
+            code -= entity.type in CODE
+            quote -= entity.type == "blockquote"
+            pos = stop
+        out.append(renderer.escape(segment(pos, to), code > 0, quote > 0))
+        pos = to
+
+    for entity in sorted(entities, key=lambda e: (e.offset, -e.length)):
+        advance(entity.offset)
+        stop = entity.offset + entity.length
+        if stack:
+            stop = min(stop, stack[-1][0])
+        out.append(renderer.open(entity))
+        code += entity.type in CODE
+        quote += entity.type == "blockquote"
+        stack.append((stop, entity))
+    advance(end)
+    return "".join(out)
+
+
+html_renderer = HTML()
+markdown_renderer = Markdown()
+
+
+def text_and_entities(message: Any) -> Tuple[str, Optional[Sequence[Any]]]:
+    if message.text is not None:
+        return message.text, message.entities
+    return message.caption or "", message.caption_entities
+
+
+def to_html(message: Any) -> str:
+    """Text or caption of `message` with entities as Telegram HTML."""
+    return render(*text_and_entities(message), html_renderer)
+
+
+def to_markdown(message: Any) -> str:
+    """Text or caption of `message` with entities as MarkdownV2."""
+    return render(*text_and_entities(message), markdown_renderer)
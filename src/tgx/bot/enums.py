@@ -0,0 +1,136 @@
+from ._base import Enum
+
+
+class ChatType(Enum):
+    """Values of Chat.type"""
+    PRIVATE = "private"
+    GROUP = "group"
+    SUPERGROUP = "supergroup"
+    CHANNEL = "channel"
+
+
+class MessageEntityType(Enum):
+    """Values of MessageEntity.type"""
+    MENTION = "mention"
+    HASHTAG = "hashtag"
+    CASHTAG = "cashtag"
+    BOT_COMMAND = "bot_command"
+    URL = "url"
+    EMAIL = "email"
+    PHONE_NUMBER = "phone_number"
+    BOLD = "bold"
+    ITALIC = "italic"
+    UNDERLINE = "underline"
+    STRIKETHROUGH = "strikethrough"
+    SPOILER = "spoiler"
+    CODE = "code"
+    PRE = "pre"
+    TEXT_LINK = "text_link"
+    TEXT_MENTION = "text_mention"
+    CUSTOM_EMOJI = "custom_emoji"
+
+
+class PollType(Enum):
+    """Values of Poll.type"""
+    REGULAR = "regular"
+    QUIZ = "quiz"
+
+
+class StickerType(Enum):
+    """Values of Sticker.type"""
+    REGULAR = "regular"
+    MASK = "mask"
+    CUSTOM_EMOJI = "custom_emoji"
+
+
+class MaskPositionPoint(Enum):
+    """Values of MaskPosition.point"""
+    FOREHEAD = "forehead"
+    EYES = "eyes"
+    MOUTH = "mouth"
+    CHIN = "chin"
+
+
+class InlineQueryChatType(Enum):
+    """Values of InlineQuery.chat_type"""
+    SENDER = "sender"
+    PRIVATE = "private"
+    GROUP = "group"
+    SUPERGROUP = "supergroup"
+    CHANNEL = "channel"
+
+
+class InlineQueryResultGifThumbnailMimeType(Enum):
+    """Values of InlineQueryResultGif.thumbnail_mime_type"""
+    IMAGE_JPEG = "image/jpeg"
+    IMAGE_GIF = "image/gif"
+    VIDEO_MP4 = "video/mp4"
+
+
+class InlineQueryResultDocumentMimeType(Enum):
+    """Values of InlineQueryResultDocument.mime_type"""
+    APPLICATION_PDF = "application/pdf"
+    APPLICATION_ZIP = "application/zip"
+
+
+class EncryptedPassportElementType(Enum):
+    """Values of EncryptedPassportElement.type"""
+    PERSONAL_DETAILS = "personal_details"
+    PASSPORT = "passport"
+    DRIVER_LICENSE = "driver_license"
+    IDENTITY_CARD = "identity_card"
+    INTERNAL_PASSPORT = "internal_passport"
+    ADDRESS = "address"
+    UTILITY_BILL = "utility_bill"
+    BANK_STATEMENT = "bank_statement"
+    RENTAL_AGREEMENT = "rental_agreement"
+    PASSPORT_REGISTRATION = "passport_registration"
+    TEMPORARY_REGISTRATION = "temporary_registration"
+    PHONE_NUMBER = "phone_number"
+    EMAIL = "email"
+
+
+class PassportElementErrorDataFieldType(Enum):
+    """Values of PassportElementErrorDataField.type"""
+    PERSONAL_DETAILS = "personal_details"
+    PASSPORT = "passport"
+    DRIVER_LICENSE = "driver_license"
+    IDENTITY_CARD = "identity_card"
+    INTERNAL_PASSPORT = "internal_passport"
+    ADDRESS = "address"
+
+
+class PassportElementErrorFrontSideType(Enum):
+    """Values of PassportElementErrorFrontSide.type"""
+    PASSPORT = "passport"
+    DRIVER_LICENSE = "driver_license"
+    IDENTITY_CARD = "identity_card"
+    INTERNAL_PASSPORT = "internal_passport"
+
+
+class PassportElementErrorReverseSideType(Enum):
+    """Values of PassportElementErrorReverseSide.type"""
+    DRIVER_LICENSE = "driver_license"
+    IDENTITY_CARD = "identity_card"
+
+
+class PassportElementErrorFileType(Enum):
+    """Values of PassportElementErrorFile.type"""
+    UTILITY_BILL = "utility_bill"
+    BANK_STATEMENT = "bank_statement"
+    RENTAL_AGREEMENT = "rental_agreement"
+    PASSPORT_REGISTRATION = "passport_registration"
+    TEMPORARY_REGISTRATION = "temporary_registration"
+
+
+class PassportElementErrorTranslationFileType(Enum):
+    """Values of PassportElementErrorTranslationFile.type"""
+    PASSPORT = "passport"
+    DRIVER_LICENSE = "driver_license"
+    IDENTITY_CARD = "identity_card"
+    INTERNAL_PASSPORT = "internal_passport"
+    UTILITY_BILL = "utility_bill"
+    BANK_STATEMENT = "bank_statement"
+    RENTAL_AGREEMENT = "rental_agreement"
+    PASSPORT_REGISTRATION = "passport_registration"
+    TEMPORARY_REGISTRATION = "temporary_registration"
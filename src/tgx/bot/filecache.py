@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import typing
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import msgspec
+
+from ._base import Path, T
+from .files import CHUNK_SIZE, InputFile
+
+
+KINDS = frozenset((
+    "animation",
+    "audio",
+    "document",
+    "photo",
+    "sticker",
+    "video",
+    "video_note",
+    "voice",
+))
+"""Fields whose uploads come back as a reusable file_id in the Message
+attribute of the same name. Thumbnails can't be reused and are not
+cached."""
+
+Key = Tuple[str, str]
+"""sha256 of the file contents and the kind of media it was sent as."""
+
+
+class Upload(NamedTuple):
+    key: Key
+    kind: str
+    index: Optional[int]
+    claimed: bool = True
+    """Whether calls sending the same file wait for this one"""
+
+
+def sha256(file: InputFile) -> Optional[str]:
+    """
+    Hash the contents of `file`, or None if they can't be read without
+    consuming the source (async iterators, unseekable streams).
+    """
+    source: Any = file.source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    h = hashlib.sha256()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                h.update(chunk)
+        return h.hexdigest()
+    if hasattr(source, "seekable") and source.seekable():
+        position = source.tell()
+        while chunk := source.read(CHUNK_SIZE):
+            h.update(chunk)
+        source.seek(position)
+        return h.hexdigest()
+    return None
+
+
+def file_id_of(result: Any, kind: str) -> Optional[str]:
+    media = getattr(result, kind, None)
+    if isinstance(media, list):
+        media = media[-1] if media else None
+    return getattr(media, "file_id", None)
+
+
+@lru_cache(maxsize=None)
+def reusable(cls: type) -> Tuple[str, ...]:
+    """Fields of `cls` holding a file that may be passed as a file_id."""
+    hints = typing.get_type_hints(cls)
+    return tuple(
+        name for name in cls.__struct_fields__
+        if name == "media"
+        or name in KINDS and str in typing.get_args(hints[name])
+    )
+
+
+class Backend(abc.ABC):
+    """
+    Persistent storage of file_ids behind the in-memory cache. Its
+    methods are blocking and called in the default executor.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: Key) -> Optional[str]: ...
+
+    @abc.abstractmethod
+    def set(self, key: Key, file_id: str) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteBackend(Backend):
+    def __init__(self, path: str = "file_ids.sqlite3") -> None:
+        self.db = sqlite3.connect(
+            path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS file_ids ("
+            "digest TEXT NOT NULL, "
+            "kind TEXT NOT NULL, "
+            "file_id TEXT NOT NULL, "
+            "PRIMARY KEY (digest, kind)"
+            ") WITHOUT ROWID"
+        )
+        self.lock = threading.Lock()
+
+    def get(self, key: Key) -> Optional[str]:
+        with self.lock:
+            row = self.db.execute(
+                "SELECT file_id FROM file_ids WHERE digest = ? AND kind = ?",
+                key,
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: Key, file_id: str) -> None:
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO file_ids VALUES (?, ?, ?)",
+                (*key, file_id),
+            )
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
+
+
+class FileCache:
+    """
+    Maps the sha256 of uploaded files to the file_id Telegram returned
+    for them, so sending the same contents again costs a short json
+    request instead of a multipart upload. The `maxsize` most recently
+    used ids are kept in memory in front of an optional `backend`.
+
+    Concurrent calls sending the same missing file (e.g. a broadcast
+    with `client.gather`) upload it once: the first one uploads and the
+    others wait for its file_id. A call which already claimed uploads of
+    its own never waits, it uploads the file too, so calls sending the
+    same files in different order can't wait for each other.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        backend: Optional[Backend] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.backend = backend
+        self.ids: OrderedDict[Key, str] = OrderedDict()
+        self.pending: Dict[Key, asyncio.Future[None]] = {}
+
+    async def get(self, key: Key) -> Optional[str]:
+        file_id = self.ids.get(key)
+        if file_id is not None:
+            self.ids.move_to_end(key)
+        elif self.backend is not None:
+            loop = asyncio.get_running_loop()
+            file_id = await loop.run_in_executor(None, self.backend.get, key)
+            if file_id is not None:
+                self.remember(key, file_id)
+        return file_id
+
+    async def set(self, key: Key, file_id: str) -> None:
+        self.remember(key, file_id)
+        if self.backend is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.backend.set, key, file_id)
+
+    def remember(self, key: Key, file_id: str) -> None:
+        self.ids[key] = file_id
+        self.ids.move_to_end(key)
+        if len(self.ids) > self.maxsize:
+            self.ids.popitem(last=False)
+
+    async def key(self, file: InputFile, kind: str) -> Optional[Key]:
+        if file.digest is None:
+            loop = asyncio.get_running_loop()
+            file.digest = await loop.run_in_executor(None, sha256, file)
+        if file.digest is None:
+            return None
+        return file.digest, kind
+
+    async def resolve(self, path: Path[T]) -> Tuple[Path[T], List[Upload]]:
+        """
+        Replace files of `path` uploaded before by their file_id. Returns
+        the new path and the files still to be uploaded, which must be
+        passed to `release` once the call is done.
+        """
+        uploads: List[Upload] = []
+        changes = {}
+        claimed: Set[Key] = set()
+        try:
+            for name in reusable(type(path)):
+                value = getattr(path, name)
+                if isinstance(value, InputFile):
+                    file_id, upload = await self.lookup(value, name, None, claimed)
+                    if file_id is not None:
+                        changes[name] = file_id
+                    elif upload is not None:
+                        uploads.append(upload)
+                elif isinstance(value, msgspec.Struct):
+                    media, upload = await self.resolve_media(value, None, claimed)
+                    if media is not value:
+                        changes[name] = media
+                    elif upload is not None:
+                        uploads.append(upload)
+                elif isinstance(value, list):
+                    group = []
+                    for i, item in enumerate(value):
+                        media, upload = await self.resolve_media(item, i, claimed)
+                        group.append(media)
+                        if upload is not None:
+                            uploads.append(upload)
+                    if any(a is not b for a, b in zip(group, value)):
+                        changes[name] = group
+        except BaseException:
+            self.release(uploads)
+            raise
+        if changes:
+            path = msgspec.structs.replace(path, **changes)
+        return path, uploads
+
+    async def resolve_media(
+        self,
+        media: Any,
+        index: Optional[int],
+        claimed: Set[Key],
+    ) -> Tuple[Any, Optional[Upload]]:
+        kind = media.__struct_config__.tag
+        if not isinstance(media.media, InputFile) or kind not in KINDS:
+            return media, None
+        file_id, upload = await self.lookup(media.media, kind, index, claimed)
+        if file_id is not None:
+            media = msgspec.structs.replace(media, media=file_id)
+        return media, upload
+
+    async def lookup(
+        self,
+        file: InputFile,
+        kind: str,
+        index: Optional[int],
+        claimed: Set[Key],
+    ) -> Tuple[Optional[str], Optional[Upload]]:
+        """
+        Find the file_id of `file`, or claim its upload for this call if
+        no other call is uploading it, else wait for that call to finish,
+        unless this call holds claims another one may be waiting for.
+        """
+        key = await self.key(file, kind)
+        if key is None:
+            return None, None
+        while key not in claimed:
+            file_id = await self.get(key)
+            if file_id is not None:
+                return file_id, None
+            pending = self.pending.get(key)
+            if pending is None:
+                loop = asyncio.get_running_loop()
+                self.pending[key] = loop.create_future()
+                claimed.add(key)
+            elif claimed:
+                return None, Upload(key, kind, index, claimed=False)
+            else:
+                await asyncio.shield(pending)
+        return None, Upload(key, kind, index)
+
+    def release(self, uploads: List[Upload]) -> None:
+        """Wake the calls waiting for `uploads`, whether they succeeded."""
+        for upload in uploads:
+            if not upload.claimed:
+                continue
+            pending = self.pending.pop(upload.key, None)
+            if pending is not None and not pending.done():
+                pending.set_result(None)
+
+    async def update(self, uploads: List[Upload], result: Any) -> None:
+        """Store file_ids of `uploads` found in the `result` of their call."""
+        for upload in uploads:
+            message = result
+            if upload.index is not None:
+                if not isinstance(result, list) or upload.index >= len(result):
+                    continue
+                message = result[upload.index]
+            file_id = file_id_of(message, upload.kind)
+            if file_id is not None:
+                await self.set(upload.key, file_id)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Hashable,
+    Optional,
+    Union,
+)
+
+
+CHUNK_SIZE = 64 * 1024
+
+Source = Union[
+    str,
+    "os.PathLike[str]",
+    bytes,
+    bytearray,
+    memoryview,
+    BinaryIO,
+    AsyncIterable[bytes],
+]
+
+
+class InputFile:
+    """
+    This object represents the contents of a file to be uploaded. It wraps
+    a filesystem path, a binary file object, bytes or an async iterator of
+    bytes, and is streamed into the multipart/form-data body in
+    `CHUNK_SIZE` pieces, so the whole file is never held in memory.
+
+    A seekable file object is read from the position it had when wrapped
+    every time the request is built, e.g. when a call is retried. Async
+    iterators and unseekable streams can be read only once.
+    """
+
+    __slots__ = ("source", "filename", "digest", "start", "consumed")
+
+    def __init__(self, source: Source, filename: Optional[str] = None) -> None:
+        self.source = source
+        if filename is None:
+            if isinstance(source, (str, os.PathLike)):
+                filename = os.path.basename(os.fspath(source))
+            else:
+                filename = os.path.basename(getattr(source, "name", "")) or "file"
+        self.filename = filename
+        self.digest: Optional[str] = None
+        self.start: Optional[int] = None
+        if hasattr(source, "seekable") and source.seekable():
+            self.start = source.tell()
+        self.consumed = False
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size in bytes if it is known before reading the source."""
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return memoryview(source).nbytes
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        return None
+
+    @property
+    def key(self) -> Hashable:
+        """Identity of the file contents, equal for files sharing a source."""
+        if isinstance(self.source, (str, os.PathLike)):
+            return os.path.abspath(self.source)
+        return id(self.source)
+
+    async def chunks(self, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        source: Any = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source).cast("B")
+            for i in range(0, len(view), chunk_size):
+                yield view[i:i + chunk_size]  # type: ignore[misc]
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+        else:
+            if self.start is not None:
+                source.seek(self.start)
+            elif self.consumed:
+                raise RuntimeError(f"{self!r} can't be read twice")
+            self.consumed = True
+            if hasattr(source, "read"):
+                while chunk := source.read(chunk_size):
+                    yield chunk
+            else:
+                async for chunk in source:
+                    yield chunk
+
+    def __repr__(self) -> str:
+        return f"InputFile({self.filename!r})"
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import abc
+import operator
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+Check = Callable[[Any], bool]
+Matcher = Callable[[Any], int]
+
+LITERALS = (str, int, float, bool, type(None))
+
+COMPARISONS = {
+    operator.eq: "==",
+    operator.ne: "!=",
+    operator.lt: "<",
+    operator.le: "<=",
+    operator.gt: ">",
+    operator.ge: ">=",
+}
+
+UNSET = object()
+"""Value of a shared predicate which is not evaluated yet"""
+
+
+class Filter(abc.ABC):
+    """
+    Node of a filter expression over an event (e.g. Message). Filters are
+    combined with `&`, `|` and `~` and compiled into python source, see
+    `compile_routes`.
+    """
+
+    cost = 1
+
+    @abc.abstractmethod
+    def key(self) -> Hashable: ...
+
+    @abc.abstractmethod
+    def source(self, compiler: Compiler) -> str: ...
+
+    def __and__(self, other: Any) -> Filter:
+        return And((self, as_filter(other)))
+
+    def __rand__(self, other: Any) -> Filter:
+        return And((as_filter(other), self))
+
+    def __or__(self, other: Any) -> Filter:
+        return Or((self, as_filter(other)))
+
+    def __ror__(self, other: Any) -> Filter:
+        return Or((as_filter(other), self))
+
+    def __invert__(self) -> Filter:
+        return Not(self)
+
+    def compile(self) -> Check:
+        """Compile into a single function of the event."""
+        match = compile_routes([self])
+        return lambda event: match(event) == 0
+
+
+class Expr(Filter):
+    """
+    Attribute path of the event, `F.chat.type`. As a filter it checks
+    that the value is set and not empty.
+    """
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: Tuple[str, ...] = ()) -> None:
+        self._path = path
+
+    def __getattr__(self, name: str) -> Expr:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Expr((*self._path, name))
+
+    def __call__(self, *args: Any) -> Filter:
+        if not self._path:
+            raise TypeError("F is not callable")
+        return Method(self._path[:-1], self._path[-1], args)
+
+    def __eq__(self, other: Any) -> Filter:  # type: ignore[override]
+        return Compare(self._path, operator.eq, other)
+
+    def __ne__(self, other: Any) -> Filter:  # type: ignore[override]
+        return Compare(self._path, operator.ne, other)
+
+    def __lt__(self, other: Any) -> Filter:
+        return Compare(self._path, operator.lt, other)
+
+    def __le__(self, other: Any) -> Filter:
+        return Compare(self._path, operator.le, other)
+
+    def __gt__(self, other: Any) -> Filter:
+        return Compare(self._path, operator.gt, other)
+
+    def __ge__(self, other: Any) -> Filter:
+        return Compare(self._path, operator.ge, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def in_(self, values: Any) -> Filter:
+        return In(self._path, values)
+
+    @property
+    def cost(self) -> int:  # type: ignore[override]
+        return 1 + len(self._path)
+
+    def key(self) -> Hashable:
+        return ("is", self._path)
+
+    def source(self, compiler: Compiler) -> str:
+        return compiler.load(self._path)
+
+
+F = Expr()
+"""Root of filter expressions, the event itself"""
+
+
+class Compare(Filter):
+    def __init__(self, path: Tuple[str, ...], op: Any, value: Any) -> None:
+        self.path = path
+        self.op = op
+        self.value = value
+        self.cost = 2 + len(path)
+
+    def key(self) -> Hashable:
+        return ("cmp", self.path, self.op, constant_key(self.value))
+
+    def source(self, compiler: Compiler) -> str:
+        value = compiler.load(self.path)
+        expr = f"{value} {COMPARISONS[self.op]} {compiler.const(self.value)}"
+        if self.op in (operator.eq, operator.ne):
+            return expr
+        return f"({value} is not None and {expr})"
+
+
+class In(Filter):
+    def __init__(self, path: Tuple[str, ...], values: Any) -> None:
+        self.path = path
+        self.values = values
+        self.cost = 3 + len(path)
+
+    def key(self) -> Hashable:
+        return ("in", self.path, constant_key(self.values))
+
+    def source(self, compiler: Compiler) -> str:
+        value = compiler.load(self.path)
+        return f"({value} is not None and {value} in {compiler.const(self.values)})"
+
+
+class Method(Filter):
+    """Call of a method of the value, `F.text.startswith("/start")`."""
+
+    def __init__(self, path: Tuple[str, ...], name: str, args: Tuple[Any, ...]) -> None:
+        self.path = path
+        self.name = name
+        self.args = args
+        self.cost = 4 + len(path)
+
+    def key(self) -> Hashable:
+        return ("call", self.path, self.name, tuple(map(constant_key, self.args)))
+
+    def source(self, compiler: Compiler) -> str:
+        value = compiler.load(self.path)
+        args = ", ".join(compiler.const(arg) for arg in self.args)
+        return f"({value} is not None and {value}.{self.name}({args}))"
+
+
+class Func(Filter):
+    """Arbitrary check of the event, it is evaluated last."""
+
+    cost = 10
+
+    def __init__(self, func: Check) -> None:
+        self.func = func
+
+    def key(self) -> Hashable:
+        return ("func", id(self.func))
+
+    def source(self, compiler: Compiler) -> str:
+        return f"{compiler.const(self.func)}(e)"
+
+
+class Not(Filter):
+    def __init__(self, filter: Filter) -> None:
+        self.filter = filter
+        self.cost = filter.cost
+
+    def key(self) -> Hashable:
+        return ("not", self.filter.key())
+
+    def source(self, compiler: Compiler) -> str:
+        return f"not {compiler.expr(self.filter)}"
+
+
+class And(Filter):
+    op = "and"
+
+    def __init__(self, filters: Sequence[Filter]) -> None:
+        flat: List[Filter] = []
+        for f in filters:
+            flat.extend(f.filters if type(f) is type(self) else (f,))  # type: ignore
+        # Cheapest checks first, the result doesn't depend on the order.
+        self.filters = sorted(flat, key=lambda f: f.cost)
+        self.cost = sum(f.cost for f in self.filters)
+
+    def key(self) -> Hashable:
+        return (self.op, tuple(f.key() for f in self.filters))
+
+    def source(self, compiler: Compiler) -> str:
+        return f" {self.op} ".join(compiler.expr(f) for f in self.filters)
+
+
+class Or(And):
+    op = "or"
+
+
+def as_filter(value: Any) -> Filter:
+    if isinstance(value, Filter):
+        return value
+    if callable(value):
+        return Func(value)
+    raise TypeError(f"{value!r} is not a filter")
+
+
+def constant_key(value: Any) -> Hashable:
+    if isinstance(value, LITERALS):
+        return (type(value), value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(constant_key, value))
+    if isinstance(value, (tuple, list)):
+        return tuple(map(constant_key, value))
+    return id(value)
+
+
+class Compiler:
+    """
+    Generates the source of a matcher of routes. Attribute loads and
+    predicates used by several routes are evaluated once into locals.
+    Loads can't fail and are made up front, a shared predicate is
+    evaluated where it is first reached and its value reused after, so
+    it stays behind the checks guarding it.
+    """
+
+    def __init__(self, shared: Sequence[Hashable] = ()) -> None:
+        self.lines: List[str] = ["def match(e):"]
+        self.namespace: Dict[str, Any] = {}
+        self.loads: Dict[Tuple[str, ...], str] = {(): "e"}
+        self.shared = set(shared)
+        self.predicates: Dict[Hashable, Tuple[str, str]] = {}
+
+    def emit(self, line: str) -> None:
+        self.lines.append(f"    {line}")
+
+    def load(self, path: Tuple[str, ...]) -> str:
+        name = self.loads.get(path)
+        if name is None:
+            parent = self.load(path[:-1])
+            name = self.loads[path] = f"v{len(self.loads)}"
+            if parent == "e":
+                self.emit(f"{name} = e.{path[-1]}")
+            else:
+                self.emit(
+                    f"{name} = {parent}.{path[-1]} if {parent} is not None else None"
+                )
+        return name
+
+    def const(self, value: Any) -> str:
+        if isinstance(value, LITERALS):
+            return repr(value)
+        name = f"c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def expr(self, filter: Filter) -> str:
+        key = filter.key()
+        if key not in self.shared or isinstance(filter, Expr):
+            return f"({filter.source(self)})"
+        predicate = self.predicates.get(key)
+        if predicate is None:
+            source = filter.source(self)
+            name = f"p{len(self.predicates)}"
+            predicate = self.predicates[key] = name, source
+        name, source = predicate
+        return f"({name} if {name} is not U else ({name} := {source}))"
+
+    def route(self, index: int, filter: Optional[Filter]) -> bool:
+        """Add a route, returns False if the following are unreachable."""
+        if filter is None:
+            self.emit(f"return {index}")
+            return False
+        self.emit(f"if {self.expr(filter)}:")
+        self.emit(f"    return {index}")
+        return True
+
+    def build(self) -> Matcher:
+        self.emit("return -1")
+        self.lines[1:1] = [f"    {name} = U" for name, _ in self.predicates.values()]
+        self.namespace["U"] = UNSET
+        exec("\n".join(self.lines), self.namespace)
+        return self.namespace["match"]
+
+
+def subexpressions(filter: Filter) -> List[Hashable]:
+    keys = [filter.key()]
+    if isinstance(filter, And):
+        for f in filter.filters:
+            keys.extend(subexpressions(f))
+    elif isinstance(filter, Not):
+        keys.extend(subexpressions(filter.filter))
+    return keys
+
+
+def compile_routes(checks: Sequence[Any]) -> Matcher:
+    """
+    Compile the checks of routes (filters, plain callables or None for
+    none) into one function returning the index of the first matching
+    route or -1.
+    """
+    filters = [None if c is None else as_filter(c) for c in checks]
+    counts: Dict[Hashable, int] = {}
+    for f in filters:
+        if f is not None:
+            for key in set(subexpressions(f)):
+                counts[key] = counts.get(key, 0) + 1
+    compiler = Compiler([key for key, n in counts.items() if n > 1])
+    for i, f in enumerate(filters):
+        if not compiler.route(i, f):
+            break
+    return compiler.build()
@@ -0,0 +1,386 @@
+from __future__ import annotations
+from typing import ClassVar, List, Optional
+
+from msgspec import Raw
+
+from ._base import Schema, field
+from .codec import EMPTY, Lazy
+from .schemas import (
+    Animation,
+    Audio,
+    CallbackQuery,
+    Chat,
+    ChatJoinRequest,
+    ChatMemberUpdated,
+    ChatShared,
+    ChosenInlineResult,
+    Contact,
+    Dice,
+    Document,
+    ForumTopicClosed,
+    ForumTopicCreated,
+    ForumTopicEdited,
+    ForumTopicReopened,
+    Game,
+    GeneralForumTopicHidden,
+    GeneralForumTopicUnhidden,
+    InlineKeyboardMarkup,
+    InlineQuery,
+    Invoice,
+    Location,
+    MessageAutoDeleteTimerChanged,
+    MessageEntity,
+    PassportData,
+    PhotoSize,
+    Poll,
+    PollAnswer,
+    PreCheckoutQuery,
+    ProximityAlertTriggered,
+    ShippingQuery,
+    Sticker,
+    Story,
+    SuccessfulPayment,
+    User,
+    UserShared,
+    Venue,
+    Video,
+    VideoChatEnded,
+    VideoChatParticipantsInvited,
+    VideoChatScheduled,
+    VideoChatStarted,
+    VideoNote,
+    Voice,
+    WebAppData,
+    WriteAccessAllowed,
+)
+
+
+class LazyMessage(
+    Schema,
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Lazy view of [Message](#message).
+    Nested objects are kept as raw json and decoded on first access.
+    """
+    message_id: int = field()
+    """Unique message identifier inside this chat"""
+    date: int = field()
+    """Date the message was sent in Unix time"""
+    chat: Chat = field()
+    """Conversation the message belongs to"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Optional. Unique identifier of a message thread to which the message
+    belongs; for supergroups only"""
+    from_: Optional[User] = field(name='from', default=None)
+    """Optional. Sender of the message; empty for messages sent to channels.
+    For backward compatibility, the field contains a fake sender user in
+    non-channel chats, if the message was sent on behalf of a chat."""
+    sender_chat: Optional[Chat] = field(default=None)
+    """Optional. Sender of the message, sent on behalf of a chat. For
+    example, the channel itself for channel posts, the supergroup itself
+    for messages from anonymous group administrators, the linked channel
+    for messages automatically forwarded to the discussion group. For
+    backward compatibility, the field from contains a fake sender user in
+    non-channel chats, if the message was sent on behalf of a chat."""
+    forward_from: Optional[User] = field(default=None)
+    """Optional. For forwarded messages, sender of the original message"""
+    forward_from_chat: Optional[Chat] = field(default=None)
+    """Optional. For messages forwarded from channels or from anonymous
+    administrators, information about the original sender chat"""
+    forward_from_message_id: Optional[int] = field(default=None)
+    """Optional. For messages forwarded from channels, identifier of the
+    original message in the channel"""
+    forward_signature: Optional[str] = field(default=None)
+    """Optional. For forwarded messages that were originally sent in channels
+    or by an anonymous chat administrator, signature of the message sender
+    if present"""
+    forward_sender_name: Optional[str] = field(default=None)
+    """Optional. Sender's name for messages forwarded from users who disallow
+    adding a link to their account in forwarded messages"""
+    forward_date: Optional[int] = field(default=None)
+    """Optional. For forwarded messages, date the original message was sent
+    in Unix time"""
+    is_topic_message: Optional[bool] = field(default=None)
+    """Optional. True, if the message is sent to a forum topic"""
+    is_automatic_forward: Optional[bool] = field(default=None)
+    """Optional. True, if the message is a channel post that was
+    automatically forwarded to the connected discussion group"""
+    _reply_to_message: Raw = field(name="reply_to_message", default=EMPTY)
+    reply_to_message: ClassVar[Lazy[Optional[LazyMessage]]] = Lazy()
+    """Optional. For replies, the original message. Note that the Message
+    object in this field will not contain further reply_to_message fields
+    even if it itself is a reply."""
+    via_bot: Optional[User] = field(default=None)
+    """Optional. Bot through which the message was sent"""
+    edit_date: Optional[int] = field(default=None)
+    """Optional. Date the message was last edited in Unix time"""
+    has_protected_content: Optional[bool] = field(default=None)
+    """Optional. True, if the message can't be forwarded"""
+    media_group_id: Optional[str] = field(default=None)
+    """Optional. The unique identifier of a media message group this message
+    belongs to"""
+    author_signature: Optional[str] = field(default=None)
+    """Optional. Signature of the post author for messages in channels, or
+    the custom title of an anonymous group administrator"""
+    text: Optional[str] = field(default=None)
+    """Optional. For text messages, the actual UTF-8 text of the message"""
+    _entities: Raw = field(name="entities", default=EMPTY)
+    entities: ClassVar[Lazy[Optional[List[MessageEntity]]]] = Lazy()
+    """Optional. For text messages, special entities like usernames, URLs,
+    bot commands, etc. that appear in the text"""
+    _animation: Raw = field(name="animation", default=EMPTY)
+    animation: ClassVar[Lazy[Optional[Animation]]] = Lazy()
+    """Optional. Message is an animation, information about the animation.
+    For backward compatibility, when this field is set, the document field
+    will also be set"""
+    _audio: Raw = field(name="audio", default=EMPTY)
+    audio: ClassVar[Lazy[Optional[Audio]]] = Lazy()
+    """Optional. Message is an audio file, information about the file"""
+    _document: Raw = field(name="document", default=EMPTY)
+    document: ClassVar[Lazy[Optional[Document]]] = Lazy()
+    """Optional. Message is a general file, information about the file"""
+    _photo: Raw = field(name="photo", default=EMPTY)
+    photo: ClassVar[Lazy[Optional[List[PhotoSize]]]] = Lazy()
+    """Optional. Message is a photo, available sizes of the photo"""
+    _sticker: Raw = field(name="sticker", default=EMPTY)
+    sticker: ClassVar[Lazy[Optional[Sticker]]] = Lazy()
+    """Optional. Message is a sticker, information about the sticker"""
+    _story: Raw = field(name="story", default=EMPTY)
+    story: ClassVar[Lazy[Optional[Story]]] = Lazy()
+    """Optional. Message is a forwarded story"""
+    _video: Raw = field(name="video", default=EMPTY)
+    video: ClassVar[Lazy[Optional[Video]]] = Lazy()
+    """Optional. Message is a video, information about the video"""
+    _video_note: Raw = field(name="video_note", default=EMPTY)
+    video_note: ClassVar[Lazy[Optional[VideoNote]]] = Lazy()
+    """Optional. Message is a video note, information about the video message"""
+    _voice: Raw = field(name="voice", default=EMPTY)
+    voice: ClassVar[Lazy[Optional[Voice]]] = Lazy()
+    """Optional. Message is a voice message, information about the file"""
+    caption: Optional[str] = field(default=None)
+    """Optional. Caption for the animation, audio, document, photo, video or
+    voice"""
+    _caption_entities: Raw = field(name="caption_entities", default=EMPTY)
+    caption_entities: ClassVar[Lazy[Optional[List[MessageEntity]]]] = Lazy()
+    """Optional. For messages with a caption, special entities like
+    usernames, URLs, bot commands, etc. that appear in the caption"""
+    has_media_spoiler: Optional[bool] = field(default=None)
+    """Optional. True, if the message media is covered by a spoiler animation"""
+    _contact: Raw = field(name="contact", default=EMPTY)
+    contact: ClassVar[Lazy[Optional[Contact]]] = Lazy()
+    """Optional. Message is a shared contact, information about the contact"""
+    _dice: Raw = field(name="dice", default=EMPTY)
+    dice: ClassVar[Lazy[Optional[Dice]]] = Lazy()
+    """Optional. Message is a dice with random value"""
+    _game: Raw = field(name="game", default=EMPTY)
+    game: ClassVar[Lazy[Optional[Game]]] = Lazy()
+    """Optional. Message is a game, information about the game. More about
+    games »"""
+    _poll: Raw = field(name="poll", default=EMPTY)
+    poll: ClassVar[Lazy[Optional[Poll]]] = Lazy()
+    """Optional. Message is a native poll, information about the poll"""
+    _venue: Raw = field(name="venue", default=EMPTY)
+    venue: ClassVar[Lazy[Optional[Venue]]] = Lazy()
+    """Optional. Message is a venue, information about the venue. For
+    backward compatibility, when this field is set, the location field
+    will also be set"""
+    _location: Raw = field(name="location", default=EMPTY)
+    location: ClassVar[Lazy[Optional[Location]]] = Lazy()
+    """Optional. Message is a shared location, information about the location"""
+    new_chat_members: Optional[List[User]] = field(default=None)
+    """Optional. New members that were added to the group or supergroup and
+    information about them (the bot itself may be one of these members)"""
+    left_chat_member: Optional[User] = field(default=None)
+    """Optional. A member was removed from the group, information about them
+    (this member may be the bot itself)"""
+    new_chat_title: Optional[str] = field(default=None)
+    """Optional. A chat title was changed to this value"""
+    _new_chat_photo: Raw = field(name="new_chat_photo", default=EMPTY)
+    new_chat_photo: ClassVar[Lazy[Optional[List[PhotoSize]]]] = Lazy()
+    """Optional. A chat photo was change to this value"""
+    delete_chat_photo: Optional[bool] = field(default=None)
+    """Optional. Service message: the chat photo was deleted"""
+    group_chat_created: Optional[bool] = field(default=None)
+    """Optional. Service message: the group has been created"""
+    supergroup_chat_created: Optional[bool] = field(default=None)
+    """Optional. Service message: the supergroup has been created. This field
+    can't be received in a message coming through updates, because bot
+    can't be a member of a supergroup when it is created. It can only be
+    found in reply_to_message if someone replies to a very first message
+    in a directly created supergroup."""
+    channel_chat_created: Optional[bool] = field(default=None)
+    """Optional. Service message: the channel has been created. This field
+    can't be received in a message coming through updates, because bot
+    can't be a member of a channel when it is created. It can only be
+    found in reply_to_message if someone replies to a very first message
+    in a channel."""
+    _message_auto_delete_timer_changed: Raw = field(name="message_auto_delete_timer_changed", default=EMPTY)
+    message_auto_delete_timer_changed: ClassVar[Lazy[Optional[MessageAutoDeleteTimerChanged]]] = Lazy()
+    """Optional. Service message: auto-delete timer settings changed in the
+    chat"""
+    migrate_to_chat_id: Optional[int] = field(default=None)
+    """Optional. The group has been migrated to a supergroup with the
+    specified identifier. This number may have more than 32 significant
+    bits and some programming languages may have difficulty/silent defects
+    in interpreting it. But it has at most 52 significant bits, so a
+    signed 64-bit integer or double-precision float type are safe for
+    storing this identifier."""
+    migrate_from_chat_id: Optional[int] = field(default=None)
+    """Optional. The supergroup has been migrated from a group with the
+    specified identifier. This number may have more than 32 significant
+    bits and some programming languages may have difficulty/silent defects
+    in interpreting it. But it has at most 52 significant bits, so a
+    signed 64-bit integer or double-precision float type are safe for
+    storing this identifier."""
+    _pinned_message: Raw = field(name="pinned_message", default=EMPTY)
+    pinned_message: ClassVar[Lazy[Optional[LazyMessage]]] = Lazy()
+    """Optional. Specified message was pinned. Note that the Message object
+    in this field will not contain further reply_to_message fields even if
+    it is itself a reply."""
+    _invoice: Raw = field(name="invoice", default=EMPTY)
+    invoice: ClassVar[Lazy[Optional[Invoice]]] = Lazy()
+    """Optional. Message is an invoice for a payment, information about the
+    invoice. More about payments »"""
+    _successful_payment: Raw = field(name="successful_payment", default=EMPTY)
+    successful_payment: ClassVar[Lazy[Optional[SuccessfulPayment]]] = Lazy()
+    """Optional. Message is a service message about a successful payment,
+    information about the payment. More about payments »"""
+    _user_shared: Raw = field(name="user_shared", default=EMPTY)
+    user_shared: ClassVar[Lazy[Optional[UserShared]]] = Lazy()
+    """Optional. Service message: a user was shared with the bot"""
+    _chat_shared: Raw = field(name="chat_shared", default=EMPTY)
+    chat_shared: ClassVar[Lazy[Optional[ChatShared]]] = Lazy()
+    """Optional. Service message: a chat was shared with the bot"""
+    connected_website: Optional[str] = field(default=None)
+    """Optional. The domain name of the website on which the user has logged
+    in. More about Telegram Login »"""
+    _write_access_allowed: Raw = field(name="write_access_allowed", default=EMPTY)
+    write_access_allowed: ClassVar[Lazy[Optional[WriteAccessAllowed]]] = Lazy()
+    """Optional. Service message: the user allowed the bot to write messages
+    after adding it to the attachment or side menu, launching a Web App
+    from a link, or accepting an explicit request from a Web App sent by
+    the method requestWriteAccess"""
+    _passport_data: Raw = field(name="passport_data", default=EMPTY)
+    passport_data: ClassVar[Lazy[Optional[PassportData]]] = Lazy()
+    """Optional. Telegram Passport data"""
+    _proximity_alert_triggered: Raw = field(name="proximity_alert_triggered", default=EMPTY)
+    proximity_alert_triggered: ClassVar[Lazy[Optional[ProximityAlertTriggered]]] = Lazy()
+    """Optional. Service message. A user in the chat triggered another user's
+    proximity alert while sharing Live Location."""
+    _forum_topic_created: Raw = field(name="forum_topic_created", default=EMPTY)
+    forum_topic_created: ClassVar[Lazy[Optional[ForumTopicCreated]]] = Lazy()
+    """Optional. Service message: forum topic created"""
+    _forum_topic_edited: Raw = field(name="forum_topic_edited", default=EMPTY)
+    forum_topic_edited: ClassVar[Lazy[Optional[ForumTopicEdited]]] = Lazy()
+    """Optional. Service message: forum topic edited"""
+    _forum_topic_closed: Raw = field(name="forum_topic_closed", default=EMPTY)
+    forum_topic_closed: ClassVar[Lazy[Optional[ForumTopicClosed]]] = Lazy()
+    """Optional. Service message: forum topic closed"""
+    _forum_topic_reopened: Raw = field(name="forum_topic_reopened", default=EMPTY)
+    forum_topic_reopened: ClassVar[Lazy[Optional[ForumTopicReopened]]] = Lazy()
+    """Optional. Service message: forum topic reopened"""
+    _general_forum_topic_hidden: Raw = field(name="general_forum_topic_hidden", default=EMPTY)
+    general_forum_topic_hidden: ClassVar[Lazy[Optional[GeneralForumTopicHidden]]] = Lazy()
+    """Optional. Service message: the 'General' forum topic hidden"""
+    _general_forum_topic_unhidden: Raw = field(name="general_forum_topic_unhidden", default=EMPTY)
+    general_forum_topic_unhidden: ClassVar[Lazy[Optional[GeneralForumTopicUnhidden]]] = Lazy()
+    """Optional. Service message: the 'General' forum topic unhidden"""
+    _video_chat_scheduled: Raw = field(name="video_chat_scheduled", default=EMPTY)
+    video_chat_scheduled: ClassVar[Lazy[Optional[VideoChatScheduled]]] = Lazy()
+    """Optional. Service message: video chat scheduled"""
+    _video_chat_started: Raw = field(name="video_chat_started", default=EMPTY)
+    video_chat_started: ClassVar[Lazy[Optional[VideoChatStarted]]] = Lazy()
+    """Optional. Service message: video chat started"""
+    _video_chat_ended: Raw = field(name="video_chat_ended", default=EMPTY)
+    video_chat_ended: ClassVar[Lazy[Optional[VideoChatEnded]]] = Lazy()
+    """Optional. Service message: video chat ended"""
+    _video_chat_participants_invited: Raw = field(name="video_chat_participants_invited", default=EMPTY)
+    video_chat_participants_invited: ClassVar[Lazy[Optional[VideoChatParticipantsInvited]]] = Lazy()
+    """Optional. Service message: new participants invited to a video chat"""
+    _web_app_data: Raw = field(name="web_app_data", default=EMPTY)
+    web_app_data: ClassVar[Lazy[Optional[WebAppData]]] = Lazy()
+    """Optional. Service message: data sent by a Web App"""
+    _reply_markup: Raw = field(name="reply_markup", default=EMPTY)
+    reply_markup: ClassVar[Lazy[Optional[InlineKeyboardMarkup]]] = Lazy()
+    """Optional. Inline keyboard attached to the message. login_url buttons
+    are represented as ordinary url buttons."""
+
+
+
+
+class LazyUpdate(
+    Schema,
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Lazy view of [Update](#update).
+    Nested objects are kept as raw json and decoded on first access.
+    """
+    update_id: int = field()
+    """The update's unique identifier. Update identifiers start from a
+    certain positive number and increase sequentially. This ID becomes
+    especially handy if you're using webhooks, since it allows you to
+    ignore repeated updates or to restore the correct update sequence,
+    should they get out of order. If there are no new updates for at least
+    a week, then identifier of the next update will be chosen randomly
+    instead of sequentially."""
+    message: Optional[LazyMessage] = field(default=None)
+    """Optional. New incoming message of any kind - text, photo, sticker,
+    etc."""
+    edited_message: Optional[LazyMessage] = field(default=None)
+    """Optional. New version of a message that is known to the bot and was
+    edited"""
+    channel_post: Optional[LazyMessage] = field(default=None)
+    """Optional. New incoming channel post of any kind - text, photo,
+    sticker, etc."""
+    edited_channel_post: Optional[LazyMessage] = field(default=None)
+    """Optional. New version of a channel post that is known to the bot and
+    was edited"""
+    _inline_query: Raw = field(name="inline_query", default=EMPTY)
+    inline_query: ClassVar[Lazy[Optional[InlineQuery]]] = Lazy()
+    """Optional. New incoming inline query"""
+    _chosen_inline_result: Raw = field(name="chosen_inline_result", default=EMPTY)
+    chosen_inline_result: ClassVar[Lazy[Optional[ChosenInlineResult]]] = Lazy()
+    """Optional. The result of an inline query that was chosen by a user and
+    sent to their chat partner. Please see our documentation on the
+    feedback collecting for details on how to enable these updates for
+    your bot."""
+    _callback_query: Raw = field(name="callback_query", default=EMPTY)
+    callback_query: ClassVar[Lazy[Optional[CallbackQuery]]] = Lazy()
+    """Optional. New incoming callback query"""
+    _shipping_query: Raw = field(name="shipping_query", default=EMPTY)
+    shipping_query: ClassVar[Lazy[Optional[ShippingQuery]]] = Lazy()
+    """Optional. New incoming shipping query. Only for invoices with flexible
+    price"""
+    _pre_checkout_query: Raw = field(name="pre_checkout_query", default=EMPTY)
+    pre_checkout_query: ClassVar[Lazy[Optional[PreCheckoutQuery]]] = Lazy()
+    """Optional. New incoming pre-checkout query. Contains full information
+    about checkout"""
+    _poll: Raw = field(name="poll", default=EMPTY)
+    poll: ClassVar[Lazy[Optional[Poll]]] = Lazy()
+    """Optional. New poll state. Bots receive only updates about stopped
+    polls and polls, which are sent by the bot"""
+    _poll_answer: Raw = field(name="poll_answer", default=EMPTY)
+    poll_answer: ClassVar[Lazy[Optional[PollAnswer]]] = Lazy()
+    """Optional. A user changed their answer in a non-anonymous poll. Bots
+    receive new votes only in polls that were sent by the bot itself."""
+    _my_chat_member: Raw = field(name="my_chat_member", default=EMPTY)
+    my_chat_member: ClassVar[Lazy[Optional[ChatMemberUpdated]]] = Lazy()
+    """Optional. The bot's chat member status was updated in a chat. For
+    private chats, this update is received only when the bot is blocked or
+    unblocked by the user."""
+    _chat_member: Raw = field(name="chat_member", default=EMPTY)
+    chat_member: ClassVar[Lazy[Optional[ChatMemberUpdated]]] = Lazy()
+    """Optional. A chat member's status was updated in a chat. The bot must
+    be an administrator in the chat and must explicitly specify
+    “chat_member” in the list of allowed_updates to receive these updates."""
+    _chat_join_request: Raw = field(name="chat_join_request", default=EMPTY)
+    chat_join_request: ClassVar[Lazy[Optional[ChatJoinRequest]]] = Lazy()
+    """Optional. A request to join the chat has been sent. The bot must have
+    the can_invite_users administrator right in the chat to receive these
+    updates."""
+
+
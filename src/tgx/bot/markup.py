@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import typing
+from typing import Type, Union
+
+from msgspec import Raw
+
+from .codec import encode, get_decoder
+from .schemas import (
+    ForceReply,
+    InlineKeyboardMarkup,
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+)
+
+
+Markup = Union[
+    InlineKeyboardMarkup,
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+    ForceReply,
+]
+M = typing.TypeVar(
+    "M",
+    InlineKeyboardMarkup,
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+    ForceReply,
+)
+
+
+def freeze(markup: Markup) -> Raw:
+    """
+    Encode a static `markup` once. The result is accepted as the
+    `reply_markup` of any path and embedded verbatim into its json, so a
+    menu sent over and over is never encoded again.
+    """
+    return Raw(encode(markup))
+
+
+def thaw(raw: Raw, type: Type[M]) -> M:
+    """Decode a frozen markup back into `type`."""
+    return get_decoder(type).decode(raw)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import secrets
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Union
+
+import msgspec
+
+from ._base import JSON_HEADERS, Path, Request
+from .files import CHUNK_SIZE, InputFile
+
+
+Part = Union[bytes, InputFile]
+
+
+class FilesFound(Exception):
+    pass
+
+
+def reject_files(obj: Any) -> Any:
+    if isinstance(obj, InputFile):
+        raise FilesFound
+    raise TypeError(f"Encoding objects of type {type(obj)} is unsupported")
+
+
+json_encoder = msgspec.json.Encoder(enc_hook=reject_files)
+
+
+def quote(name: str) -> str:
+    """Escape a name for a Content-Disposition parameter (RFC 7578)."""
+    return (
+        name.replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+class Form:
+    """
+    multipart/form-data body of a Path. InputFile values nested in other
+    fields (e.g. InputMedia of sendMediaGroup) are replaced by
+    `attach://<name>` references, and every distinct file is added as a
+    single part however many times it is referenced.
+    """
+
+    def __init__(self) -> None:
+        self.boundary = secrets.token_hex(16)
+        self.parts: List[Part] = []
+        self.attached: Dict[Hashable, str] = {}
+        self.encoder = msgspec.json.Encoder(enc_hook=self.attach)
+
+    def add_field(self, name: str, value: bytes) -> None:
+        self.parts.append((
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        ).encode() + value + b"\r\n")
+
+    def add_file(self, name: str, file: InputFile) -> None:
+        self.parts.append((
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"; '
+            f'filename="{quote(file.filename)}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode())
+        self.parts.append(file)
+        self.parts.append(b"\r\n")
+
+    def attach(self, obj: Any) -> str:
+        if not isinstance(obj, InputFile):
+            raise TypeError(f"Encoding objects of type {type(obj)} is unsupported")
+        name = self.attached.get(obj.key)
+        if name is None:
+            name = self.attached[obj.key] = f"file{len(self.attached)}"
+            self.add_file(name, obj)
+        return f"attach://{name}"
+
+    def add(self, name: str, value: Any) -> None:
+        if isinstance(value, InputFile):
+            self.add_file(name, value)
+        elif isinstance(value, str):
+            self.add_field(name, value.encode())
+        else:
+            self.add_field(name, self.encoder.encode(value))
+
+    def close(self) -> None:
+        self.parts.append(f"--{self.boundary}--\r\n".encode())
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> Optional[int]:
+        total = 0
+        for part in self.parts:
+            size = len(part) if isinstance(part, bytes) else part.size
+            if size is None:
+                return None
+            total += size
+        return total
+
+    async def stream(self, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        for part in self.parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                async for chunk in part.chunks(chunk_size):
+                    yield chunk
+
+
+def build_multipart(path: Path[Any], url: str) -> Request:
+    """
+    Build a plain json request for `path`, or a streamed
+    multipart/form-data one if any of its fields holds an InputFile.
+    """
+    try:
+        content = json_encoder.encode(path)
+    except FilesFound:
+        pass
+    else:
+        return Request(url=url, content=content, headers=JSON_HEADERS)
+    form = Form()
+    names = zip(path.__struct_fields__, path.__struct_encode_fields__)
+    for attr, name in names:
+        value = getattr(path, attr)
+        if value is not None:
+            form.add(name, value)
+    form.close()
+    headers = {"Content-Type": form.content_type}
+    length = form.content_length
+    if length is not None:
+        headers["Content-Length"] = str(length)
+    return Request(url=url, content=form.stream(), headers=headers)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from ._base import Handler, Wrapper
+from .dispatcher import UPDATE_TYPES
+
+
+Item = Tuple[Any, "asyncio.Future[Any]"]
+
+CHAT_PATHS: Dict[str, Tuple[str, ...]] = {
+    "message": ("chat", "id"),
+    "edited_message": ("chat", "id"),
+    "channel_post": ("chat", "id"),
+    "edited_channel_post": ("chat", "id"),
+    "inline_query": ("from_", "id"),
+    "chosen_inline_result": ("from_", "id"),
+    "callback_query": ("from_", "id"),
+    "shipping_query": ("from_", "id"),
+    "pre_checkout_query": ("from_", "id"),
+    "poll": ("id",),
+    "poll_answer": ("user", "id"),
+    "my_chat_member": ("chat", "id"),
+    "chat_member": ("chat", "id"),
+    "chat_join_request": ("chat", "id"),
+}
+"""Attribute path of the chat (or user) id of each update type"""
+
+
+def chat_key(update: Any) -> Optional[Hashable]:
+    """Id of the chat of `update`, of the chat of the message for queries."""
+    for name in UPDATE_TYPES:
+        event = getattr(update, name)
+        if event is None:
+            continue
+        if name == "callback_query" and event.message is not None:
+            return event.message.chat.id
+        for attr in CHAT_PATHS[name]:
+            event = getattr(event, attr, None)
+        return event
+    return None
+
+
+class Lane:
+    """
+    Queue of the updates of a chat and the task handling them. `pending`
+    counts the updates of the chat not handled yet, including those
+    still waiting for room in the queue, so the lane is dropped only when
+    nothing is left to come.
+    """
+
+    __slots__ = ("queue", "pending", "worker", "closed")
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[Item] = asyncio.Queue(maxsize)
+        self.pending = 0
+        self.worker: Optional[asyncio.Future[None]] = None
+        self.closed = False
+
+
+class OrderedHandler(Wrapper):
+    """
+    Runs `handler` concurrently for updates of different chats and in
+    order of arrival for updates of the same one, so the state of a
+    conversation is never touched by two updates at once. Each active
+    chat has its own queue of at most `max_backlog` updates, a further
+    update waits for room in the queue. Updates without a `key` are
+    handled right away.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        *,
+        key: Callable[[Any], Optional[Hashable]] = chat_key,
+        max_backlog: int = 100,
+    ) -> None:
+        self.handler = handler
+        self.key = key
+        self.max_backlog = max_backlog
+        self.lanes: Dict[Hashable, Lane] = {}
+        self.workers: Set[asyncio.Future[None]] = set()
+
+    async def __call__(self, update: Any) -> Any:
+        key = self.key(update)
+        if key is None:
+            return await self.handler(update)
+        lane = self.lanes.get(key)
+        if lane is None:
+            lane = self.lanes[key] = Lane(self.max_backlog)
+            lane.worker = asyncio.ensure_future(self.worker(key, lane))
+            self.workers.add(lane.worker)
+            lane.worker.add_done_callback(self.workers.discard)
+        lane.pending += 1
+        future = asyncio.get_running_loop().create_future()
+        try:
+            await lane.queue.put((update, future))
+        except BaseException:
+            lane.pending -= 1
+            if not lane.pending and lane.worker is not None:
+                lane.worker.cancel()
+            raise
+        if lane.closed:
+            future.cancel()
+        return await future
+
+    async def worker(self, key: Hashable, lane: Lane) -> None:
+        """Handle the updates of a chat until none are pending."""
+        future = None
+        try:
+            while True:
+                update, future = await lane.queue.get()
+                try:
+                    result = await self.handler(update)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                lane.pending -= 1
+                if not lane.pending:
+                    return
+        finally:
+            # Also reached if the worker is cancelled, the callers of the
+            # updates left are cancelled instead of waiting forever.
+            lane.closed = True
+            if self.lanes.get(key) is lane:
+                del self.lanes[key]
+            if future is not None and not future.done():
+                future.cancel()
+            while not lane.queue.empty():
+                _, future = lane.queue.get_nowait()
+                future.cancel()
@@ -0,0 +1,4750 @@
+from __future__ import annotations
+from typing import ClassVar, List, Optional, Union
+
+from msgspec import Raw
+
+from ._base import JSON_HEADERS, Path, Request, field
+from .codec import Buffer, encode, result_decoder
+from .multipart import build_multipart
+from .schemas import (
+    BotCommand,
+    BotCommandScope,
+    BotDescription,
+    BotName,
+    BotShortDescription,
+    Chat,
+    ChatAdministratorRights,
+    ChatInviteLink,
+    ChatMember,
+    ChatPermissions,
+    File,
+    ForceReply,
+    ForumTopic,
+    GameHighScore,
+    InlineKeyboardMarkup,
+    InlineQueryResult,
+    InlineQueryResultsButton,
+    InputFile,
+    InputMedia,
+    InputMediaAudio,
+    InputMediaDocument,
+    InputMediaPhoto,
+    InputMediaVideo,
+    InputSticker,
+    LabeledPrice,
+    MaskPosition,
+    MenuButton,
+    Message,
+    MessageEntity,
+    MessageId,
+    PassportElementError,
+    Poll,
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+    SentWebAppMessage,
+    ShippingOption,
+    Sticker,
+    StickerSet,
+    Update,
+    User,
+    UserProfilePhotos,
+    WebhookInfo,
+)
+
+
+class GetUpdates(
+    Path[List[Update]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to receive incoming updates using long polling
+    ([wiki](https://en.wikipedia.org/wiki/Push_technology#Long_polling)).
+    Returns an Array of [Update](#update) objects.
+    """
+    offset: Optional[int] = field(default=None)
+    """Identifier of the first update to be returned. Must be greater by one
+    than the highest among the identifiers of previously received updates.
+    By default, updates starting with the earliest unconfirmed update are
+    returned. An update is considered confirmed as soon as getUpdates is
+    called with an offset higher than its update_id. The negative offset
+    can be specified to retrieve updates starting from -offset update from
+    the end of the updates queue. All previous updates will be forgotten."""
+    limit: Optional[int] = field(default=None)
+    """Limits the number of updates to be retrieved. Values between 1-100 are
+    accepted. Defaults to 100."""
+    timeout: Optional[int] = field(default=None)
+    """Timeout in seconds for long polling. Defaults to 0, i.e. usual short
+    polling. Should be positive, short polling should be used for testing
+    purposes only."""
+    allowed_updates: Optional[List[str]] = field(default=None)
+    """A JSON-serialized list of the update types you want your bot to
+    receive. For example, specify [“message”, “edited_channel_post”,
+    “callback_query”] to only receive updates of these types. See Update
+    for a complete list of available update types. Specify an empty list
+    to receive all update types except chat_member (default). If not
+    specified, the previous setting will be used.
+    
+    Please note that this parameter doesn't affect updates created before
+    the call to the getUpdates, so unwanted updates may be received for a
+    short period of time."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getUpdates",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> List[Update]:
+        return _GetUpdatesResult.decode(data).unwrap()
+
+
+_GetUpdatesResult = result_decoder(List[Update])
+
+
+
+
+class SetWebhook(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to specify a URL and receive incoming updates via an
+    outgoing webhook. Whenever there is an update for the bot, we will
+    send an HTTPS POST request to the specified URL, containing a JSON-
+    serialized [Update](#update). In case of an unsuccessful request, we
+    will give up after a reasonable amount of attempts. Returns *True* on
+    success.
+    
+    If you'd like to make sure that the webhook was set by you, you can
+    specify secret data in the parameter *secret\_token*. If specified,
+    the request will contain a header “X-Telegram-Bot-Api-Secret-Token”
+    with the secret token as content.
+    """
+    url: str = field()
+    """HTTPS URL to send updates to. Use an empty string to remove webhook
+    integration"""
+    certificate: Optional[InputFile] = field(default=None)
+    """Upload your public key certificate so that the root certificate in use
+    can be checked. See our self-signed guide for details."""
+    ip_address: Optional[str] = field(default=None)
+    """The fixed IP address which will be used to send webhook requests
+    instead of the IP address resolved through DNS"""
+    max_connections: Optional[int] = field(default=None)
+    """The maximum allowed number of simultaneous HTTPS connections to the
+    webhook for update delivery, 1-100. Defaults to 40. Use lower values
+    to limit the load on your bot's server, and higher values to increase
+    your bot's throughput."""
+    allowed_updates: Optional[List[str]] = field(default=None)
+    """A JSON-serialized list of the update types you want your bot to
+    receive. For example, specify [“message”, “edited_channel_post”,
+    “callback_query”] to only receive updates of these types. See Update
+    for a complete list of available update types. Specify an empty list
+    to receive all update types except chat_member (default). If not
+    specified, the previous setting will be used.
+    Please note that this parameter doesn't affect updates created before
+    the call to the setWebhook, so unwanted updates may be received for a
+    short period of time."""
+    drop_pending_updates: Optional[bool] = field(default=None)
+    """Pass True to drop all pending updates"""
+    secret_token: Optional[str] = field(default=None)
+    """A secret token to be sent in a header “X-Telegram-Bot-Api-Secret-
+    Token” in every webhook request, 1-256 characters. Only characters
+    A-Z, a-z, 0-9, _ and - are allowed. The header is useful to ensure
+    that the request comes from a webhook set by you."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/setWebhook")
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetWebhookResult.decode(data).unwrap()
+
+
+_SetWebhookResult = result_decoder(bool)
+
+
+
+
+class DeleteWebhook(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to remove webhook integration if you decide to switch
+    back to [getUpdates](#getupdates). Returns *True* on success.
+    """
+    drop_pending_updates: Optional[bool] = field(default=None)
+    """Pass True to drop all pending updates"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteWebhook",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteWebhookResult.decode(data).unwrap()
+
+
+_DeleteWebhookResult = result_decoder(bool)
+
+
+
+
+class GetWebhookInfo(
+    Path[WebhookInfo],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get current webhook status. Requires no parameters.
+    On success, returns a [WebhookInfo](#webhookinfo) object. If the bot
+    is using [getUpdates](#getupdates), will return an object with the
+    *url* field empty.
+    """
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getWebhookInfo",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> WebhookInfo:
+        return _GetWebhookInfoResult.decode(data).unwrap()
+
+
+_GetWebhookInfoResult = result_decoder(WebhookInfo)
+
+
+
+
+class GetMe(
+    Path[User],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    A simple method for testing your bot's authentication token. Requires
+    no parameters. Returns basic information about the bot in form of a
+    [User](#user) object.
+    """
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getMe",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> User:
+        return _GetMeResult.decode(data).unwrap()
+
+
+_GetMeResult = result_decoder(User)
+
+
+
+
+class LogOut(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to log out from the cloud Bot API server before
+    launching the bot locally. You **must** log out the bot before running
+    it locally, otherwise there is no guarantee that the bot will receive
+    updates. After a successful call, you can immediately log in on a
+    local server, but will not be able to log in back to the cloud Bot API
+    server for 10 minutes. Returns *True* on success. Requires no
+    parameters.
+    """
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/logOut",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _LogOutResult.decode(data).unwrap()
+
+
+_LogOutResult = result_decoder(bool)
+
+
+
+
+class Close(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to close the bot instance before moving it from one
+    local server to another. You need to delete the webhook before calling
+    this method to ensure that the bot isn't launched again after server
+    restart. The method will return error 429 in the first 10 minutes
+    after the bot is launched. Returns *True* on success. Requires no
+    parameters.
+    """
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/close",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _CloseResult.decode(data).unwrap()
+
+
+_CloseResult = result_decoder(bool)
+
+
+
+
+class SendMessage(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send text messages. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    text: str = field()
+    """Text of the message to be sent, 1-4096 characters after entities
+    parsing"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the message text. See formatting options
+    for more details."""
+    entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in message
+    text, which can be specified instead of parse_mode"""
+    disable_web_page_preview: Optional[bool] = field(default=None)
+    """Disables link previews for links in this message"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendMessage",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendMessageResult.decode(data).unwrap()
+
+
+_SendMessageResult = result_decoder(Message)
+
+
+
+
+class ForwardMessage(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to forward messages of any kind. Service messages
+    can't be forwarded. On success, the sent [Message](#message) is
+    returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    from_chat_id: Union[int, str] = field()
+    """Unique identifier for the chat where the original message was sent (or
+    channel username in the format @channelusername)"""
+    message_id: int = field()
+    """Message identifier in the chat specified in from_chat_id"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the forwarded message from forwarding and
+    saving"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/forwardMessage",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _ForwardMessageResult.decode(data).unwrap()
+
+
+_ForwardMessageResult = result_decoder(Message)
+
+
+
+
+class CopyMessage(
+    Path[MessageId],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to copy messages of any kind. Service messages and
+    invoice messages can't be copied. A quiz [poll](#poll) can be copied
+    only if the value of the field *correct\_option\_id* is known to the
+    bot. The method is analogous to the method
+    [forwardMessage](#forwardmessage), but the copied message doesn't have
+    a link to the original message. Returns the [MessageId](#messageid) of
+    the sent message on success.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    from_chat_id: Union[int, str] = field()
+    """Unique identifier for the chat where the original message was sent (or
+    channel username in the format @channelusername)"""
+    message_id: int = field()
+    """Message identifier in the chat specified in from_chat_id"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    caption: Optional[str] = field(default=None)
+    """New caption for media, 0-1024 characters after entities parsing. If
+    not specified, the original caption is kept"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the new caption. See formatting options
+    for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the new
+    caption, which can be specified instead of parse_mode"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/copyMessage",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> MessageId:
+        return _CopyMessageResult.decode(data).unwrap()
+
+
+_CopyMessageResult = result_decoder(MessageId)
+
+
+
+
+class SendPhoto(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send photos. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    photo: Union[InputFile, str] = field()
+    """Photo to send. Pass a file_id as String to send a photo that exists on
+    the Telegram servers (recommended), pass an HTTP URL as a String for
+    Telegram to get a photo from the Internet, or upload a new photo using
+    multipart/form-data. The photo must be at most 10 MB in size. The
+    photo's width and height must not exceed 10000 in total. Width and
+    height ratio must be at most 20. More information on Sending Files »"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    caption: Optional[str] = field(default=None)
+    """Photo caption (may also be used when resending photos by file_id),
+    0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the photo caption. See formatting options
+    for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    has_spoiler: Optional[bool] = field(default=None)
+    """Pass True if the photo needs to be covered with a spoiler animation"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendPhoto")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendPhotoResult.decode(data).unwrap()
+
+
+_SendPhotoResult = result_decoder(Message)
+
+
+
+
+class SendAudio(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send audio files, if you want Telegram clients to
+    display them in the music player. Your audio must be in the .MP3 or
+    .M4A format. On success, the sent [Message](#message) is returned.
+    Bots can currently send audio files of up to 50 MB in size, this limit
+    may be changed in the future.
+    
+    For sending voice messages, use the [sendVoice](#sendvoice) method
+    instead.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    audio: Union[InputFile, str] = field()
+    """Audio file to send. Pass a file_id as String to send an audio file
+    that exists on the Telegram servers (recommended), pass an HTTP URL as
+    a String for Telegram to get an audio file from the Internet, or
+    upload a new one using multipart/form-data. More information on
+    Sending Files »"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    caption: Optional[str] = field(default=None)
+    """Audio caption, 0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the audio caption. See formatting options
+    for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    duration: Optional[int] = field(default=None)
+    """Duration of the audio in seconds"""
+    performer: Optional[str] = field(default=None)
+    """Performer"""
+    title: Optional[str] = field(default=None)
+    """Track name"""
+    thumbnail: Union[InputFile, str, None] = field(default=None)
+    """Thumbnail of the file sent; can be ignored if thumbnail generation for
+    the file is supported server-side. The thumbnail should be in JPEG
+    format and less than 200 kB in size. A thumbnail's width and height
+    should not exceed 320. Ignored if the file is not uploaded using
+    multipart/form-data. Thumbnails can't be reused and can be only
+    uploaded as a new file, so you can pass “attach://<file_attach_name>”
+    if the thumbnail was uploaded using multipart/form-data under
+    <file_attach_name>. More information on Sending Files »"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendAudio")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendAudioResult.decode(data).unwrap()
+
+
+_SendAudioResult = result_decoder(Message)
+
+
+
+
+class SendDocument(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send general files. On success, the sent
+    [Message](#message) is returned. Bots can currently send files of any
+    type of up to 50 MB in size, this limit may be changed in the future.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    document: Union[InputFile, str] = field()
+    """File to send. Pass a file_id as String to send a file that exists on
+    the Telegram servers (recommended), pass an HTTP URL as a String for
+    Telegram to get a file from the Internet, or upload a new one using
+    multipart/form-data. More information on Sending Files »"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    thumbnail: Union[InputFile, str, None] = field(default=None)
+    """Thumbnail of the file sent; can be ignored if thumbnail generation for
+    the file is supported server-side. The thumbnail should be in JPEG
+    format and less than 200 kB in size. A thumbnail's width and height
+    should not exceed 320. Ignored if the file is not uploaded using
+    multipart/form-data. Thumbnails can't be reused and can be only
+    uploaded as a new file, so you can pass “attach://<file_attach_name>”
+    if the thumbnail was uploaded using multipart/form-data under
+    <file_attach_name>. More information on Sending Files »"""
+    caption: Optional[str] = field(default=None)
+    """Document caption (may also be used when resending documents by
+    file_id), 0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the document caption. See formatting
+    options for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    disable_content_type_detection: Optional[bool] = field(default=None)
+    """Disables automatic server-side content type detection for files
+    uploaded using multipart/form-data"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendDocument")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendDocumentResult.decode(data).unwrap()
+
+
+_SendDocumentResult = result_decoder(Message)
+
+
+
+
+class SendVideo(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send video files, Telegram clients support MPEG4
+    videos (other formats may be sent as [Document](#document)). On
+    success, the sent [Message](#message) is returned. Bots can currently
+    send video files of up to 50 MB in size, this limit may be changed in
+    the future.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    video: Union[InputFile, str] = field()
+    """Video to send. Pass a file_id as String to send a video that exists on
+    the Telegram servers (recommended), pass an HTTP URL as a String for
+    Telegram to get a video from the Internet, or upload a new video using
+    multipart/form-data. More information on Sending Files »"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    duration: Optional[int] = field(default=None)
+    """Duration of sent video in seconds"""
+    width: Optional[int] = field(default=None)
+    """Video width"""
+    height: Optional[int] = field(default=None)
+    """Video height"""
+    thumbnail: Union[InputFile, str, None] = field(default=None)
+    """Thumbnail of the file sent; can be ignored if thumbnail generation for
+    the file is supported server-side. The thumbnail should be in JPEG
+    format and less than 200 kB in size. A thumbnail's width and height
+    should not exceed 320. Ignored if the file is not uploaded using
+    multipart/form-data. Thumbnails can't be reused and can be only
+    uploaded as a new file, so you can pass “attach://<file_attach_name>”
+    if the thumbnail was uploaded using multipart/form-data under
+    <file_attach_name>. More information on Sending Files »"""
+    caption: Optional[str] = field(default=None)
+    """Video caption (may also be used when resending videos by file_id),
+    0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the video caption. See formatting options
+    for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    has_spoiler: Optional[bool] = field(default=None)
+    """Pass True if the video needs to be covered with a spoiler animation"""
+    supports_streaming: Optional[bool] = field(default=None)
+    """Pass True if the uploaded video is suitable for streaming"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendVideo")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendVideoResult.decode(data).unwrap()
+
+
+_SendVideoResult = result_decoder(Message)
+
+
+
+
+class SendAnimation(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send animation files (GIF or H.264/MPEG-4 AVC video
+    without sound). On success, the sent [Message](#message) is returned.
+    Bots can currently send animation files of up to 50 MB in size, this
+    limit may be changed in the future.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    animation: Union[InputFile, str] = field()
+    """Animation to send. Pass a file_id as String to send an animation that
+    exists on the Telegram servers (recommended), pass an HTTP URL as a
+    String for Telegram to get an animation from the Internet, or upload a
+    new animation using multipart/form-data. More information on Sending
+    Files »"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    duration: Optional[int] = field(default=None)
+    """Duration of sent animation in seconds"""
+    width: Optional[int] = field(default=None)
+    """Animation width"""
+    height: Optional[int] = field(default=None)
+    """Animation height"""
+    thumbnail: Union[InputFile, str, None] = field(default=None)
+    """Thumbnail of the file sent; can be ignored if thumbnail generation for
+    the file is supported server-side. The thumbnail should be in JPEG
+    format and less than 200 kB in size. A thumbnail's width and height
+    should not exceed 320. Ignored if the file is not uploaded using
+    multipart/form-data. Thumbnails can't be reused and can be only
+    uploaded as a new file, so you can pass “attach://<file_attach_name>”
+    if the thumbnail was uploaded using multipart/form-data under
+    <file_attach_name>. More information on Sending Files »"""
+    caption: Optional[str] = field(default=None)
+    """Animation caption (may also be used when resending animation by
+    file_id), 0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the animation caption. See formatting
+    options for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    has_spoiler: Optional[bool] = field(default=None)
+    """Pass True if the animation needs to be covered with a spoiler
+    animation"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendAnimation")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendAnimationResult.decode(data).unwrap()
+
+
+_SendAnimationResult = result_decoder(Message)
+
+
+
+
+class SendVoice(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send audio files, if you want Telegram clients to
+    display the file as a playable voice message. For this to work, your
+    audio must be in an .OGG file encoded with OPUS (other formats may be
+    sent as [Audio](#audio) or [Document](#document)). On success, the
+    sent [Message](#message) is returned. Bots can currently send voice
+    messages of up to 50 MB in size, this limit may be changed in the
+    future.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    voice: Union[InputFile, str] = field()
+    """Audio file to send. Pass a file_id as String to send a file that
+    exists on the Telegram servers (recommended), pass an HTTP URL as a
+    String for Telegram to get a file from the Internet, or upload a new
+    one using multipart/form-data. More information on Sending Files »"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    caption: Optional[str] = field(default=None)
+    """Voice message caption, 0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the voice message caption. See formatting
+    options for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    duration: Optional[int] = field(default=None)
+    """Duration of the voice message in seconds"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendVoice")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendVoiceResult.decode(data).unwrap()
+
+
+_SendVoiceResult = result_decoder(Message)
+
+
+
+
+class SendVideoNote(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    As of [v.4.0](https://telegram.org/blog/video-messages-and-telescope),
+    Telegram clients support rounded square MPEG4 videos of up to 1 minute
+    long. Use this method to send video messages. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    video_note: Union[InputFile, str] = field()
+    """Video note to send. Pass a file_id as String to send a video note that
+    exists on the Telegram servers (recommended) or upload a new video
+    using multipart/form-data. More information on Sending Files ».
+    Sending video notes by a URL is currently unsupported"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    duration: Optional[int] = field(default=None)
+    """Duration of sent video in seconds"""
+    length: Optional[int] = field(default=None)
+    """Video width and height, i.e. diameter of the video message"""
+    thumbnail: Union[InputFile, str, None] = field(default=None)
+    """Thumbnail of the file sent; can be ignored if thumbnail generation for
+    the file is supported server-side. The thumbnail should be in JPEG
+    format and less than 200 kB in size. A thumbnail's width and height
+    should not exceed 320. Ignored if the file is not uploaded using
+    multipart/form-data. Thumbnails can't be reused and can be only
+    uploaded as a new file, so you can pass “attach://<file_attach_name>”
+    if the thumbnail was uploaded using multipart/form-data under
+    <file_attach_name>. More information on Sending Files »"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendVideoNote")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendVideoNoteResult.decode(data).unwrap()
+
+
+_SendVideoNoteResult = result_decoder(Message)
+
+
+
+
+class SendMediaGroup(
+    Path[List[Message]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send a group of photos, videos, documents or audios
+    as an album. Documents and audio files can be only grouped in an album
+    with messages of the same type. On success, an array of
+    [Messages](#message) that were sent is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    media: List[Union[InputMediaAudio, InputMediaDocument, InputMediaPhoto, InputMediaVideo]] = field()
+    """A JSON-serialized array describing messages to be sent, must include
+    2-10 items"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends messages silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent messages from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the messages are a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendMediaGroup")
+
+    def build_result(self, data: Buffer) -> List[Message]:
+        return _SendMediaGroupResult.decode(data).unwrap()
+
+
+_SendMediaGroupResult = result_decoder(List[Message])
+
+
+
+
+class SendLocation(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send point on the map. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    latitude: float = field()
+    """Latitude of the location"""
+    longitude: float = field()
+    """Longitude of the location"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    horizontal_accuracy: Optional[float] = field(default=None)
+    """The radius of uncertainty for the location, measured in meters; 0-1500"""
+    live_period: Optional[int] = field(default=None)
+    """Period in seconds for which the location will be updated (see Live
+    Locations, should be between 60 and 86400."""
+    heading: Optional[int] = field(default=None)
+    """For live locations, a direction in which the user is moving, in
+    degrees. Must be between 1 and 360 if specified."""
+    proximity_alert_radius: Optional[int] = field(default=None)
+    """For live locations, a maximum distance for proximity alerts about
+    approaching another chat member, in meters. Must be between 1 and
+    100000 if specified."""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendLocation",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendLocationResult.decode(data).unwrap()
+
+
+_SendLocationResult = result_decoder(Message)
+
+
+
+
+class SendVenue(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send information about a venue. On success, the
+    sent [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    latitude: float = field()
+    """Latitude of the venue"""
+    longitude: float = field()
+    """Longitude of the venue"""
+    title: str = field()
+    """Name of the venue"""
+    address: str = field()
+    """Address of the venue"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    foursquare_id: Optional[str] = field(default=None)
+    """Foursquare identifier of the venue"""
+    foursquare_type: Optional[str] = field(default=None)
+    """Foursquare type of the venue, if known. (For example,
+    “arts_entertainment/default”, “arts_entertainment/aquarium” or
+    “food/icecream”.)"""
+    google_place_id: Optional[str] = field(default=None)
+    """Google Places identifier of the venue"""
+    google_place_type: Optional[str] = field(default=None)
+    """Google Places type of the venue. (See supported types.)"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendVenue",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendVenueResult.decode(data).unwrap()
+
+
+_SendVenueResult = result_decoder(Message)
+
+
+
+
+class SendContact(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send phone contacts. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    phone_number: str = field()
+    """Contact's phone number"""
+    first_name: str = field()
+    """Contact's first name"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    last_name: Optional[str] = field(default=None)
+    """Contact's last name"""
+    vcard: Optional[str] = field(default=None)
+    """Additional data about the contact in the form of a vCard, 0-2048 bytes"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendContact",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendContactResult.decode(data).unwrap()
+
+
+_SendContactResult = result_decoder(Message)
+
+
+
+
+class SendPoll(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send a native poll. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    question: str = field()
+    """Poll question, 1-300 characters"""
+    options: List[str] = field()
+    """A JSON-serialized list of answer options, 2-10 strings 1-100
+    characters each"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    is_anonymous: Optional[bool] = field(default=None)
+    """True, if the poll needs to be anonymous, defaults to True"""
+    type: Optional[str] = field(default=None)
+    """Poll type, “quiz” or “regular”, defaults to “regular”"""
+    allows_multiple_answers: Optional[bool] = field(default=None)
+    """True, if the poll allows multiple answers, ignored for polls in quiz
+    mode, defaults to False"""
+    correct_option_id: Optional[int] = field(default=None)
+    """0-based identifier of the correct answer option, required for polls in
+    quiz mode"""
+    explanation: Optional[str] = field(default=None)
+    """Text that is shown when a user chooses an incorrect answer or taps on
+    the lamp icon in a quiz-style poll, 0-200 characters with at most 2
+    line feeds after entities parsing"""
+    explanation_parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the explanation. See formatting options
+    for more details."""
+    explanation_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the poll
+    explanation, which can be specified instead of parse_mode"""
+    open_period: Optional[int] = field(default=None)
+    """Amount of time in seconds the poll will be active after creation,
+    5-600. Can't be used together with close_date."""
+    close_date: Optional[int] = field(default=None)
+    """Point in time (Unix timestamp) when the poll will be automatically
+    closed. Must be at least 5 and no more than 600 seconds in the future.
+    Can't be used together with open_period."""
+    is_closed: Optional[bool] = field(default=None)
+    """Pass True if the poll needs to be immediately closed. This can be
+    useful for poll preview."""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendPoll",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendPollResult.decode(data).unwrap()
+
+
+_SendPollResult = result_decoder(Message)
+
+
+
+
+class SendDice(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send an animated emoji that will display a random
+    value. On success, the sent [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    emoji: Optional[str] = field(default=None)
+    """Emoji on which the dice throw animation is based. Currently, must be
+    one of “”, “”, “”, “”, “”, or “”. Dice can have values 1-6 for “”, “”
+    and “”, values 1-5 for “” and “”, and values 1-64 for “”. Defaults to
+    “”"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendDice",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendDiceResult.decode(data).unwrap()
+
+
+_SendDiceResult = result_decoder(Message)
+
+
+
+
+class SendChatAction(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method when you need to tell the user that something is
+    happening on the bot's side. The status is set for 5 seconds or less
+    (when a message arrives from your bot, Telegram clients clear its
+    typing status). Returns *True* on success.
+    
+    We only recommend using this method when a response from the bot will
+    take a **noticeable** amount of time to arrive.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    action: str = field()
+    """Type of action to broadcast. Choose one, depending on what the user is
+    about to receive: typing for text messages, upload_photo for photos,
+    record_video or upload_video for videos, record_voice or upload_voice
+    for voice notes, upload_document for general files, choose_sticker for
+    stickers, find_location for location data, record_video_note or
+    upload_video_note for video notes."""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread; supergroups only"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendChatAction",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SendChatActionResult.decode(data).unwrap()
+
+
+_SendChatActionResult = result_decoder(bool)
+
+
+
+
+class GetUserProfilePhotos(
+    Path[UserProfilePhotos],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get a list of profile pictures for a user. Returns
+    a [UserProfilePhotos](#userprofilephotos) object.
+    """
+    user_id: int = field()
+    """Unique identifier of the target user"""
+    offset: Optional[int] = field(default=None)
+    """Sequential number of the first photo to be returned. By default, all
+    photos are returned."""
+    limit: Optional[int] = field(default=None)
+    """Limits the number of photos to be retrieved. Values between 1-100 are
+    accepted. Defaults to 100."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getUserProfilePhotos",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> UserProfilePhotos:
+        return _GetUserProfilePhotosResult.decode(data).unwrap()
+
+
+_GetUserProfilePhotosResult = result_decoder(UserProfilePhotos)
+
+
+
+
+class GetFile(
+    Path[File],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get basic information about a file and prepare it
+    for downloading. For the moment, bots can download files of up to 20MB
+    in size. On success, a [File](#file) object is returned. The file can
+    then be downloaded via the link
+    `https://api.telegram.org/file/bot<token>/<file_path>`, where
+    `<file_path>` is taken from the response. It is guaranteed that the
+    link will be valid for at least 1 hour. When the link expires, a new
+    one can be requested by calling [getFile](#getfile) again.
+    
+    **Note:** This function may not preserve the original file name and
+    MIME type. You should save the file's MIME type and name (if
+    available) when the File object is received.
+    """
+    file_id: str = field()
+    """File identifier to get information about"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getFile",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> File:
+        return _GetFileResult.decode(data).unwrap()
+
+
+_GetFileResult = result_decoder(File)
+
+
+
+
+class BanChatMember(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to ban a user in a group, a supergroup or a channel.
+    In the case of supergroups and channels, the user will not be able to
+    return to the chat on their own using invite links, etc., unless
+    [unbanned](#unbanchatmember) first. The bot must be an administrator
+    in the chat for this to work and must have the appropriate
+    administrator rights. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target group or username of the target
+    supergroup or channel (in the format @channelusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+    until_date: Optional[int] = field(default=None)
+    """Date when the user will be unbanned; Unix time. If user is banned for
+    more than 366 days or less than 30 seconds from the current time they
+    are considered to be banned forever. Applied for supergroups and
+    channels only."""
+    revoke_messages: Optional[bool] = field(default=None)
+    """Pass True to delete all messages from the chat for the user that is
+    being removed. If False, the user will be able to see messages in the
+    group that were sent before the user was removed. Always True for
+    supergroups and channels."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/banChatMember",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _BanChatMemberResult.decode(data).unwrap()
+
+
+_BanChatMemberResult = result_decoder(bool)
+
+
+
+
+class UnbanChatMember(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to unban a previously banned user in a supergroup or
+    channel. The user will **not** return to the group or channel
+    automatically, but will be able to join via link, etc. The bot must be
+    an administrator for this to work. By default, this method guarantees
+    that after the call the user is not a member of the chat, but will be
+    able to join it. So if the user is a member of the chat they will also
+    be **removed** from the chat. If you don't want this, use the
+    parameter *only\_if\_banned*. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target group or username of the target
+    supergroup or channel (in the format @channelusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+    only_if_banned: Optional[bool] = field(default=None)
+    """Do nothing if the user is not banned"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unbanChatMember",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnbanChatMemberResult.decode(data).unwrap()
+
+
+_UnbanChatMemberResult = result_decoder(bool)
+
+
+
+
+class RestrictChatMember(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to restrict a user in a supergroup. The bot must be an
+    administrator in the supergroup for this to work and must have the
+    appropriate administrator rights. Pass *True* for all permissions to
+    lift restrictions from a user. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+    permissions: ChatPermissions = field()
+    """A JSON-serialized object for new user permissions"""
+    use_independent_chat_permissions: Optional[bool] = field(default=None)
+    """Pass True if chat permissions are set independently. Otherwise, the
+    can_send_other_messages and can_add_web_page_previews permissions will
+    imply the can_send_messages, can_send_audios, can_send_documents,
+    can_send_photos, can_send_videos, can_send_video_notes, and
+    can_send_voice_notes permissions; the can_send_polls permission will
+    imply the can_send_messages permission."""
+    until_date: Optional[int] = field(default=None)
+    """Date when restrictions will be lifted for the user; Unix time. If user
+    is restricted for more than 366 days or less than 30 seconds from the
+    current time, they are considered to be restricted forever"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/restrictChatMember",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _RestrictChatMemberResult.decode(data).unwrap()
+
+
+_RestrictChatMemberResult = result_decoder(bool)
+
+
+
+
+class PromoteChatMember(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to promote or demote a user in a supergroup or a
+    channel. The bot must be an administrator in the chat for this to work
+    and must have the appropriate administrator rights. Pass *False* for
+    all boolean parameters to demote a user. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+    is_anonymous: Optional[bool] = field(default=None)
+    """Pass True if the administrator's presence in the chat is hidden"""
+    can_manage_chat: Optional[bool] = field(default=None)
+    """Pass True if the administrator can access the chat event log, chat
+    statistics, message statistics in channels, see channel members, see
+    anonymous administrators in supergroups and ignore slow mode. Implied
+    by any other administrator privilege"""
+    can_post_messages: Optional[bool] = field(default=None)
+    """Pass True if the administrator can create channel posts, channels only"""
+    can_edit_messages: Optional[bool] = field(default=None)
+    """Pass True if the administrator can edit messages of other users and
+    can pin messages, channels only"""
+    can_delete_messages: Optional[bool] = field(default=None)
+    """Pass True if the administrator can delete messages of other users"""
+    can_manage_video_chats: Optional[bool] = field(default=None)
+    """Pass True if the administrator can manage video chats"""
+    can_restrict_members: Optional[bool] = field(default=None)
+    """Pass True if the administrator can restrict, ban or unban chat members"""
+    can_promote_members: Optional[bool] = field(default=None)
+    """Pass True if the administrator can add new administrators with a
+    subset of their own privileges or demote administrators that they have
+    promoted, directly or indirectly (promoted by administrators that were
+    appointed by him)"""
+    can_change_info: Optional[bool] = field(default=None)
+    """Pass True if the administrator can change chat title, photo and other
+    settings"""
+    can_invite_users: Optional[bool] = field(default=None)
+    """Pass True if the administrator can invite new users to the chat"""
+    can_pin_messages: Optional[bool] = field(default=None)
+    """Pass True if the administrator can pin messages, supergroups only"""
+    can_manage_topics: Optional[bool] = field(default=None)
+    """Pass True if the user is allowed to create, rename, close, and reopen
+    forum topics, supergroups only"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/promoteChatMember",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _PromoteChatMemberResult.decode(data).unwrap()
+
+
+_PromoteChatMemberResult = result_decoder(bool)
+
+
+
+
+class SetChatAdministratorCustomTitle(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set a custom title for an administrator in a
+    supergroup promoted by the bot. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+    custom_title: str = field()
+    """New custom title for the administrator; 0-16 characters, emoji are not
+    allowed"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setChatAdministratorCustomTitle",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatAdministratorCustomTitleResult.decode(data).unwrap()
+
+
+_SetChatAdministratorCustomTitleResult = result_decoder(bool)
+
+
+
+
+class BanChatSenderChat(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to ban a channel chat in a supergroup or a channel.
+    Until the chat is [unbanned](#unbanchatsenderchat), the owner of the
+    banned chat won't be able to send messages on behalf of **any of their
+    channels**. The bot must be an administrator in the supergroup or
+    channel for this to work and must have the appropriate administrator
+    rights. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    sender_chat_id: int = field()
+    """Unique identifier of the target sender chat"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/banChatSenderChat",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _BanChatSenderChatResult.decode(data).unwrap()
+
+
+_BanChatSenderChatResult = result_decoder(bool)
+
+
+
+
+class UnbanChatSenderChat(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to unban a previously banned channel chat in a
+    supergroup or channel. The bot must be an administrator for this to
+    work and must have the appropriate administrator rights. Returns
+    *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    sender_chat_id: int = field()
+    """Unique identifier of the target sender chat"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unbanChatSenderChat",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnbanChatSenderChatResult.decode(data).unwrap()
+
+
+_UnbanChatSenderChatResult = result_decoder(bool)
+
+
+
+
+class SetChatPermissions(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set default chat permissions for all members. The
+    bot must be an administrator in the group or a supergroup for this to
+    work and must have the *can\_restrict\_members* administrator rights.
+    Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    permissions: ChatPermissions = field()
+    """A JSON-serialized object for new default chat permissions"""
+    use_independent_chat_permissions: Optional[bool] = field(default=None)
+    """Pass True if chat permissions are set independently. Otherwise, the
+    can_send_other_messages and can_add_web_page_previews permissions will
+    imply the can_send_messages, can_send_audios, can_send_documents,
+    can_send_photos, can_send_videos, can_send_video_notes, and
+    can_send_voice_notes permissions; the can_send_polls permission will
+    imply the can_send_messages permission."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setChatPermissions",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatPermissionsResult.decode(data).unwrap()
+
+
+_SetChatPermissionsResult = result_decoder(bool)
+
+
+
+
+class ExportChatInviteLink(
+    Path[str],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to generate a new primary invite link for a chat; any
+    previously generated primary link is revoked. The bot must be an
+    administrator in the chat for this to work and must have the
+    appropriate administrator rights. Returns the new invite link as
+    *String* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/exportChatInviteLink",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> str:
+        return _ExportChatInviteLinkResult.decode(data).unwrap()
+
+
+_ExportChatInviteLinkResult = result_decoder(str)
+
+
+
+
+class CreateChatInviteLink(
+    Path[ChatInviteLink],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to create an additional invite link for a chat. The
+    bot must be an administrator in the chat for this to work and must
+    have the appropriate administrator rights. The link can be revoked
+    using the method [revokeChatInviteLink](#revokechatinvitelink).
+    Returns the new invite link as [ChatInviteLink](#chatinvitelink)
+    object.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    name: Optional[str] = field(default=None)
+    """Invite link name; 0-32 characters"""
+    expire_date: Optional[int] = field(default=None)
+    """Point in time (Unix timestamp) when the link will expire"""
+    member_limit: Optional[int] = field(default=None)
+    """The maximum number of users that can be members of the chat
+    simultaneously after joining the chat via this invite link; 1-99999"""
+    creates_join_request: Optional[bool] = field(default=None)
+    """True, if users joining the chat via the link need to be approved by
+    chat administrators. If True, member_limit can't be specified"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/createChatInviteLink",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> ChatInviteLink:
+        return _CreateChatInviteLinkResult.decode(data).unwrap()
+
+
+_CreateChatInviteLinkResult = result_decoder(ChatInviteLink)
+
+
+
+
+class EditChatInviteLink(
+    Path[ChatInviteLink],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit a non-primary invite link created by the bot.
+    The bot must be an administrator in the chat for this to work and must
+    have the appropriate administrator rights. Returns the edited invite
+    link as a [ChatInviteLink](#chatinvitelink) object.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    invite_link: str = field()
+    """The invite link to edit"""
+    name: Optional[str] = field(default=None)
+    """Invite link name; 0-32 characters"""
+    expire_date: Optional[int] = field(default=None)
+    """Point in time (Unix timestamp) when the link will expire"""
+    member_limit: Optional[int] = field(default=None)
+    """The maximum number of users that can be members of the chat
+    simultaneously after joining the chat via this invite link; 1-99999"""
+    creates_join_request: Optional[bool] = field(default=None)
+    """True, if users joining the chat via the link need to be approved by
+    chat administrators. If True, member_limit can't be specified"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editChatInviteLink",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> ChatInviteLink:
+        return _EditChatInviteLinkResult.decode(data).unwrap()
+
+
+_EditChatInviteLinkResult = result_decoder(ChatInviteLink)
+
+
+
+
+class RevokeChatInviteLink(
+    Path[ChatInviteLink],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to revoke an invite link created by the bot. If the
+    primary link is revoked, a new link is automatically generated. The
+    bot must be an administrator in the chat for this to work and must
+    have the appropriate administrator rights. Returns the revoked invite
+    link as [ChatInviteLink](#chatinvitelink) object.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier of the target chat or username of the target channel
+    (in the format @channelusername)"""
+    invite_link: str = field()
+    """The invite link to revoke"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/revokeChatInviteLink",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> ChatInviteLink:
+        return _RevokeChatInviteLinkResult.decode(data).unwrap()
+
+
+_RevokeChatInviteLinkResult = result_decoder(ChatInviteLink)
+
+
+
+
+class ApproveChatJoinRequest(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to approve a chat join request. The bot must be an
+    administrator in the chat for this to work and must have the
+    *can\_invite\_users* administrator right. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/approveChatJoinRequest",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _ApproveChatJoinRequestResult.decode(data).unwrap()
+
+
+_ApproveChatJoinRequestResult = result_decoder(bool)
+
+
+
+
+class DeclineChatJoinRequest(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to decline a chat join request. The bot must be an
+    administrator in the chat for this to work and must have the
+    *can\_invite\_users* administrator right. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/declineChatJoinRequest",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeclineChatJoinRequestResult.decode(data).unwrap()
+
+
+_DeclineChatJoinRequestResult = result_decoder(bool)
+
+
+
+
+class SetChatPhoto(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set a new profile photo for the chat. Photos can't
+    be changed for private chats. The bot must be an administrator in the
+    chat for this to work and must have the appropriate administrator
+    rights. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    photo: InputFile = field()
+    """New chat photo, uploaded using multipart/form-data"""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/setChatPhoto")
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatPhotoResult.decode(data).unwrap()
+
+
+_SetChatPhotoResult = result_decoder(bool)
+
+
+
+
+class DeleteChatPhoto(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete a chat photo. Photos can't be changed for
+    private chats. The bot must be an administrator in the chat for this
+    to work and must have the appropriate administrator rights. Returns
+    *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteChatPhoto",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteChatPhotoResult.decode(data).unwrap()
+
+
+_DeleteChatPhotoResult = result_decoder(bool)
+
+
+
+
+class SetChatTitle(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the title of a chat. Titles can't be changed
+    for private chats. The bot must be an administrator in the chat for
+    this to work and must have the appropriate administrator rights.
+    Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    title: str = field()
+    """New chat title, 1-128 characters"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setChatTitle",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatTitleResult.decode(data).unwrap()
+
+
+_SetChatTitleResult = result_decoder(bool)
+
+
+
+
+class SetChatDescription(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the description of a group, a supergroup or
+    a channel. The bot must be an administrator in the chat for this to
+    work and must have the appropriate administrator rights. Returns
+    *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    description: Optional[str] = field(default=None)
+    """New chat description, 0-255 characters"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setChatDescription",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatDescriptionResult.decode(data).unwrap()
+
+
+_SetChatDescriptionResult = result_decoder(bool)
+
+
+
+
+class PinChatMessage(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to add a message to the list of pinned messages in a
+    chat. If the chat is not a private chat, the bot must be an
+    administrator in the chat for this to work and must have the
+    'can\_pin\_messages' administrator right in a supergroup or
+    'can\_edit\_messages' administrator right in a channel. Returns *True*
+    on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    message_id: int = field()
+    """Identifier of a message to pin"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Pass True if it is not necessary to send a notification to all chat
+    members about the new pinned message. Notifications are always
+    disabled in channels and private chats."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/pinChatMessage",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _PinChatMessageResult.decode(data).unwrap()
+
+
+_PinChatMessageResult = result_decoder(bool)
+
+
+
+
+class UnpinChatMessage(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to remove a message from the list of pinned messages
+    in a chat. If the chat is not a private chat, the bot must be an
+    administrator in the chat for this to work and must have the
+    'can\_pin\_messages' administrator right in a supergroup or
+    'can\_edit\_messages' administrator right in a channel. Returns *True*
+    on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Identifier of a message to unpin. If not specified, the most recent
+    pinned message (by sending date) will be unpinned."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unpinChatMessage",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnpinChatMessageResult.decode(data).unwrap()
+
+
+_UnpinChatMessageResult = result_decoder(bool)
+
+
+
+
+class UnpinAllChatMessages(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to clear the list of pinned messages in a chat. If the
+    chat is not a private chat, the bot must be an administrator in the
+    chat for this to work and must have the 'can\_pin\_messages'
+    administrator right in a supergroup or 'can\_edit\_messages'
+    administrator right in a channel. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unpinAllChatMessages",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnpinAllChatMessagesResult.decode(data).unwrap()
+
+
+_UnpinAllChatMessagesResult = result_decoder(bool)
+
+
+
+
+class LeaveChat(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method for your bot to leave a group, supergroup or channel.
+    Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup or channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/leaveChat",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _LeaveChatResult.decode(data).unwrap()
+
+
+_LeaveChatResult = result_decoder(bool)
+
+
+
+
+class GetChat(
+    Path[Chat],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get up to date information about the chat (current
+    name of the user for one-on-one conversations, current username of a
+    user, group or channel, etc.). Returns a [Chat](#chat) object on
+    success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup or channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getChat",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Chat:
+        return _GetChatResult.decode(data).unwrap()
+
+
+_GetChatResult = result_decoder(Chat)
+
+
+
+
+class GetChatAdministrators(
+    Path[List[ChatMember]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get a list of administrators in a chat, which
+    aren't bots. Returns an Array of [ChatMember](#chatmember) objects.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup or channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getChatAdministrators",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> List[ChatMember]:
+        return _GetChatAdministratorsResult.decode(data).unwrap()
+
+
+_GetChatAdministratorsResult = result_decoder(List[ChatMember])
+
+
+
+
+class GetChatMemberCount(
+    Path[int],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the number of members in a chat. Returns *Int*
+    on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup or channel (in the format @channelusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getChatMemberCount",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> int:
+        return _GetChatMemberCountResult.decode(data).unwrap()
+
+
+_GetChatMemberCountResult = result_decoder(int)
+
+
+
+
+class GetChatMember(
+    Path[ChatMember],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get information about a member of a chat. The
+    method is only guaranteed to work for other users if the bot is an
+    administrator in the chat. Returns a [ChatMember](#chatmember) object
+    on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup or channel (in the format @channelusername)"""
+    user_id: int = field()
+    """Unique identifier of the target user"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getChatMember",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> ChatMember:
+        return _GetChatMemberResult.decode(data).unwrap()
+
+
+_GetChatMemberResult = result_decoder(ChatMember)
+
+
+
+
+class SetChatStickerSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set a new group sticker set for a supergroup. The
+    bot must be an administrator in the chat for this to work and must
+    have the appropriate administrator rights. Use the field
+    *can\_set\_sticker\_set* optionally returned in [getChat](#getchat)
+    requests to check if the bot can use this method. Returns *True* on
+    success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    sticker_set_name: str = field()
+    """Name of the sticker set to be set as the group sticker set"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setChatStickerSet",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatStickerSetResult.decode(data).unwrap()
+
+
+_SetChatStickerSetResult = result_decoder(bool)
+
+
+
+
+class DeleteChatStickerSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete a group sticker set from a supergroup. The
+    bot must be an administrator in the chat for this to work and must
+    have the appropriate administrator rights. Use the field
+    *can\_set\_sticker\_set* optionally returned in [getChat](#getchat)
+    requests to check if the bot can use this method. Returns *True* on
+    success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteChatStickerSet",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteChatStickerSetResult.decode(data).unwrap()
+
+
+_DeleteChatStickerSetResult = result_decoder(bool)
+
+
+
+
+class GetForumTopicIconStickers(
+    Path[List[Sticker]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get custom emoji stickers, which can be used as a
+    forum topic icon by any user. Requires no parameters. Returns an Array
+    of [Sticker](#sticker) objects.
+    """
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getForumTopicIconStickers",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> List[Sticker]:
+        return _GetForumTopicIconStickersResult.decode(data).unwrap()
+
+
+_GetForumTopicIconStickersResult = result_decoder(List[Sticker])
+
+
+
+
+class CreateForumTopic(
+    Path[ForumTopic],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to create a topic in a forum supergroup chat. The bot
+    must be an administrator in the chat for this to work and must have
+    the *can\_manage\_topics* administrator rights. Returns information
+    about the created topic as a [ForumTopic](#forumtopic) object.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    name: str = field()
+    """Topic name, 1-128 characters"""
+    icon_color: Optional[int] = field(default=None)
+    """Color of the topic icon in RGB format. Currently, must be one of
+    7322096 (0x6FB9F0), 16766590 (0xFFD67E), 13338331 (0xCB86DB), 9367192
+    (0x8EEE98), 16749490 (0xFF93B2), or 16478047 (0xFB6F5F)"""
+    icon_custom_emoji_id: Optional[str] = field(default=None)
+    """Unique identifier of the custom emoji shown as the topic icon. Use
+    getForumTopicIconStickers to get all allowed custom emoji identifiers."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/createForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> ForumTopic:
+        return _CreateForumTopicResult.decode(data).unwrap()
+
+
+_CreateForumTopicResult = result_decoder(ForumTopic)
+
+
+
+
+class EditForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit name and icon of a topic in a forum supergroup
+    chat. The bot must be an administrator in the chat for this to work
+    and must have *can\_manage\_topics* administrator rights, unless it is
+    the creator of the topic. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    message_thread_id: int = field()
+    """Unique identifier for the target message thread of the forum topic"""
+    name: Optional[str] = field(default=None)
+    """New topic name, 0-128 characters. If not specified or empty, the
+    current name of the topic will be kept"""
+    icon_custom_emoji_id: Optional[str] = field(default=None)
+    """New unique identifier of the custom emoji shown as the topic icon. Use
+    getForumTopicIconStickers to get all allowed custom emoji identifiers.
+    Pass an empty string to remove the icon. If not specified, the current
+    icon will be kept"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _EditForumTopicResult.decode(data).unwrap()
+
+
+_EditForumTopicResult = result_decoder(bool)
+
+
+
+
+class CloseForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to close an open topic in a forum supergroup chat. The
+    bot must be an administrator in the chat for this to work and must
+    have the *can\_manage\_topics* administrator rights, unless it is the
+    creator of the topic. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    message_thread_id: int = field()
+    """Unique identifier for the target message thread of the forum topic"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/closeForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _CloseForumTopicResult.decode(data).unwrap()
+
+
+_CloseForumTopicResult = result_decoder(bool)
+
+
+
+
+class ReopenForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to reopen a closed topic in a forum supergroup chat.
+    The bot must be an administrator in the chat for this to work and must
+    have the *can\_manage\_topics* administrator rights, unless it is the
+    creator of the topic. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    message_thread_id: int = field()
+    """Unique identifier for the target message thread of the forum topic"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/reopenForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _ReopenForumTopicResult.decode(data).unwrap()
+
+
+_ReopenForumTopicResult = result_decoder(bool)
+
+
+
+
+class DeleteForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete a forum topic along with all its messages in
+    a forum supergroup chat. The bot must be an administrator in the chat
+    for this to work and must have the *can\_delete\_messages*
+    administrator rights. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    message_thread_id: int = field()
+    """Unique identifier for the target message thread of the forum topic"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteForumTopicResult.decode(data).unwrap()
+
+
+_DeleteForumTopicResult = result_decoder(bool)
+
+
+
+
+class UnpinAllForumTopicMessages(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to clear the list of pinned messages in a forum topic.
+    The bot must be an administrator in the chat for this to work and must
+    have the *can\_pin\_messages* administrator right in the supergroup.
+    Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    message_thread_id: int = field()
+    """Unique identifier for the target message thread of the forum topic"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unpinAllForumTopicMessages",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnpinAllForumTopicMessagesResult.decode(data).unwrap()
+
+
+_UnpinAllForumTopicMessagesResult = result_decoder(bool)
+
+
+
+
+class EditGeneralForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit the name of the 'General' topic in a forum
+    supergroup chat. The bot must be an administrator in the chat for this
+    to work and must have *can\_manage\_topics* administrator rights.
+    Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+    name: str = field()
+    """New topic name, 1-128 characters"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editGeneralForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _EditGeneralForumTopicResult.decode(data).unwrap()
+
+
+_EditGeneralForumTopicResult = result_decoder(bool)
+
+
+
+
+class CloseGeneralForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to close an open 'General' topic in a forum supergroup
+    chat. The bot must be an administrator in the chat for this to work
+    and must have the *can\_manage\_topics* administrator rights. Returns
+    *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/closeGeneralForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _CloseGeneralForumTopicResult.decode(data).unwrap()
+
+
+_CloseGeneralForumTopicResult = result_decoder(bool)
+
+
+
+
+class ReopenGeneralForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to reopen a closed 'General' topic in a forum
+    supergroup chat. The bot must be an administrator in the chat for this
+    to work and must have the *can\_manage\_topics* administrator rights.
+    The topic will be automatically unhidden if it was hidden. Returns
+    *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/reopenGeneralForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _ReopenGeneralForumTopicResult.decode(data).unwrap()
+
+
+_ReopenGeneralForumTopicResult = result_decoder(bool)
+
+
+
+
+class HideGeneralForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to hide the 'General' topic in a forum supergroup
+    chat. The bot must be an administrator in the chat for this to work
+    and must have the *can\_manage\_topics* administrator rights. The
+    topic will be automatically closed if it was open. Returns *True* on
+    success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/hideGeneralForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _HideGeneralForumTopicResult.decode(data).unwrap()
+
+
+_HideGeneralForumTopicResult = result_decoder(bool)
+
+
+
+
+class UnhideGeneralForumTopic(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to unhide the 'General' topic in a forum supergroup
+    chat. The bot must be an administrator in the chat for this to work
+    and must have the *can\_manage\_topics* administrator rights. Returns
+    *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unhideGeneralForumTopic",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnhideGeneralForumTopicResult.decode(data).unwrap()
+
+
+_UnhideGeneralForumTopicResult = result_decoder(bool)
+
+
+
+
+class UnpinAllGeneralForumTopicMessages(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to clear the list of pinned messages in a General
+    forum topic. The bot must be an administrator in the chat for this to
+    work and must have the *can\_pin\_messages* administrator right in the
+    supergroup. Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    supergroup (in the format @supergroupusername)"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/unpinAllGeneralForumTopicMessages",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _UnpinAllGeneralForumTopicMessagesResult.decode(data).unwrap()
+
+
+_UnpinAllGeneralForumTopicMessagesResult = result_decoder(bool)
+
+
+
+
+class AnswerCallbackQuery(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send answers to callback queries sent from [inline
+    keyboards](/bots/features#inline-keyboards). The answer will be
+    displayed to the user as a notification at the top of the chat screen
+    or as an alert. On success, *True* is returned.
+    """
+    callback_query_id: str = field()
+    """Unique identifier for the query to be answered"""
+    text: Optional[str] = field(default=None)
+    """Text of the notification. If not specified, nothing will be shown to
+    the user, 0-200 characters"""
+    show_alert: Optional[bool] = field(default=None)
+    """If True, an alert will be shown by the client instead of a
+    notification at the top of the chat screen. Defaults to false."""
+    url: Optional[str] = field(default=None)
+    """URL that will be opened by the user's client. If you have created a
+    Game and accepted the conditions via @BotFather, specify the URL that
+    opens your game - note that this will only work if the query comes
+    from a callback_game button.
+    
+    Otherwise, you may use links like t.me/your_bot?start=XXXX that open
+    your bot with a parameter."""
+    cache_time: Optional[int] = field(default=None)
+    """The maximum amount of time in seconds that the result of the callback
+    query may be cached client-side. Telegram apps will support caching
+    starting in version 3.14. Defaults to 0."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/answerCallbackQuery",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _AnswerCallbackQueryResult.decode(data).unwrap()
+
+
+_AnswerCallbackQueryResult = result_decoder(bool)
+
+
+
+
+class SetMyCommands(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the list of the bot's commands. See [this
+    manual](/bots/features#commands) for more details about bot commands.
+    Returns *True* on success.
+    """
+    commands: List[BotCommand] = field()
+    """A JSON-serialized list of bot commands to be set as the list of the
+    bot's commands. At most 100 commands can be specified."""
+    scope: Optional[BotCommandScope] = field(default=None)
+    """A JSON-serialized object, describing scope of users for which the
+    commands are relevant. Defaults to BotCommandScopeDefault."""
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code. If empty, commands will be
+    applied to all users from the given scope, for whose language there
+    are no dedicated commands"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setMyCommands",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetMyCommandsResult.decode(data).unwrap()
+
+
+_SetMyCommandsResult = result_decoder(bool)
+
+
+
+
+class DeleteMyCommands(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete the list of the bot's commands for the given
+    scope and user language. After deletion, [higher level
+    commands](#determining-list-of-commands) will be shown to affected
+    users. Returns *True* on success.
+    """
+    scope: Optional[BotCommandScope] = field(default=None)
+    """A JSON-serialized object, describing scope of users for which the
+    commands are relevant. Defaults to BotCommandScopeDefault."""
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code. If empty, commands will be
+    applied to all users from the given scope, for whose language there
+    are no dedicated commands"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteMyCommands",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteMyCommandsResult.decode(data).unwrap()
+
+
+_DeleteMyCommandsResult = result_decoder(bool)
+
+
+
+
+class GetMyCommands(
+    Path[List[BotCommand]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the current list of the bot's commands for the
+    given scope and user language. Returns an Array of
+    [BotCommand](#botcommand) objects. If commands aren't set, an empty
+    list is returned.
+    """
+    scope: Optional[BotCommandScope] = field(default=None)
+    """A JSON-serialized object, describing scope of users. Defaults to
+    BotCommandScopeDefault."""
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code or an empty string"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getMyCommands",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> List[BotCommand]:
+        return _GetMyCommandsResult.decode(data).unwrap()
+
+
+_GetMyCommandsResult = result_decoder(List[BotCommand])
+
+
+
+
+class SetMyName(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the bot's name. Returns *True* on success.
+    """
+    name: Optional[str] = field(default=None)
+    """New bot name; 0-64 characters. Pass an empty string to remove the
+    dedicated name for the given language."""
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code. If empty, the name will be shown
+    to all users for whose language there is no dedicated name."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setMyName",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetMyNameResult.decode(data).unwrap()
+
+
+_SetMyNameResult = result_decoder(bool)
+
+
+
+
+class GetMyName(
+    Path[BotName],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the current bot name for the given user
+    language. Returns [BotName](#botname) on success.
+    """
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code or an empty string"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getMyName",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> BotName:
+        return _GetMyNameResult.decode(data).unwrap()
+
+
+_GetMyNameResult = result_decoder(BotName)
+
+
+
+
+class SetMyDescription(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the bot's description, which is shown in the
+    chat with the bot if the chat is empty. Returns *True* on success.
+    """
+    description: Optional[str] = field(default=None)
+    """New bot description; 0-512 characters. Pass an empty string to remove
+    the dedicated description for the given language."""
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code. If empty, the description will
+    be applied to all users for whose language there is no dedicated
+    description."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setMyDescription",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetMyDescriptionResult.decode(data).unwrap()
+
+
+_SetMyDescriptionResult = result_decoder(bool)
+
+
+
+
+class GetMyDescription(
+    Path[BotDescription],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the current bot description for the given user
+    language. Returns [BotDescription](#botdescription) on success.
+    """
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code or an empty string"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getMyDescription",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> BotDescription:
+        return _GetMyDescriptionResult.decode(data).unwrap()
+
+
+_GetMyDescriptionResult = result_decoder(BotDescription)
+
+
+
+
+class SetMyShortDescription(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the bot's short description, which is shown
+    on the bot's profile page and is sent together with the link when
+    users share the bot. Returns *True* on success.
+    """
+    short_description: Optional[str] = field(default=None)
+    """New short description for the bot; 0-120 characters. Pass an empty
+    string to remove the dedicated short description for the given
+    language."""
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code. If empty, the short description
+    will be applied to all users for whose language there is no dedicated
+    short description."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setMyShortDescription",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetMyShortDescriptionResult.decode(data).unwrap()
+
+
+_SetMyShortDescriptionResult = result_decoder(bool)
+
+
+
+
+class GetMyShortDescription(
+    Path[BotShortDescription],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the current bot short description for the given
+    user language. Returns [BotShortDescription](#botshortdescription) on
+    success.
+    """
+    language_code: Optional[str] = field(default=None)
+    """A two-letter ISO 639-1 language code or an empty string"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getMyShortDescription",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> BotShortDescription:
+        return _GetMyShortDescriptionResult.decode(data).unwrap()
+
+
+_GetMyShortDescriptionResult = result_decoder(BotShortDescription)
+
+
+
+
+class SetChatMenuButton(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the bot's menu button in a private chat, or
+    the default menu button. Returns *True* on success.
+    """
+    chat_id: Optional[int] = field(default=None)
+    """Unique identifier for the target private chat. If not specified,
+    default bot's menu button will be changed"""
+    menu_button: Optional[MenuButton] = field(default=None)
+    """A JSON-serialized object for the bot's new menu button. Defaults to
+    MenuButtonDefault"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setChatMenuButton",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetChatMenuButtonResult.decode(data).unwrap()
+
+
+_SetChatMenuButtonResult = result_decoder(bool)
+
+
+
+
+class GetChatMenuButton(
+    Path[MenuButton],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the current value of the bot's menu button in a
+    private chat, or the default menu button. Returns
+    [MenuButton](#menubutton) on success.
+    """
+    chat_id: Optional[int] = field(default=None)
+    """Unique identifier for the target private chat. If not specified,
+    default bot's menu button will be returned"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getChatMenuButton",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> MenuButton:
+        return _GetChatMenuButtonResult.decode(data).unwrap()
+
+
+_GetChatMenuButtonResult = result_decoder(MenuButton)
+
+
+
+
+class SetMyDefaultAdministratorRights(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the default administrator rights requested
+    by the bot when it's added as an administrator to groups or channels.
+    These rights will be suggested to users, but they are free to modify
+    the list before adding the bot. Returns *True* on success.
+    """
+    rights: Optional[ChatAdministratorRights] = field(default=None)
+    """A JSON-serialized object describing new default administrator rights.
+    If not specified, the default administrator rights will be cleared."""
+    for_channels: Optional[bool] = field(default=None)
+    """Pass True to change the default administrator rights of the bot in
+    channels. Otherwise, the default administrator rights of the bot for
+    groups and supergroups will be changed."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setMyDefaultAdministratorRights",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetMyDefaultAdministratorRightsResult.decode(data).unwrap()
+
+
+_SetMyDefaultAdministratorRightsResult = result_decoder(bool)
+
+
+
+
+class GetMyDefaultAdministratorRights(
+    Path[ChatAdministratorRights],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get the current default administrator rights of the
+    bot. Returns [ChatAdministratorRights](#chatadministratorrights) on
+    success.
+    """
+    for_channels: Optional[bool] = field(default=None)
+    """Pass True to get default administrator rights of the bot in channels.
+    Otherwise, default administrator rights of the bot for groups and
+    supergroups will be returned."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getMyDefaultAdministratorRights",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> ChatAdministratorRights:
+        return _GetMyDefaultAdministratorRightsResult.decode(data).unwrap()
+
+
+_GetMyDefaultAdministratorRightsResult = result_decoder(ChatAdministratorRights)
+
+
+
+
+class EditMessageText(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit text and [game](#games) messages. On success,
+    if the edited message is not an inline message, the edited
+    [Message](#message) is returned, otherwise *True* is returned.
+    """
+    limited: ClassVar[bool] = True
+    text: str = field()
+    """New text of the message, 1-4096 characters after entities parsing"""
+    chat_id: Union[int, str, None] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat or username of the target channel (in the format
+    @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the
+    message to edit"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the message text. See formatting options
+    for more details."""
+    entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in message
+    text, which can be specified instead of parse_mode"""
+    disable_web_page_preview: Optional[bool] = field(default=None)
+    """Disables link previews for links in this message"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for an inline keyboard."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editMessageText",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _EditMessageTextResult.decode(data).unwrap()
+
+
+_EditMessageTextResult = result_decoder(Union[Message, bool])
+
+
+
+
+class EditMessageCaption(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit captions of messages. On success, if the
+    edited message is not an inline message, the edited
+    [Message](#message) is returned, otherwise *True* is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str, None] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat or username of the target channel (in the format
+    @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the
+    message to edit"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+    caption: Optional[str] = field(default=None)
+    """New caption of the message, 0-1024 characters after entities parsing"""
+    parse_mode: Optional[str] = field(default=None)
+    """Mode for parsing entities in the message caption. See formatting
+    options for more details."""
+    caption_entities: Optional[List[MessageEntity]] = field(default=None)
+    """A JSON-serialized list of special entities that appear in the caption,
+    which can be specified instead of parse_mode"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for an inline keyboard."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editMessageCaption",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _EditMessageCaptionResult.decode(data).unwrap()
+
+
+_EditMessageCaptionResult = result_decoder(Union[Message, bool])
+
+
+
+
+class EditMessageMedia(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit animation, audio, document, photo, or video
+    messages. If a message is part of a message album, then it can be
+    edited only to an audio for audio albums, only to a document for
+    document albums and to a photo or a video otherwise. When an inline
+    message is edited, a new file can't be uploaded; use a previously
+    uploaded file via its file\_id or specify a URL. On success, if the
+    edited message is not an inline message, the edited
+    [Message](#message) is returned, otherwise *True* is returned.
+    """
+    limited: ClassVar[bool] = True
+    media: InputMedia = field()
+    """A JSON-serialized object for a new media content of the message"""
+    chat_id: Union[int, str, None] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat or username of the target channel (in the format
+    @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the
+    message to edit"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for a new inline keyboard."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/editMessageMedia")
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _EditMessageMediaResult.decode(data).unwrap()
+
+
+_EditMessageMediaResult = result_decoder(Union[Message, bool])
+
+
+
+
+class EditMessageLiveLocation(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit live location messages. A location can be
+    edited until its *live\_period* expires or editing is explicitly
+    disabled by a call to
+    [stopMessageLiveLocation](#stopmessagelivelocation). On success, if
+    the edited message is not an inline message, the edited
+    [Message](#message) is returned, otherwise *True* is returned.
+    """
+    limited: ClassVar[bool] = True
+    latitude: float = field()
+    """Latitude of new location"""
+    longitude: float = field()
+    """Longitude of new location"""
+    chat_id: Union[int, str, None] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat or username of the target channel (in the format
+    @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the
+    message to edit"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+    horizontal_accuracy: Optional[float] = field(default=None)
+    """The radius of uncertainty for the location, measured in meters; 0-1500"""
+    heading: Optional[int] = field(default=None)
+    """Direction in which the user is moving, in degrees. Must be between 1
+    and 360 if specified."""
+    proximity_alert_radius: Optional[int] = field(default=None)
+    """The maximum distance for proximity alerts about approaching another
+    chat member, in meters. Must be between 1 and 100000 if specified."""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for a new inline keyboard."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editMessageLiveLocation",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _EditMessageLiveLocationResult.decode(data).unwrap()
+
+
+_EditMessageLiveLocationResult = result_decoder(Union[Message, bool])
+
+
+
+
+class StopMessageLiveLocation(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to stop updating a live location message before
+    *live\_period* expires. On success, if the message is not an inline
+    message, the edited [Message](#message) is returned, otherwise *True*
+    is returned.
+    """
+    chat_id: Union[int, str, None] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat or username of the target channel (in the format
+    @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the
+    message with live location to stop"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for a new inline keyboard."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/stopMessageLiveLocation",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _StopMessageLiveLocationResult.decode(data).unwrap()
+
+
+_StopMessageLiveLocationResult = result_decoder(Union[Message, bool])
+
+
+
+
+class EditMessageReplyMarkup(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to edit only the reply markup of messages. On success,
+    if the edited message is not an inline message, the edited
+    [Message](#message) is returned, otherwise *True* is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str, None] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat or username of the target channel (in the format
+    @channelusername)"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the
+    message to edit"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for an inline keyboard."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/editMessageReplyMarkup",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _EditMessageReplyMarkupResult.decode(data).unwrap()
+
+
+_EditMessageReplyMarkupResult = result_decoder(Union[Message, bool])
+
+
+
+
+class StopPoll(
+    Path[Poll],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to stop a poll which was sent by the bot. On success,
+    the stopped [Poll](#poll) is returned.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    message_id: int = field()
+    """Identifier of the original message with the poll"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for a new message inline keyboard."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/stopPoll",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Poll:
+        return _StopPollResult.decode(data).unwrap()
+
+
+_StopPollResult = result_decoder(Poll)
+
+
+
+
+class DeleteMessage(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete a message, including service messages, with
+    the following limitations:
+    
+    - A message can only be deleted if it was sent less than 48 hours ago.
+    
+    - Service messages about a supergroup, channel, or forum topic
+    creation can't be deleted.
+    
+    - A dice message in a private chat can only be deleted if it was sent
+    more than 24 hours ago.
+    
+    - Bots can delete outgoing messages in private chats, groups, and
+    supergroups.
+    
+    - Bots can delete incoming messages in private chats.
+    
+    - Bots granted *can\_post\_messages* permissions can delete outgoing
+    messages in channels.
+    
+    - If the bot is an administrator of a group, it can delete any message
+    there.
+    
+    - If the bot has *can\_delete\_messages* permission in a supergroup or
+    a channel, it can delete any message there.
+    
+    Returns *True* on success.
+    """
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    message_id: int = field()
+    """Identifier of the message to delete"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteMessage",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteMessageResult.decode(data).unwrap()
+
+
+_DeleteMessageResult = result_decoder(bool)
+
+
+
+
+class SendSticker(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send static .WEBP,
+    [animated](https://telegram.org/blog/animated-stickers) .TGS, or
+    [video](https://telegram.org/blog/video-stickers-better-reactions)
+    .WEBM stickers. On success, the sent [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    sticker: Union[InputFile, str] = field()
+    """Sticker to send. Pass a file_id as String to send a file that exists
+    on the Telegram servers (recommended), pass an HTTP URL as a String
+    for Telegram to get a .WEBP sticker from the Internet, or upload a new
+    .WEBP or .TGS sticker using multipart/form-data. More information on
+    Sending Files ». Video stickers can only be sent by a file_id.
+    Animated stickers can't be sent via an HTTP URL."""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    emoji: Optional[str] = field(default=None)
+    """Emoji associated with the sticker; only for just uploaded stickers"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply, Raw, None] = field(default=None)
+    """Additional interface options. A JSON-serialized object for an inline
+    keyboard, custom reply keyboard, instructions to remove reply keyboard
+    or to force a reply from the user."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/sendSticker")
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendStickerResult.decode(data).unwrap()
+
+
+_SendStickerResult = result_decoder(Message)
+
+
+
+
+class GetStickerSet(
+    Path[StickerSet],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get a sticker set. On success, a
+    [StickerSet](#stickerset) object is returned.
+    """
+    name: str = field()
+    """Name of the sticker set"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getStickerSet",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> StickerSet:
+        return _GetStickerSetResult.decode(data).unwrap()
+
+
+_GetStickerSetResult = result_decoder(StickerSet)
+
+
+
+
+class GetCustomEmojiStickers(
+    Path[List[Sticker]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get information about custom emoji stickers by
+    their identifiers. Returns an Array of [Sticker](#sticker) objects.
+    """
+    custom_emoji_ids: List[str] = field()
+    """List of custom emoji identifiers. At most 200 custom emoji identifiers
+    can be specified."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getCustomEmojiStickers",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> List[Sticker]:
+        return _GetCustomEmojiStickersResult.decode(data).unwrap()
+
+
+_GetCustomEmojiStickersResult = result_decoder(List[Sticker])
+
+
+
+
+class UploadStickerFile(
+    Path[File],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to upload a file with a sticker for later use in the
+    [createNewStickerSet](#createnewstickerset) and
+    [addStickerToSet](#addstickertoset) methods (the file can be used
+    multiple times). Returns the uploaded [File](#file) on success.
+    """
+    user_id: int = field()
+    """User identifier of sticker file owner"""
+    sticker: InputFile = field()
+    """A file with the sticker in .WEBP, .PNG, .TGS, or .WEBM format. See
+    https://core.telegram.org/stickers for technical requirements. More
+    information on Sending Files »"""
+    sticker_format: str = field()
+    """Format of the sticker, must be one of “static”, “animated”, “video”"""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/uploadStickerFile")
+
+    def build_result(self, data: Buffer) -> File:
+        return _UploadStickerFileResult.decode(data).unwrap()
+
+
+_UploadStickerFileResult = result_decoder(File)
+
+
+
+
+class CreateNewStickerSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to create a new sticker set owned by a user. The bot
+    will be able to edit the sticker set thus created. Returns *True* on
+    success.
+    """
+    user_id: int = field()
+    """User identifier of created sticker set owner"""
+    name: str = field()
+    """Short name of sticker set, to be used in t.me/addstickers/ URLs (e.g.,
+    animals). Can contain only English letters, digits and underscores.
+    Must begin with a letter, can't contain consecutive underscores and
+    must end in "_by_<bot_username>". <bot_username> is case insensitive.
+    1-64 characters."""
+    title: str = field()
+    """Sticker set title, 1-64 characters"""
+    stickers: List[InputSticker] = field()
+    """A JSON-serialized list of 1-50 initial stickers to be added to the
+    sticker set"""
+    sticker_format: str = field()
+    """Format of stickers in the set, must be one of “static”, “animated”,
+    “video”"""
+    sticker_type: Optional[str] = field(default=None)
+    """Type of stickers in the set, pass “regular”, “mask”, or
+    “custom_emoji”. By default, a regular sticker set is created."""
+    needs_repainting: Optional[bool] = field(default=None)
+    """Pass True if stickers in the sticker set must be repainted to the
+    color of text when used in messages, the accent color if used as emoji
+    status, white on chat photos, or another appropriate color based on
+    context; for custom emoji sticker sets only"""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/createNewStickerSet")
+
+    def build_result(self, data: Buffer) -> bool:
+        return _CreateNewStickerSetResult.decode(data).unwrap()
+
+
+_CreateNewStickerSetResult = result_decoder(bool)
+
+
+
+
+class AddStickerToSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to add a new sticker to a set created by the bot. The
+    format of the added sticker must match the format of the other
+    stickers in the set. Emoji sticker sets can have up to 200 stickers.
+    Animated and video sticker sets can have up to 50 stickers. Static
+    sticker sets can have up to 120 stickers. Returns *True* on success.
+    """
+    user_id: int = field()
+    """User identifier of sticker set owner"""
+    name: str = field()
+    """Sticker set name"""
+    sticker: InputSticker = field()
+    """A JSON-serialized object with information about the added sticker. If
+    exactly the same sticker had already been added to the set, then the
+    set isn't changed."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/addStickerToSet")
+
+    def build_result(self, data: Buffer) -> bool:
+        return _AddStickerToSetResult.decode(data).unwrap()
+
+
+_AddStickerToSetResult = result_decoder(bool)
+
+
+
+
+class SetStickerPositionInSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to move a sticker in a set created by the bot to a
+    specific position. Returns *True* on success.
+    """
+    sticker: str = field()
+    """File identifier of the sticker"""
+    position: int = field()
+    """New sticker position in the set, zero-based"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setStickerPositionInSet",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetStickerPositionInSetResult.decode(data).unwrap()
+
+
+_SetStickerPositionInSetResult = result_decoder(bool)
+
+
+
+
+class DeleteStickerFromSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete a sticker from a set created by the bot.
+    Returns *True* on success.
+    """
+    sticker: str = field()
+    """File identifier of the sticker"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteStickerFromSet",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteStickerFromSetResult.decode(data).unwrap()
+
+
+_DeleteStickerFromSetResult = result_decoder(bool)
+
+
+
+
+class SetStickerEmojiList(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the list of emoji assigned to a regular or
+    custom emoji sticker. The sticker must belong to a sticker set created
+    by the bot. Returns *True* on success.
+    """
+    sticker: str = field()
+    """File identifier of the sticker"""
+    emoji_list: List[str] = field()
+    """A JSON-serialized list of 1-20 emoji associated with the sticker"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setStickerEmojiList",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetStickerEmojiListResult.decode(data).unwrap()
+
+
+_SetStickerEmojiListResult = result_decoder(bool)
+
+
+
+
+class SetStickerKeywords(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change search keywords assigned to a regular or
+    custom emoji sticker. The sticker must belong to a sticker set created
+    by the bot. Returns *True* on success.
+    """
+    sticker: str = field()
+    """File identifier of the sticker"""
+    keywords: Optional[List[str]] = field(default=None)
+    """A JSON-serialized list of 0-20 search keywords for the sticker with
+    total length of up to 64 characters"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setStickerKeywords",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetStickerKeywordsResult.decode(data).unwrap()
+
+
+_SetStickerKeywordsResult = result_decoder(bool)
+
+
+
+
+class SetStickerMaskPosition(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to change the [mask position](#maskposition) of a mask
+    sticker. The sticker must belong to a sticker set that was created by
+    the bot. Returns *True* on success.
+    """
+    sticker: str = field()
+    """File identifier of the sticker"""
+    mask_position: Optional[MaskPosition] = field(default=None)
+    """A JSON-serialized object with the position where the mask should be
+    placed on faces. Omit the parameter to remove the mask position."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setStickerMaskPosition",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetStickerMaskPositionResult.decode(data).unwrap()
+
+
+_SetStickerMaskPositionResult = result_decoder(bool)
+
+
+
+
+class SetStickerSetTitle(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set the title of a created sticker set. Returns
+    *True* on success.
+    """
+    name: str = field()
+    """Sticker set name"""
+    title: str = field()
+    """Sticker set title, 1-64 characters"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setStickerSetTitle",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetStickerSetTitleResult.decode(data).unwrap()
+
+
+_SetStickerSetTitleResult = result_decoder(bool)
+
+
+
+
+class SetStickerSetThumbnail(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set the thumbnail of a regular or mask sticker set.
+    The format of the thumbnail file must match the format of the stickers
+    in the set. Returns *True* on success.
+    """
+    name: str = field()
+    """Sticker set name"""
+    user_id: int = field()
+    """User identifier of the sticker set owner"""
+    thumbnail: Union[InputFile, str, None] = field(default=None)
+    """A .WEBP or .PNG image with the thumbnail, must be up to 128 kilobytes
+    in size and have a width and height of exactly 100px, or a .TGS
+    animation with a thumbnail up to 32 kilobytes in size (see
+    https://core.telegram.org/stickers#animated-sticker-requirements for
+    animated sticker technical requirements), or a WEBM video with the
+    thumbnail up to 32 kilobytes in size; see
+    https://core.telegram.org/stickers#video-sticker-requirements for
+    video sticker technical requirements. Pass a file_id as a String to
+    send a file that already exists on the Telegram servers, pass an HTTP
+    URL as a String for Telegram to get a file from the Internet, or
+    upload a new one using multipart/form-data. More information on
+    Sending Files ». Animated and video sticker set thumbnails can't be
+    uploaded via HTTP URL. If omitted, then the thumbnail is dropped and
+    the first sticker is used as the thumbnail."""
+
+    def build_request(self) -> Request:
+        return build_multipart(self, "/setStickerSetThumbnail")
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetStickerSetThumbnailResult.decode(data).unwrap()
+
+
+_SetStickerSetThumbnailResult = result_decoder(bool)
+
+
+
+
+class SetCustomEmojiStickerSetThumbnail(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set the thumbnail of a custom emoji sticker set.
+    Returns *True* on success.
+    """
+    name: str = field()
+    """Sticker set name"""
+    custom_emoji_id: Optional[str] = field(default=None)
+    """Custom emoji identifier of a sticker from the sticker set; pass an
+    empty string to drop the thumbnail and use the first sticker as the
+    thumbnail."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setCustomEmojiStickerSetThumbnail",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetCustomEmojiStickerSetThumbnailResult.decode(data).unwrap()
+
+
+_SetCustomEmojiStickerSetThumbnailResult = result_decoder(bool)
+
+
+
+
+class DeleteStickerSet(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to delete a sticker set that was created by the bot.
+    Returns *True* on success.
+    """
+    name: str = field()
+    """Sticker set name"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/deleteStickerSet",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _DeleteStickerSetResult.decode(data).unwrap()
+
+
+_DeleteStickerSetResult = result_decoder(bool)
+
+
+
+
+class AnswerInlineQuery(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send answers to an inline query. On success, *True*
+    is returned.
+    
+    No more than **50** results per query are allowed.
+    """
+    inline_query_id: str = field()
+    """Unique identifier for the answered query"""
+    results: List[InlineQueryResult] = field()
+    """A JSON-serialized array of results for the inline query"""
+    cache_time: Optional[int] = field(default=None)
+    """The maximum amount of time in seconds that the result of the inline
+    query may be cached on the server. Defaults to 300."""
+    is_personal: Optional[bool] = field(default=None)
+    """Pass True if results may be cached on the server side only for the
+    user that sent the query. By default, results may be returned to any
+    user who sends the same query."""
+    next_offset: Optional[str] = field(default=None)
+    """Pass the offset that a client should send in the next query with the
+    same text to receive more results. Pass an empty string if there are
+    no more results or if you don't support pagination. Offset length
+    can't exceed 64 bytes."""
+    button: Optional[InlineQueryResultsButton] = field(default=None)
+    """A JSON-serialized object describing a button to be shown above inline
+    query results"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/answerInlineQuery",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _AnswerInlineQueryResult.decode(data).unwrap()
+
+
+_AnswerInlineQueryResult = result_decoder(bool)
+
+
+
+
+class AnswerWebAppQuery(
+    Path[SentWebAppMessage],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set the result of an interaction with a [Web
+    App](/bots/webapps) and send a corresponding message on behalf of the
+    user to the chat from which the query originated. On success, a
+    [SentWebAppMessage](#sentwebappmessage) object is returned.
+    """
+    web_app_query_id: str = field()
+    """Unique identifier for the query to be answered"""
+    result: InlineQueryResult = field()
+    """A JSON-serialized object describing the message to be sent"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/answerWebAppQuery",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> SentWebAppMessage:
+        return _AnswerWebAppQueryResult.decode(data).unwrap()
+
+
+_AnswerWebAppQueryResult = result_decoder(SentWebAppMessage)
+
+
+
+
+class SendInvoice(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send invoices. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: Union[int, str] = field()
+    """Unique identifier for the target chat or username of the target
+    channel (in the format @channelusername)"""
+    title: str = field()
+    """Product name, 1-32 characters"""
+    description: str = field()
+    """Product description, 1-255 characters"""
+    payload: str = field()
+    """Bot-defined invoice payload, 1-128 bytes. This will not be displayed
+    to the user, use for your internal processes."""
+    provider_token: str = field()
+    """Payment provider token, obtained via @BotFather"""
+    currency: str = field()
+    """Three-letter ISO 4217 currency code, see more on currencies"""
+    prices: List[LabeledPrice] = field()
+    """Price breakdown, a JSON-serialized list of components (e.g. product
+    price, tax, discount, delivery cost, delivery tax, bonus, etc.)"""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    max_tip_amount: Optional[int] = field(default=None)
+    """The maximum accepted amount for tips in the smallest units of the
+    currency (integer, not float/double). For example, for a maximum tip
+    of US$ 1.45 pass max_tip_amount = 145. See the exp parameter in
+    currencies.json, it shows the number of digits past the decimal point
+    for each currency (2 for the majority of currencies). Defaults to 0"""
+    suggested_tip_amounts: Optional[List[int]] = field(default=None)
+    """A JSON-serialized array of suggested amounts of tips in the smallest
+    units of the currency (integer, not float/double). At most 4 suggested
+    tip amounts can be specified. The suggested tip amounts must be
+    positive, passed in a strictly increased order and must not exceed
+    max_tip_amount."""
+    start_parameter: Optional[str] = field(default=None)
+    """Unique deep-linking parameter. If left empty, forwarded copies of the
+    sent message will have a Pay button, allowing multiple users to pay
+    directly from the forwarded message, using the same invoice. If non-
+    empty, forwarded copies of the sent message will have a URL button
+    with a deep link to the bot (instead of a Pay button), with the value
+    used as the start parameter"""
+    provider_data: Optional[str] = field(default=None)
+    """JSON-serialized data about the invoice, which will be shared with the
+    payment provider. A detailed description of required fields should be
+    provided by the payment provider."""
+    photo_url: Optional[str] = field(default=None)
+    """URL of the product photo for the invoice. Can be a photo of the goods
+    or a marketing image for a service. People like it better when they
+    see what they are paying for."""
+    photo_size: Optional[int] = field(default=None)
+    """Photo size in bytes"""
+    photo_width: Optional[int] = field(default=None)
+    """Photo width"""
+    photo_height: Optional[int] = field(default=None)
+    """Photo height"""
+    need_name: Optional[bool] = field(default=None)
+    """Pass True if you require the user's full name to complete the order"""
+    need_phone_number: Optional[bool] = field(default=None)
+    """Pass True if you require the user's phone number to complete the order"""
+    need_email: Optional[bool] = field(default=None)
+    """Pass True if you require the user's email address to complete the
+    order"""
+    need_shipping_address: Optional[bool] = field(default=None)
+    """Pass True if you require the user's shipping address to complete the
+    order"""
+    send_phone_number_to_provider: Optional[bool] = field(default=None)
+    """Pass True if the user's phone number should be sent to provider"""
+    send_email_to_provider: Optional[bool] = field(default=None)
+    """Pass True if the user's email address should be sent to provider"""
+    is_flexible: Optional[bool] = field(default=None)
+    """Pass True if the final price depends on the shipping method"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for an inline keyboard. If empty, one 'Pay
+    total price' button will be shown. If not empty, the first button must
+    be a Pay button."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendInvoice",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendInvoiceResult.decode(data).unwrap()
+
+
+_SendInvoiceResult = result_decoder(Message)
+
+
+
+
+class CreateInvoiceLink(
+    Path[str],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to create a link for an invoice. Returns the created
+    invoice link as *String* on success.
+    """
+    title: str = field()
+    """Product name, 1-32 characters"""
+    description: str = field()
+    """Product description, 1-255 characters"""
+    payload: str = field()
+    """Bot-defined invoice payload, 1-128 bytes. This will not be displayed
+    to the user, use for your internal processes."""
+    provider_token: str = field()
+    """Payment provider token, obtained via BotFather"""
+    currency: str = field()
+    """Three-letter ISO 4217 currency code, see more on currencies"""
+    prices: List[LabeledPrice] = field()
+    """Price breakdown, a JSON-serialized list of components (e.g. product
+    price, tax, discount, delivery cost, delivery tax, bonus, etc.)"""
+    max_tip_amount: Optional[int] = field(default=None)
+    """The maximum accepted amount for tips in the smallest units of the
+    currency (integer, not float/double). For example, for a maximum tip
+    of US$ 1.45 pass max_tip_amount = 145. See the exp parameter in
+    currencies.json, it shows the number of digits past the decimal point
+    for each currency (2 for the majority of currencies). Defaults to 0"""
+    suggested_tip_amounts: Optional[List[int]] = field(default=None)
+    """A JSON-serialized array of suggested amounts of tips in the smallest
+    units of the currency (integer, not float/double). At most 4 suggested
+    tip amounts can be specified. The suggested tip amounts must be
+    positive, passed in a strictly increased order and must not exceed
+    max_tip_amount."""
+    provider_data: Optional[str] = field(default=None)
+    """JSON-serialized data about the invoice, which will be shared with the
+    payment provider. A detailed description of required fields should be
+    provided by the payment provider."""
+    photo_url: Optional[str] = field(default=None)
+    """URL of the product photo for the invoice. Can be a photo of the goods
+    or a marketing image for a service."""
+    photo_size: Optional[int] = field(default=None)
+    """Photo size in bytes"""
+    photo_width: Optional[int] = field(default=None)
+    """Photo width"""
+    photo_height: Optional[int] = field(default=None)
+    """Photo height"""
+    need_name: Optional[bool] = field(default=None)
+    """Pass True if you require the user's full name to complete the order"""
+    need_phone_number: Optional[bool] = field(default=None)
+    """Pass True if you require the user's phone number to complete the order"""
+    need_email: Optional[bool] = field(default=None)
+    """Pass True if you require the user's email address to complete the
+    order"""
+    need_shipping_address: Optional[bool] = field(default=None)
+    """Pass True if you require the user's shipping address to complete the
+    order"""
+    send_phone_number_to_provider: Optional[bool] = field(default=None)
+    """Pass True if the user's phone number should be sent to the provider"""
+    send_email_to_provider: Optional[bool] = field(default=None)
+    """Pass True if the user's email address should be sent to the provider"""
+    is_flexible: Optional[bool] = field(default=None)
+    """Pass True if the final price depends on the shipping method"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/createInvoiceLink",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> str:
+        return _CreateInvoiceLinkResult.decode(data).unwrap()
+
+
+_CreateInvoiceLinkResult = result_decoder(str)
+
+
+
+
+class AnswerShippingQuery(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    If you sent an invoice requesting a shipping address and the parameter
+    *is\_flexible* was specified, the Bot API will send an
+    [Update](#update) with a *shipping\_query* field to the bot. Use this
+    method to reply to shipping queries. On success, *True* is returned.
+    """
+    shipping_query_id: str = field()
+    """Unique identifier for the query to be answered"""
+    ok: bool = field()
+    """Pass True if delivery to the specified address is possible and False
+    if there are any problems (for example, if delivery to the specified
+    address is not possible)"""
+    shipping_options: Optional[List[ShippingOption]] = field(default=None)
+    """Required if ok is True. A JSON-serialized array of available shipping
+    options."""
+    error_message: Optional[str] = field(default=None)
+    """Required if ok is False. Error message in human readable form that
+    explains why it is impossible to complete the order (e.g. "Sorry,
+    delivery to your desired address is unavailable'). Telegram will
+    display this message to the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/answerShippingQuery",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _AnswerShippingQueryResult.decode(data).unwrap()
+
+
+_AnswerShippingQueryResult = result_decoder(bool)
+
+
+
+
+class AnswerPreCheckoutQuery(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Once the user has confirmed their payment and shipping details, the
+    Bot API sends the final confirmation in the form of an
+    [Update](#update) with the field *pre\_checkout\_query*. Use this
+    method to respond to such pre-checkout queries. On success, *True* is
+    returned. **Note:** The Bot API must receive an answer within 10
+    seconds after the pre-checkout query was sent.
+    """
+    pre_checkout_query_id: str = field()
+    """Unique identifier for the query to be answered"""
+    ok: bool = field()
+    """Specify True if everything is alright (goods are available, etc.) and
+    the bot is ready to proceed with the order. Use False if there are any
+    problems."""
+    error_message: Optional[str] = field(default=None)
+    """Required if ok is False. Error message in human readable form that
+    explains the reason for failure to proceed with the checkout (e.g.
+    "Sorry, somebody just bought the last of our amazing black T-shirts
+    while you were busy filling out your payment details. Please choose a
+    different color or garment!"). Telegram will display this message to
+    the user."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/answerPreCheckoutQuery",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _AnswerPreCheckoutQueryResult.decode(data).unwrap()
+
+
+_AnswerPreCheckoutQueryResult = result_decoder(bool)
+
+
+
+
+class SetPassportDataErrors(
+    Path[bool],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Informs a user that some of the Telegram Passport elements they
+    provided contains errors. The user will not be able to re-submit their
+    Passport to you until the errors are fixed (the contents of the field
+    for which you returned the error must change). Returns *True* on
+    success.
+    
+    Use this if the data submitted by the user doesn't satisfy the
+    standards your service requires for any reason. For example, if a
+    birthday date seems invalid, a submitted document is blurry, a scan
+    shows evidence of tampering, etc. Supply some details in the error
+    message to make sure the user knows how to correct the issues.
+    """
+    user_id: int = field()
+    """User identifier"""
+    errors: List[PassportElementError] = field()
+    """A JSON-serialized array describing the errors"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setPassportDataErrors",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> bool:
+        return _SetPassportDataErrorsResult.decode(data).unwrap()
+
+
+_SetPassportDataErrorsResult = result_decoder(bool)
+
+
+
+
+class SendGame(
+    Path[Message],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to send a game. On success, the sent
+    [Message](#message) is returned.
+    """
+    limited: ClassVar[bool] = True
+    chat_id: int = field()
+    """Unique identifier for the target chat"""
+    game_short_name: str = field()
+    """Short name of the game, serves as the unique identifier for the game.
+    Set up your games via @BotFather."""
+    message_thread_id: Optional[int] = field(default=None)
+    """Unique identifier for the target message thread (topic) of the forum;
+    for forum supergroups only"""
+    disable_notification: Optional[bool] = field(default=None)
+    """Sends the message silently. Users will receive a notification with no
+    sound."""
+    protect_content: Optional[bool] = field(default=None)
+    """Protects the contents of the sent message from forwarding and saving"""
+    reply_to_message_id: Optional[int] = field(default=None)
+    """If the message is a reply, ID of the original message"""
+    allow_sending_without_reply: Optional[bool] = field(default=None)
+    """Pass True if the message should be sent even if the specified replied-
+    to message is not found"""
+    reply_markup: Union[InlineKeyboardMarkup, Raw, None] = field(default=None)
+    """A JSON-serialized object for an inline keyboard. If empty, one 'Play
+    game_title' button will be shown. If not empty, the first button must
+    launch the game."""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/sendGame",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Message:
+        return _SendGameResult.decode(data).unwrap()
+
+
+_SendGameResult = result_decoder(Message)
+
+
+
+
+class SetGameScore(
+    Path[Union[Message, bool]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to set the score of the specified user in a game
+    message. On success, if the message is not an inline message, the
+    [Message](#message) is returned, otherwise *True* is returned. Returns
+    an error, if the new score is not greater than the user's current
+    score in the chat and *force* is *False*.
+    """
+    user_id: int = field()
+    """User identifier"""
+    score: int = field()
+    """New score, must be non-negative"""
+    force: Optional[bool] = field(default=None)
+    """Pass True if the high score is allowed to decrease. This can be useful
+    when fixing mistakes or banning cheaters"""
+    disable_edit_message: Optional[bool] = field(default=None)
+    """Pass True if the game message should not be automatically edited to
+    include the current scoreboard"""
+    chat_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the sent
+    message"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/setGameScore",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> Union[Message, bool]:
+        return _SetGameScoreResult.decode(data).unwrap()
+
+
+_SetGameScoreResult = result_decoder(Union[Message, bool])
+
+
+
+
+class GetGameHighScores(
+    Path[List[GameHighScore]],
+    kw_only=True,
+    omit_defaults=True
+):
+    """
+    Use this method to get data for high score tables. Will return the
+    score of the specified user and several of their neighbors in a game.
+    Returns an Array of [GameHighScore](#gamehighscore) objects.
+    """
+    user_id: int = field()
+    """Target user id"""
+    chat_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Unique identifier for
+    the target chat"""
+    message_id: Optional[int] = field(default=None)
+    """Required if inline_message_id is not specified. Identifier of the sent
+    message"""
+    inline_message_id: Optional[str] = field(default=None)
+    """Required if chat_id and message_id are not specified. Identifier of
+    the inline message"""
+
+    def build_request(self) -> Request:
+        return Request(
+            url="/getGameHighScores",
+            content=encode(self),
+            headers=JSON_HEADERS,
+        )
+
+    def build_result(self, data: Buffer) -> List[GameHighScore]:
+        return _GetGameHighScoresResult.decode(data).unwrap()
+
+
+_GetGameHighScoresResult = result_decoder(List[GameHighScore])
+
+
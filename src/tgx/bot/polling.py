@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Set
+
+import httpx
+import msgspec
+
+from ._base import Handler, TelegramError
+from ._client import BaseClient
+from .codec import Result, get_decoder
+from .paths import GetUpdates
+from .schemas import Update
+
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateId(msgspec.Struct):
+    update_id: int
+
+
+batch_decoder: msgspec.json.Decoder[Result[List[msgspec.Raw]]] = get_decoder(
+    Result[List[msgspec.Raw]]
+)
+update_id_decoder: msgspec.json.Decoder[UpdateId] = get_decoder(UpdateId)
+
+
+class Poller:
+    """
+    Long polling loop over getUpdates. The next request is sent as soon as
+    the body of the previous one arrives: only the id of its last update
+    is decoded to advance `offset`, the batch itself is decoded into
+    `type` and handed to `handler` while the next request waits on the
+    network. At most `concurrency` handlers run at once if it is set,
+    further updates wait for a free slot. Without `allowed_updates` those
+    of the handler (e.g. a Dispatcher) are requested.
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        handler: Handler,
+        *,
+        type: Any = Update,
+        timeout: int = 30,
+        limit: int = 100,
+        allowed_updates: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        backoff: float = 1.0,
+    ) -> None:
+        self.client = client
+        self.handler = handler
+        self.decoder = get_decoder(type)
+        self.timeout = timeout
+        self.limit = limit
+        self.allowed_updates = allowed_updates
+        self.offset = offset
+        self.concurrency = concurrency
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.backoff = backoff
+        self.tasks: Set[asyncio.Future[Any]] = set()
+        self.pending: Optional[asyncio.Future[List[msgspec.Raw]]] = None
+        self.running = False
+        # The server holds the request for up to `timeout` seconds, so
+        # the read timeout of the client only starts after that.
+        base = client.http.timeout
+        self.http_timeout = httpx.Timeout(
+            connect=base.connect,
+            read=None if base.read is None else base.read + timeout,
+            write=base.write,
+            pool=base.pool,
+        )
+
+    async def get(self, offset: Optional[int]) -> List[msgspec.Raw]:
+        """Fetch the raw updates after `offset`, retrying transient errors."""
+        allowed_updates = self.allowed_updates
+        if allowed_updates is None:
+            allowed_updates = getattr(self.handler, "allowed_updates", None)
+        request = GetUpdates(
+            offset=offset,
+            limit=self.limit,
+            timeout=self.timeout,
+            allowed_updates=allowed_updates,
+        ).build_request()
+        while True:
+            try:
+                data = await self.client.send(request, timeout=self.http_timeout)
+                return batch_decoder.decode(data).unwrap() or []
+            except httpx.TransportError as e:
+                logger.warning("getUpdates failed: %r", e)
+                await asyncio.sleep(self.backoff)
+            except msgspec.DecodeError as e:
+                # e.g. an html error page of a proxy in front of the API
+                logger.warning("getUpdates returned an invalid body: %s", e)
+                await asyncio.sleep(self.backoff)
+            except TelegramError as e:
+                if e.parameters is not None and e.parameters.retry_after:
+                    await asyncio.sleep(e.parameters.retry_after)
+                elif e.error_code >= 500:
+                    logger.warning("getUpdates failed: %s", e)
+                    await asyncio.sleep(self.backoff)
+                else:
+                    raise
+
+    async def handle(self, update: Any) -> None:
+        try:
+            await self.handler(update)
+        except Exception:
+            logger.exception(
+                "Error handling update %s", getattr(update, "update_id", None)
+            )
+        finally:
+            if self.semaphore is not None:
+                self.semaphore.release()
+
+    async def dispatch(self, batch: List[msgspec.Raw]) -> None:
+        for raw in batch:
+            try:
+                update = self.decoder.decode(raw)
+            except msgspec.DecodeError:
+                logger.exception("Error decoding update %r", bytes(raw))
+                continue
+            if self.semaphore is not None:
+                await self.semaphore.acquire()
+            task = asyncio.ensure_future(self.handle(update))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def run(self) -> None:
+        """Poll until `stop` is called, then wait for running handlers."""
+        self.running = True
+        if self.concurrency:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.pending = asyncio.ensure_future(self.get(self.offset))
+        try:
+            while self.running:
+                try:
+                    batch = await self.pending
+                except asyncio.CancelledError:
+                    if self.running:
+                        raise
+                    break
+                if batch:
+                    last = update_id_decoder.decode(batch[-1])
+                    self.offset = last.update_id + 1
+                self.pending = asyncio.ensure_future(self.get(self.offset))
+                # Let the next request go out before decoding this batch.
+                await asyncio.sleep(0)
+                await self.dispatch(batch)
+        finally:
+            self.running = False
+            self.pending.cancel()
+            if self.tasks:
+                await asyncio.gather(*self.tasks)
+
+    def stop(self) -> None:
+        self.running = False
+        if self.pending is not None:
+            self.pending.cancel()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, Optional, Union
+
+
+ChatId = Union[int, str]
+
+
+class TokenBucket:
+    """
+    Token bucket in its GCRA form: instead of counting tokens it keeps the
+    theoretical arrival time `tat` of the next request, so a reservation
+    is a couple of float operations and an idle bucket is simply one whose
+    `tat` is in the past.
+    """
+
+    __slots__ = ("interval", "tolerance", "tat")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.interval = 1 / rate
+        self.tolerance = (burst - 1) * self.interval
+        self.tat = 0.0
+
+    def earliest(self, now: float) -> float:
+        """Earliest time a request is allowed at."""
+        return max(now, self.tat - self.tolerance)
+
+    def commit(self, at: float) -> None:
+        """Consume a token for a request sent at `at`."""
+        self.tat = max(self.tat, at) + self.interval
+
+
+class RateLimiter:
+    """
+    Schedules Bot API calls within Telegram limits: `global_rate` messages
+    per second over all chats, `private_rate` per private chat and
+    `group_rate` per group or channel (negative or `@username` chat ids).
+    Reservations are made synchronously, so concurrent callers are spread
+    out instead of all waking up at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_rate: float = 30.0,
+        private_rate: float = 1.0,
+        group_rate: float = 20 / 60,
+        burst: int = 1,
+        retries: int = 3,
+        prune_every: int = 1024,
+    ) -> None:
+        self.global_bucket = TokenBucket(global_rate, burst)
+        self.private_rate = private_rate
+        self.group_rate = group_rate
+        self.burst = burst
+        self.retries = retries
+        self.prune_every = prune_every
+        self.paused_until = 0.0
+        self.buckets: Dict[ChatId, TokenBucket] = {}
+        self._acquired = 0
+
+    def bucket(self, chat_id: ChatId) -> TokenBucket:
+        bucket = self.buckets.get(chat_id)
+        if bucket is None:
+            private = isinstance(chat_id, int) and chat_id > 0
+            rate = self.private_rate if private else self.group_rate
+            bucket = self.buckets[chat_id] = TokenBucket(rate, self.burst)
+        return bucket
+
+    def reserve(self, chat_id: ChatId, now: Optional[float] = None) -> float:
+        """Reserve a slot for a call to `chat_id`, return the delay."""
+        if now is None:
+            now = time.monotonic()
+        self._acquired += 1
+        if self._acquired % self.prune_every == 0:
+            self.prune(now)
+        bucket = self.bucket(chat_id)
+        at = max(
+            self.paused_until,
+            self.global_bucket.earliest(now),
+            bucket.earliest(now),
+        )
+        self.global_bucket.commit(at)
+        bucket.commit(at)
+        return at - now
+
+    async def acquire(self, chat_id: ChatId) -> None:
+        delay = self.reserve(chat_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, retry_after: float) -> None:
+        """Hold every call for `retry_after` seconds after a 429."""
+        self.paused_until = max(
+            self.paused_until, time.monotonic() + retry_after
+        )
+
+    def prune(self, now: float) -> None:
+        """Drop idle buckets, they are equal to fresh ones."""
+        self.buckets = {
+            k: b for k, b in self.buckets.items() if b.tat > now
+        }
@@ -2,14 +2,34 @@ from __future__ import annotations
 from typing import List, Optional, Union
 
 from ._base import Schema, field
-
-
+from .enums import (
+    ChatType,
+    MessageEntityType,
+    PollType,
+    StickerType,
+    MaskPositionPoint,
+    InlineQueryChatType,
+    InlineQueryResultGifThumbnailMimeType,
+    InlineQueryResultDocumentMimeType,
+    EncryptedPassportElementType,
+    PassportElementErrorDataFieldType,
+    PassportElementErrorFrontSideType,
+    PassportElementErrorReverseSideType,
+    PassportElementErrorFileType,
+    PassportElementErrorTranslationFileType,
+)
+from .files import InputFile
+
+
+API_VERSION = "6.9"
+"""Version of the Bot API the schemas are generated from"""
 
 
 class Update(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This [object](#available-types) represents an incoming update.
@@ -76,7 +96,8 @@ class Update(
 class WebhookInfo(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes the current status of a webhook.
@@ -112,7 +133,9 @@ class WebhookInfo(
 class User(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False,
+    frozen=True
 ):
     """
     This object represents a Telegram user or bot.
@@ -147,13 +170,27 @@ class User(
     """Optional. True, if the bot supports inline queries. Returned only in
     getMe."""
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id  # type: ignore[attr-defined]
+
+    def __ne__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id != other.id  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
 
 
 
 class Chat(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    frozen=True
 ):
     """
     This object represents a chat.
@@ -164,7 +201,7 @@ class Chat(
     difficulty/silent defects in interpreting it. But it has at most 52
     significant bits, so a signed 64-bit integer or double-precision float
     type are safe for storing this identifier."""
-    type: str = field()
+    type: ChatType = field()
     """Type of chat, can be either “private”, “group”, “supergroup” or
     “channel”"""
     title: Optional[str] = field(default=None)
@@ -253,6 +290,19 @@ class Chat(
     """Optional. For supergroups, the location to which the supergroup is
     connected. Returned only in getChat."""
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id  # type: ignore[attr-defined]
+
+    def __ne__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id != other.id  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
 
 
 
@@ -473,7 +523,8 @@ class Message(
 class MessageId(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a unique message identifier.
@@ -487,13 +538,14 @@ class MessageId(
 class MessageEntity(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents one special entity in a text message. For
     example, hashtags, usernames, URLs, etc.
     """
-    type: str = field()
+    type: MessageEntityType = field()
     """Type of the entity. Currently, can be “mention” (@username), “hashtag”
     (#hashtag), “cashtag” ($USD), “bot_command” (/start@jobs_bot), “url”
     (https://telegram.org), “email” (do-not-reply@telegram.org),
@@ -525,7 +577,8 @@ class MessageEntity(
 class PhotoSize(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents one size of a photo or a [file](#document) /
@@ -551,7 +604,8 @@ class PhotoSize(
 class Animation(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an animation file (GIF or H.264/MPEG-4 AVC
@@ -589,7 +643,8 @@ class Animation(
 class Audio(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an audio file to be treated as music by the
@@ -627,7 +682,8 @@ class Audio(
 class Document(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a general file (as opposed to
@@ -660,7 +716,8 @@ class Document(
 class Story(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a message about a forwarded story in the chat.
@@ -675,7 +732,8 @@ class Story(
 class Video(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a video file.
@@ -712,7 +770,8 @@ class Video(
 class VideoNote(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a [video
@@ -743,7 +802,8 @@ class VideoNote(
 class Voice(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a voice note.
@@ -772,7 +832,8 @@ class Voice(
 class Contact(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a phone contact.
@@ -798,7 +859,8 @@ class Contact(
 class Dice(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an animated emoji that displays a random value.
@@ -815,7 +877,8 @@ class Dice(
 class PollOption(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains information about one answer option in a poll.
@@ -831,7 +894,8 @@ class PollOption(
 class PollAnswer(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an answer of a user in a non-anonymous poll.
@@ -854,7 +918,8 @@ class PollAnswer(
 class Poll(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains information about a poll.
@@ -871,7 +936,7 @@ class Poll(
     """True, if the poll is closed"""
     is_anonymous: bool = field()
     """True, if the poll is anonymous"""
-    type: str = field()
+    type: PollType = field()
     """Poll type, currently can be “regular” or “quiz”"""
     allows_multiple_answers: bool = field()
     """True, if the poll allows multiple answers"""
@@ -898,7 +963,9 @@ class Poll(
 class Location(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False,
+    frozen=True
 ):
     """
     This object represents a point on the map.
@@ -926,7 +993,8 @@ class Location(
 class Venue(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a venue.
@@ -954,7 +1022,8 @@ class Venue(
 class WebAppData(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes data sent from a [Web App](/bots/webapps) to the bot.
@@ -972,7 +1041,8 @@ class WebAppData(
 class ProximityAlertTriggered(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents the content of a service message, sent whenever
@@ -991,7 +1061,8 @@ class ProximityAlertTriggered(
 class MessageAutoDeleteTimerChanged(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a change in auto-delete
@@ -1006,7 +1077,8 @@ class MessageAutoDeleteTimerChanged(
 class ForumTopicCreated(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a new forum topic
@@ -1026,7 +1098,8 @@ class ForumTopicCreated(
 class ForumTopicClosed(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a forum topic closed in
@@ -1041,7 +1114,8 @@ class ForumTopicClosed(
 class ForumTopicEdited(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about an edited forum topic.
@@ -1058,7 +1132,8 @@ class ForumTopicEdited(
 class ForumTopicReopened(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a forum topic reopened
@@ -1073,7 +1148,8 @@ class ForumTopicReopened(
 class GeneralForumTopicHidden(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about General forum topic
@@ -1088,7 +1164,8 @@ class GeneralForumTopicHidden(
 class GeneralForumTopicUnhidden(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about General forum topic
@@ -1103,7 +1180,8 @@ class GeneralForumTopicUnhidden(
 class UserShared(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains information about the user whose identifier was
@@ -1127,7 +1205,8 @@ class UserShared(
 class ChatShared(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains information about the chat whose identifier was
@@ -1151,7 +1230,8 @@ class ChatShared(
 class WriteAccessAllowed(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a user allowing a bot
@@ -1176,7 +1256,8 @@ class WriteAccessAllowed(
 class VideoChatScheduled(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a video chat scheduled
@@ -1192,7 +1273,8 @@ class VideoChatScheduled(
 class VideoChatStarted(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a video chat started in
@@ -1207,7 +1289,8 @@ class VideoChatStarted(
 class VideoChatEnded(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about a video chat ended in
@@ -1222,7 +1305,8 @@ class VideoChatEnded(
 class VideoChatParticipantsInvited(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a service message about new members invited to
@@ -1237,14 +1321,15 @@ class VideoChatParticipantsInvited(
 class UserProfilePhotos(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represent a user's profile pictures.
     """
     total_count: int = field()
     """Total number of profile pictures the target user has"""
-    photos: List[PhotoSize] = field()
+    photos: List[List[PhotoSize]] = field()
     """Requested profile pictures (in up to 4 sizes each)"""
 
 
@@ -1253,7 +1338,8 @@ class UserProfilePhotos(
 class File(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a file ready to be downloaded. The file can be
@@ -1286,7 +1372,8 @@ class File(
 class WebAppInfo(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes a [Web App](/bots/webapps).
@@ -1301,14 +1388,15 @@ class WebAppInfo(
 class ReplyKeyboardMarkup(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a [custom keyboard](/bots/features#keyboards)
     with reply options (see [Introduction to
     bots](/bots/features#keyboards) for details and examples).
     """
-    keyboard: List[KeyboardButton] = field()
+    keyboard: List[List[KeyboardButton]] = field()
     """Array of button rows, each represented by an Array of KeyboardButton
     objects"""
     is_persistent: Optional[bool] = field(default=None)
@@ -1344,7 +1432,8 @@ class ReplyKeyboardMarkup(
 class KeyboardButton(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents one button of the reply keyboard. For simple
@@ -1399,7 +1488,8 @@ class KeyboardButton(
 class KeyboardButtonRequestUser(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object defines the criteria used to request a suitable user. The
@@ -1424,7 +1514,8 @@ class KeyboardButtonRequestUser(
 class KeyboardButtonRequestChat(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object defines the criteria used to request a suitable chat. The
@@ -1469,7 +1560,8 @@ class KeyboardButtonRequestChat(
 class KeyboardButtonPollType(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents type of a poll, which is allowed to be created
@@ -1487,7 +1579,8 @@ class KeyboardButtonPollType(
 class ReplyKeyboardRemove(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Upon receiving a message with this object, Telegram clients will
@@ -1516,7 +1609,8 @@ class ReplyKeyboardRemove(
 class InlineKeyboardMarkup(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an [inline keyboard](/bots/features#inline-
@@ -1525,7 +1619,7 @@ class InlineKeyboardMarkup(
     **Note:** This will only work in Telegram versions released after 9
     April, 2016. Older clients will display *unsupported message*.
     """
-    inline_keyboard: List[InlineKeyboardButton] = field()
+    inline_keyboard: List[List[InlineKeyboardButton]] = field()
     """Array of button rows, each represented by an Array of
     InlineKeyboardButton objects"""
 
@@ -1535,7 +1629,8 @@ class InlineKeyboardMarkup(
 class InlineKeyboardButton(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents one button of an inline keyboard. You **must**
@@ -1589,7 +1684,8 @@ class InlineKeyboardButton(
 class LoginUrl(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a parameter of the inline keyboard button used
@@ -1628,7 +1724,8 @@ class LoginUrl(
 class SwitchInlineQueryChosenChat(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an inline button that switches the current user
@@ -1653,7 +1750,8 @@ class SwitchInlineQueryChosenChat(
 class CallbackQuery(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an incoming callback query from a callback
@@ -1693,7 +1791,8 @@ class CallbackQuery(
 class ForceReply(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Upon receiving a message with this object, Telegram clients will
@@ -1720,7 +1819,8 @@ class ForceReply(
 class ChatPhoto(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a chat photo.
@@ -1748,7 +1848,8 @@ class ChatPhoto(
 class ChatInviteLink(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents an invite link for a chat.
@@ -1783,7 +1884,8 @@ class ChatInviteLink(
 class ChatAdministratorRights(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents the rights of an administrator in a chat.
@@ -1837,25 +1939,11 @@ class ChatAdministratorRights(
 
 
 
-class ChatMember(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object contains information about one member of a chat.
-    Currently, the following 6 types of chat members are supported:
-    """
-    ...
-
-
-
-
-
 class ChatMemberOwner(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="creator",
     tag_field="status"
 ):
@@ -1877,6 +1965,7 @@ class ChatMemberAdministrator(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="administrator",
     tag_field="status"
 ):
@@ -1944,6 +2033,7 @@ class ChatMemberMember(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="member",
     tag_field="status"
 ):
@@ -1961,6 +2051,7 @@ class ChatMemberRestricted(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="restricted",
     tag_field="status"
 ):
@@ -2015,6 +2106,7 @@ class ChatMemberLeft(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="left",
     tag_field="status"
 ):
@@ -2032,6 +2124,7 @@ class ChatMemberBanned(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="kicked",
     tag_field="status"
 ):
@@ -2051,7 +2144,8 @@ class ChatMemberBanned(
 class ChatMemberUpdated(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents changes in the status of a chat member.
@@ -2079,7 +2173,8 @@ class ChatMemberUpdated(
 class ChatJoinRequest(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents a join request sent to a chat.
@@ -2111,7 +2206,8 @@ class ChatJoinRequest(
 class ChatPermissions(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes actions that a non-administrator user is allowed to take in
@@ -2158,7 +2254,9 @@ class ChatPermissions(
 class ChatLocation(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False,
+    frozen=True
 ):
     """
     Represents a location to which a chat is connected.
@@ -2175,7 +2273,8 @@ class ChatLocation(
 class ForumTopic(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a forum topic.
@@ -2196,7 +2295,9 @@ class ForumTopic(
 class BotCommand(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False,
+    frozen=True
 ):
     """
     This object represents a bot command.
@@ -2210,25 +2311,11 @@ class BotCommand(
 
 
 
-class BotCommandScope(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object represents the scope to which bot commands are applied.
-    Currently, the following 7 scopes are supported:
-    """
-    ...
-
-
-
-
-
 class BotCommandScopeDefault(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="default",
     tag_field="type"
 ):
@@ -2247,6 +2334,7 @@ class BotCommandScopeAllPrivateChats(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="all_private_chats",
     tag_field="type"
 ):
@@ -2264,6 +2352,7 @@ class BotCommandScopeAllGroupChats(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="all_group_chats",
     tag_field="type"
 ):
@@ -2281,6 +2370,7 @@ class BotCommandScopeAllChatAdministrators(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="all_chat_administrators",
     tag_field="type"
 ):
@@ -2298,6 +2388,7 @@ class BotCommandScopeChat(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="chat",
     tag_field="type"
 ):
@@ -2316,6 +2407,7 @@ class BotCommandScopeChatAdministrators(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="chat_administrators",
     tag_field="type"
 ):
@@ -2334,6 +2426,7 @@ class BotCommandScopeChatMember(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="chat_member",
     tag_field="type"
 ):
@@ -2353,7 +2446,8 @@ class BotCommandScopeChatMember(
 class BotName(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents the bot's name.
@@ -2367,7 +2461,8 @@ class BotName(
 class BotDescription(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents the bot's description.
@@ -2381,7 +2476,8 @@ class BotDescription(
 class BotShortDescription(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents the bot's short description.
@@ -2392,30 +2488,11 @@ class BotShortDescription(
 
 
 
-class MenuButton(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object describes the bot's menu button in a private chat. It
-    should be one of
-    
-    If a menu button other than [MenuButtonDefault](#menubuttondefault) is
-    set for a private chat, then it is applied in the chat. Otherwise the
-    default menu button is applied. By default, the menu button opens the
-    list of bot commands.
-    """
-    ...
-
-
-
-
-
 class MenuButtonCommands(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="commands",
     tag_field="type"
 ):
@@ -2432,6 +2509,7 @@ class MenuButtonWebApp(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="web_app",
     tag_field="type"
 ):
@@ -2452,6 +2530,7 @@ class MenuButtonDefault(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="default",
     tag_field="type"
 ):
@@ -2467,7 +2546,8 @@ class MenuButtonDefault(
 class ResponseParameters(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes why a request was unsuccessful.
@@ -2486,32 +2566,18 @@ class ResponseParameters(
 
 
 
-class InputMedia(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object represents the content of a media message to be sent. It
-    should be one of
-    """
-    ...
-
-
-
-
-
 class InputMediaPhoto(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="photo",
     tag_field="type"
 ):
     """
     Represents a photo to be sent.
     """
-    media: str = field()
+    media: Union[InputFile, str] = field()
     """File to send. Pass a file_id to send a file that exists on the
     Telegram servers (recommended), pass an HTTP URL for Telegram to get a
     file from the Internet, or pass “attach://<file_attach_name>” to
@@ -2537,13 +2603,14 @@ class InputMediaVideo(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="video",
     tag_field="type"
 ):
     """
     Represents a video to be sent.
     """
-    media: str = field()
+    media: Union[InputFile, str] = field()
     """File to send. Pass a file_id to send a file that exists on the
     Telegram servers (recommended), pass an HTTP URL for Telegram to get a
     file from the Internet, or pass “attach://<file_attach_name>” to
@@ -2586,6 +2653,7 @@ class InputMediaAnimation(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="animation",
     tag_field="type"
 ):
@@ -2593,7 +2661,7 @@ class InputMediaAnimation(
     Represents an animation file (GIF or H.264/MPEG-4 AVC video without
     sound) to be sent.
     """
-    media: str = field()
+    media: Union[InputFile, str] = field()
     """File to send. Pass a file_id to send a file that exists on the
     Telegram servers (recommended), pass an HTTP URL for Telegram to get a
     file from the Internet, or pass “attach://<file_attach_name>” to
@@ -2634,13 +2702,14 @@ class InputMediaAudio(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="audio",
     tag_field="type"
 ):
     """
     Represents an audio file to be treated as music to be sent.
     """
-    media: str = field()
+    media: Union[InputFile, str] = field()
     """File to send. Pass a file_id to send a file that exists on the
     Telegram servers (recommended), pass an HTTP URL for Telegram to get a
     file from the Internet, or pass “attach://<file_attach_name>” to
@@ -2678,13 +2747,14 @@ class InputMediaDocument(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="document",
     tag_field="type"
 ):
     """
     Represents a general file to be sent.
     """
-    media: str = field()
+    media: Union[InputFile, str] = field()
     """File to send. Pass a file_id to send a file that exists on the
     Telegram servers (recommended), pass an HTTP URL for Telegram to get a
     file from the Internet, or pass “attach://<file_attach_name>” to
@@ -2716,26 +2786,11 @@ class InputMediaDocument(
 
 
 
-class InputFile(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object represents the contents of a file to be uploaded. Must be
-    posted using multipart/form-data in the usual way that files are
-    uploaded via the browser.
-    """
-    ...
-
-
-
-
-
 class Sticker(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a sticker.
@@ -2747,7 +2802,7 @@ class Sticker(
     """Unique identifier for this file, which is supposed to be the same over
     time and for different bots. Can't be used to download or reuse the
     file."""
-    type: str = field()
+    type: StickerType = field()
     """Type of the sticker, currently one of “regular”, “mask”,
     “custom_emoji”. The type of the sticker is independent from its
     format, which is determined by the fields is_animated and is_video."""
@@ -2788,7 +2843,8 @@ class Sticker(
 class StickerSet(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a sticker set.
@@ -2797,7 +2853,7 @@ class StickerSet(
     """Sticker set name"""
     title: str = field()
     """Sticker set title"""
-    sticker_type: str = field()
+    sticker_type: StickerType = field()
     """Type of stickers in the set, currently one of “regular”, “mask”,
     “custom_emoji”"""
     is_animated: bool = field()
@@ -2815,13 +2871,14 @@ class StickerSet(
 class MaskPosition(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object describes the position on faces where a mask should be
     placed by default.
     """
-    point: str = field()
+    point: MaskPositionPoint = field()
     """The part of the face relative to which the mask should be placed. One
     of “forehead”, “eyes”, “mouth”, or “chin”."""
     x_shift: float = field()
@@ -2841,7 +2898,8 @@ class MaskPosition(
 class InputSticker(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object describes a sticker to be added to a sticker set.
@@ -2870,7 +2928,8 @@ class InputSticker(
 class InlineQuery(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents an incoming inline query. When the user sends
@@ -2885,7 +2944,7 @@ class InlineQuery(
     """Text of the query (up to 256 characters)"""
     offset: str = field()
     """Offset of the results to be returned, can be controlled by the bot"""
-    chat_type: Optional[str] = field(default=None)
+    chat_type: Optional[InlineQueryChatType] = field(default=None)
     """Optional. Type of the chat from which the inline query was sent. Can
     be either “sender” for a private chat with the inline query sender,
     “private”, “group”, “supergroup”, or “channel”. The chat type should
@@ -2900,7 +2959,8 @@ class InlineQuery(
 class InlineQueryResultsButton(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a button to be shown above inline query
@@ -2928,28 +2988,11 @@ class InlineQueryResultsButton(
 
 
 
-class InlineQueryResult(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object represents one result of an inline query. Telegram clients
-    currently support results of the following 20 types:
-    
-    **Note:** All URLs passed in inline query results will be available to
-    end users and therefore must be assumed to be **public**.
-    """
-    ...
-
-
-
-
-
 class InlineQueryResultArticle(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="article",
     tag_field="type"
 ):
@@ -2985,6 +3028,7 @@ class InlineQueryResultPhoto(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="photo",
     tag_field="type"
 ):
@@ -3030,6 +3074,7 @@ class InlineQueryResultGif(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="gif",
     tag_field="type"
 ):
@@ -3052,7 +3097,7 @@ class InlineQueryResultGif(
     """Optional. Height of the GIF"""
     gif_duration: Optional[int] = field(default=None)
     """Optional. Duration of the GIF in seconds"""
-    thumbnail_mime_type: Optional[str] = field(default=None)
+    thumbnail_mime_type: Optional[InlineQueryResultGifThumbnailMimeType] = field(default=None)
     """Optional. MIME type of the thumbnail, must be one of “image/jpeg”,
     “image/gif”, or “video/mp4”. Defaults to “image/jpeg”"""
     title: Optional[str] = field(default=None)
@@ -3079,6 +3124,7 @@ class InlineQueryResultMpeg4Gif(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="mpeg4_gif",
     tag_field="type"
 ):
@@ -3102,7 +3148,7 @@ class InlineQueryResultMpeg4Gif(
     """Optional. Video height"""
     mpeg4_duration: Optional[int] = field(default=None)
     """Optional. Video duration in seconds"""
-    thumbnail_mime_type: Optional[str] = field(default=None)
+    thumbnail_mime_type: Optional[InlineQueryResultGifThumbnailMimeType] = field(default=None)
     """Optional. MIME type of the thumbnail, must be one of “image/jpeg”,
     “image/gif”, or “video/mp4”. Defaults to “image/jpeg”"""
     title: Optional[str] = field(default=None)
@@ -3129,6 +3175,7 @@ class InlineQueryResultVideo(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="video",
     tag_field="type"
 ):
@@ -3180,6 +3227,7 @@ class InlineQueryResultAudio(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="audio",
     tag_field="type"
 ):
@@ -3222,6 +3270,7 @@ class InlineQueryResultVoice(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="voice",
     tag_field="type"
 ):
@@ -3263,6 +3312,7 @@ class InlineQueryResultDocument(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="document",
     tag_field="type"
 ):
@@ -3282,7 +3332,7 @@ class InlineQueryResultDocument(
     """Title for the result"""
     document_url: str = field()
     """A valid URL for the file"""
-    mime_type: str = field()
+    mime_type: InlineQueryResultDocumentMimeType = field()
     """MIME type of the content of the file, either “application/pdf” or
     “application/zip”"""
     caption: Optional[str] = field(default=None)
@@ -3314,6 +3364,7 @@ class InlineQueryResultLocation(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="location",
     tag_field="type"
 ):
@@ -3364,6 +3415,7 @@ class InlineQueryResultVenue(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="venue",
     tag_field="type"
 ):
@@ -3413,6 +3465,7 @@ class InlineQueryResultContact(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="contact",
     tag_field="type"
 ):
@@ -3454,6 +3507,7 @@ class InlineQueryResultGame(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="game",
     tag_field="type"
 ):
@@ -3478,6 +3532,7 @@ class InlineQueryResultCachedPhoto(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="photo",
     tag_field="type"
 ):
@@ -3516,6 +3571,7 @@ class InlineQueryResultCachedGif(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="gif",
     tag_field="type"
 ):
@@ -3554,6 +3610,7 @@ class InlineQueryResultCachedMpeg4Gif(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="mpeg4_gif",
     tag_field="type"
 ):
@@ -3592,6 +3649,7 @@ class InlineQueryResultCachedSticker(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="sticker",
     tag_field="type"
 ):
@@ -3622,6 +3680,7 @@ class InlineQueryResultCachedDocument(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="document",
     tag_field="type"
 ):
@@ -3663,6 +3722,7 @@ class InlineQueryResultCachedVideo(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="video",
     tag_field="type"
 ):
@@ -3701,6 +3761,7 @@ class InlineQueryResultCachedVoice(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="voice",
     tag_field="type"
 ):
@@ -3740,6 +3801,7 @@ class InlineQueryResultCachedAudio(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="audio",
     tag_field="type"
 ):
@@ -3775,7 +3837,8 @@ class InlineQueryResultCachedAudio(
 class InputMessageContent(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents the content of a message to be sent as a result
@@ -3789,9 +3852,10 @@ class InputMessageContent(
 
 
 class InputTextMessageContent(
-    Schema,
+    InputMessageContent,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents the [content](#inputmessagecontent) of a text message to be
@@ -3812,9 +3876,10 @@ class InputTextMessageContent(
 
 
 class InputLocationMessageContent(
-    Schema,
+    InputMessageContent,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents the [content](#inputmessagecontent) of a location message
@@ -3842,9 +3907,10 @@ class InputLocationMessageContent(
 
 
 class InputVenueMessageContent(
-    Schema,
+    InputMessageContent,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents the [content](#inputmessagecontent) of a venue message to
@@ -3873,9 +3939,10 @@ class InputVenueMessageContent(
 
 
 class InputContactMessageContent(
-    Schema,
+    InputMessageContent,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents the [content](#inputmessagecontent) of a contact message to
@@ -3895,9 +3962,10 @@ class InputContactMessageContent(
 
 
 class InputInvoiceMessageContent(
-    Schema,
+    InputMessageContent,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents the [content](#inputmessagecontent) of an invoice message
@@ -3970,7 +4038,8 @@ class InputInvoiceMessageContent(
 class ChosenInlineResult(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Represents a [result](#inlinequeryresult) of an inline query that was
@@ -4000,7 +4069,8 @@ class ChosenInlineResult(
 class SentWebAppMessage(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes an inline message sent by a [Web App](/bots/webapps) on
@@ -4016,7 +4086,8 @@ class SentWebAppMessage(
 class LabeledPrice(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a portion of the price for goods or services.
@@ -4036,7 +4107,8 @@ class LabeledPrice(
 class Invoice(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains basic information about an invoice.
@@ -4063,7 +4135,8 @@ class Invoice(
 class ShippingAddress(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a shipping address.
@@ -4087,7 +4160,8 @@ class ShippingAddress(
 class OrderInfo(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents information about an order.
@@ -4107,7 +4181,8 @@ class OrderInfo(
 class ShippingOption(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents one shipping option.
@@ -4125,7 +4200,8 @@ class ShippingOption(
 class SuccessfulPayment(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains basic information about a successful payment.
@@ -4155,7 +4231,8 @@ class SuccessfulPayment(
 class ShippingQuery(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains information about an incoming shipping query.
@@ -4175,7 +4252,8 @@ class ShippingQuery(
 class PreCheckoutQuery(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object contains information about an incoming pre-checkout query.
@@ -4205,7 +4283,8 @@ class PreCheckoutQuery(
 class PassportData(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes Telegram Passport data shared with the bot by the user.
@@ -4222,7 +4301,8 @@ class PassportData(
 class PassportFile(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a file uploaded to Telegram Passport. Currently
@@ -4247,13 +4327,14 @@ class PassportFile(
 class EncryptedPassportElement(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes documents or other Telegram Passport elements shared with
     the bot by the user.
     """
-    type: str = field()
+    type: EncryptedPassportElementType = field()
     """Element type. One of “personal_details”, “passport”, “driver_license”,
     “identity_card”, “internal_passport”, “address”, “utility_bill”,
     “bank_statement”, “rental_agreement”, “passport_registration”,
@@ -4309,7 +4390,8 @@ class EncryptedPassportElement(
 class EncryptedCredentials(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     Describes data required for decrypting and authenticating
@@ -4331,26 +4413,11 @@ class EncryptedCredentials(
 
 
 
-class PassportElementError(
-    Schema,
-    kw_only=True,
-    omit_defaults=True
-):
-    """
-    This object represents an error in the Telegram Passport element which
-    was submitted that should be resolved by the user. It should be one
-    of:
-    """
-    ...
-
-
-
-
-
 class PassportElementErrorDataField(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="data",
     tag_field="source"
 ):
@@ -4358,7 +4425,7 @@ class PassportElementErrorDataField(
     Represents an issue in one of the data fields that was provided by the
     user. The error is considered resolved when the field's value changes.
     """
-    type: str = field()
+    type: PassportElementErrorDataFieldType = field()
     """The section of the user's Telegram Passport which has the error, one
     of “personal_details”, “passport”, “driver_license”, “identity_card”,
     “internal_passport”, “address”"""
@@ -4376,6 +4443,7 @@ class PassportElementErrorFrontSide(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="front_side",
     tag_field="source"
 ):
@@ -4384,7 +4452,7 @@ class PassportElementErrorFrontSide(
     considered resolved when the file with the front side of the document
     changes.
     """
-    type: str = field()
+    type: PassportElementErrorFrontSideType = field()
     """The section of the user's Telegram Passport which has the issue, one
     of “passport”, “driver_license”, “identity_card”, “internal_passport”"""
     file_hash: str = field()
@@ -4399,6 +4467,7 @@ class PassportElementErrorReverseSide(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="reverse_side",
     tag_field="source"
 ):
@@ -4407,7 +4476,7 @@ class PassportElementErrorReverseSide(
     considered resolved when the file with reverse side of the document
     changes.
     """
-    type: str = field()
+    type: PassportElementErrorReverseSideType = field()
     """The section of the user's Telegram Passport which has the issue, one
     of “driver_license”, “identity_card”"""
     file_hash: str = field()
@@ -4422,6 +4491,7 @@ class PassportElementErrorSelfie(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="selfie",
     tag_field="source"
 ):
@@ -4429,7 +4499,7 @@ class PassportElementErrorSelfie(
     Represents an issue with the selfie with a document. The error is
     considered resolved when the file with the selfie changes.
     """
-    type: str = field()
+    type: PassportElementErrorFrontSideType = field()
     """The section of the user's Telegram Passport which has the issue, one
     of “passport”, “driver_license”, “identity_card”, “internal_passport”"""
     file_hash: str = field()
@@ -4444,6 +4514,7 @@ class PassportElementErrorFile(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="file",
     tag_field="source"
 ):
@@ -4451,7 +4522,7 @@ class PassportElementErrorFile(
     Represents an issue with a document scan. The error is considered
     resolved when the file with the document scan changes.
     """
-    type: str = field()
+    type: PassportElementErrorFileType = field()
     """The section of the user's Telegram Passport which has the issue, one
     of “utility_bill”, “bank_statement”, “rental_agreement”,
     “passport_registration”, “temporary_registration”"""
@@ -4467,6 +4538,7 @@ class PassportElementErrorFiles(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="files",
     tag_field="source"
 ):
@@ -4474,7 +4546,7 @@ class PassportElementErrorFiles(
     Represents an issue with a list of scans. The error is considered
     resolved when the list of files containing the scans changes.
     """
-    type: str = field()
+    type: PassportElementErrorFileType = field()
     """The section of the user's Telegram Passport which has the issue, one
     of “utility_bill”, “bank_statement”, “rental_agreement”,
     “passport_registration”, “temporary_registration”"""
@@ -4490,6 +4562,7 @@ class PassportElementErrorTranslationFile(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="translation_file",
     tag_field="source"
 ):
@@ -4498,7 +4571,7 @@ class PassportElementErrorTranslationFile(
     translation of a document. The error is considered resolved when the
     file changes.
     """
-    type: str = field()
+    type: PassportElementErrorTranslationFileType = field()
     """Type of element of the user's Telegram Passport which has the issue,
     one of “passport”, “driver_license”, “identity_card”,
     “internal_passport”, “utility_bill”, “bank_statement”,
@@ -4515,6 +4588,7 @@ class PassportElementErrorTranslationFiles(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="translation_files",
     tag_field="source"
 ):
@@ -4523,7 +4597,7 @@ class PassportElementErrorTranslationFiles(
     error is considered resolved when a file with the document translation
     change.
     """
-    type: str = field()
+    type: PassportElementErrorTranslationFileType = field()
     """Type of element of the user's Telegram Passport which has the issue,
     one of “passport”, “driver_license”, “identity_card”,
     “internal_passport”, “utility_bill”, “bank_statement”,
@@ -4540,6 +4614,7 @@ class PassportElementErrorUnspecified(
     Schema,
     kw_only=True,
     omit_defaults=True,
+    gc=False,
     tag="unspecified",
     tag_field="source"
 ):
@@ -4560,7 +4635,8 @@ class PassportElementErrorUnspecified(
 class Game(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents a game. Use BotFather to create and edit games,
@@ -4590,7 +4666,8 @@ class Game(
 class CallbackGame(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     A placeholder, currently holds no information. Use
@@ -4605,7 +4682,8 @@ class CallbackGame(
 class GameHighScore(
     Schema,
     kw_only=True,
-    omit_defaults=True
+    omit_defaults=True,
+    gc=False
 ):
     """
     This object represents one row of the high scores table for a game.
@@ -4622,3 +4700,116 @@ class GameHighScore(
     """Score"""
 
 
+
+
+
+ChatMember = Union[
+    ChatMemberOwner,
+    ChatMemberAdministrator,
+    ChatMemberMember,
+    ChatMemberRestricted,
+    ChatMemberLeft,
+    ChatMemberBanned,
+]
+"""
+This object contains information about one member of a chat. Currently,
+the following 6 types of chat members are supported:
+"""
+
+
+
+BotCommandScope = Union[
+    BotCommandScopeDefault,
+    BotCommandScopeAllPrivateChats,
+    BotCommandScopeAllGroupChats,
+    BotCommandScopeAllChatAdministrators,
+    BotCommandScopeChat,
+    BotCommandScopeChatAdministrators,
+    BotCommandScopeChatMember,
+]
+"""
+This object represents the scope to which bot commands are applied.
+Currently, the following 7 scopes are supported:
+"""
+
+
+
+MenuButton = Union[
+    MenuButtonCommands,
+    MenuButtonWebApp,
+    MenuButtonDefault,
+]
+"""
+This object describes the bot's menu button in a private chat. It should
+be one of
+
+If a menu button other than [MenuButtonDefault](#menubuttondefault) is set
+for a private chat, then it is applied in the chat. Otherwise the default
+menu button is applied. By default, the menu button opens the list of bot
+commands.
+"""
+
+
+
+InputMedia = Union[
+    InputMediaAnimation,
+    InputMediaDocument,
+    InputMediaAudio,
+    InputMediaPhoto,
+    InputMediaVideo,
+]
+"""
+This object represents the content of a media message to be sent. It
+should be one of
+"""
+
+
+
+InlineQueryResult = Union[
+    InlineQueryResultCachedAudio,
+    InlineQueryResultCachedDocument,
+    InlineQueryResultCachedGif,
+    InlineQueryResultCachedMpeg4Gif,
+    InlineQueryResultCachedPhoto,
+    InlineQueryResultCachedSticker,
+    InlineQueryResultCachedVideo,
+    InlineQueryResultCachedVoice,
+    InlineQueryResultArticle,
+    InlineQueryResultAudio,
+    InlineQueryResultContact,
+    InlineQueryResultGame,
+    InlineQueryResultDocument,
+    InlineQueryResultGif,
+    InlineQueryResultLocation,
+    InlineQueryResultMpeg4Gif,
+    InlineQueryResultPhoto,
+    InlineQueryResultVenue,
+    InlineQueryResultVideo,
+    InlineQueryResultVoice,
+]
+"""
+This object represents one result of an inline query. Telegram clients
+currently support results of the following 20 types:
+
+**Note:** All URLs passed in inline query results will be available to end
+users and therefore must be assumed to be **public**.
+"""
+
+
+
+PassportElementError = Union[
+    PassportElementErrorDataField,
+    PassportElementErrorFrontSide,
+    PassportElementErrorReverseSide,
+    PassportElementErrorSelfie,
+    PassportElementErrorFile,
+    PassportElementErrorFiles,
+    PassportElementErrorTranslationFile,
+    PassportElementErrorTranslationFiles,
+    PassportElementErrorUnspecified,
+]
+"""
+This object represents an error in the Telegram Passport element which was
+submitted that should be resolved by the user. It should be one of:
+"""
+
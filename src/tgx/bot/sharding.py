@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import os
+import struct
+import sys
+from typing import Any, List, Optional, Set, Union
+
+import msgspec
+
+from ._base import field
+from .codec import get_decoder
+from .ordering import OrderedHandler, chat_key
+from .schemas import Update
+
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct(">I")
+"""Length prefix of an update in the pipe of a worker"""
+
+
+class Id(msgspec.Struct):
+    id: Union[int, str]
+
+
+class HasChat(msgspec.Struct):
+    chat: Id
+
+
+class FromUser(msgspec.Struct):
+    from_: Id = field(name="from")
+
+
+class Query(msgspec.Struct):
+    from_: Id = field(name="from")
+    message: Optional[HasChat] = None
+
+
+class Answer(msgspec.Struct):
+    user: Optional[Id] = None
+
+
+class KeyUpdate(msgspec.Struct):
+    """Just the parts of Update `chat_key` needs, the rest is skipped."""
+    message: Optional[HasChat] = None
+    edited_message: Optional[HasChat] = None
+    channel_post: Optional[HasChat] = None
+    edited_channel_post: Optional[HasChat] = None
+    inline_query: Optional[FromUser] = None
+    chosen_inline_result: Optional[FromUser] = None
+    callback_query: Optional[Query] = None
+    shipping_query: Optional[FromUser] = None
+    pre_checkout_query: Optional[FromUser] = None
+    poll: Optional[Id] = None
+    poll_answer: Optional[Answer] = None
+    my_chat_member: Optional[HasChat] = None
+    chat_member: Optional[HasChat] = None
+    chat_join_request: Optional[HasChat] = None
+
+
+key_decoder: msgspec.json.Decoder[KeyUpdate] = get_decoder(KeyUpdate)
+
+
+def resolve(target: str) -> Any:
+    """Import `module:attribute`."""
+    module, _, attr = target.partition(":")
+    obj = importlib.import_module(module)
+    for name in attr.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+class Sharder:
+    """
+    Handler of raw updates (use `type=msgspec.Raw` of Poller or Webhook)
+    spreading them over `workers` processes by chat. Only the chat id is
+    decoded here; the update bytes are written to the stdin pipe of the
+    worker the chat hashes to, which decodes and handles them with the
+    `handler` imported from `module:attribute`, in order within a chat.
+    A worker handles at most `max_tasks` updates at once and stops reading
+    its pipe until one is done, so writes to a busy worker wait.
+    A worker that exits is started again by the next update sent to it,
+    the updates it had not read from its pipe yet are lost.
+    """
+
+    def __init__(
+        self,
+        handler: str,
+        workers: Optional[int] = None,
+        *,
+        max_backlog: int = 100,
+        max_tasks: int = 1000,
+    ) -> None:
+        self.handler = handler
+        self.workers = workers or os.cpu_count() or 1
+        self.max_backlog = max_backlog
+        self.max_tasks = max_tasks
+        self.processes: List[asyncio.subprocess.Process] = []
+        self.locks: List[asyncio.Lock] = []
+
+    @property
+    def allowed_updates(self) -> Optional[List[str]]:
+        return getattr(resolve(self.handler), "allowed_updates", None)
+
+    async def spawn(self) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            __name__,
+            self.handler,
+            str(self.max_backlog),
+            str(self.max_tasks),
+            stdin=asyncio.subprocess.PIPE,
+        )
+
+    async def start(self) -> None:
+        for _ in range(self.workers):
+            self.processes.append(await self.spawn())
+            self.locks.append(asyncio.Lock())
+
+    async def process(self, index: int) -> asyncio.subprocess.Process:
+        """Worker `index`, started again if it has exited."""
+        async with self.locks[index]:
+            process = self.processes[index]
+            if process.returncode is not None:
+                logger.error(
+                    "Worker %s exited with %s, restarting",
+                    process.pid,
+                    process.returncode,
+                )
+                process = self.processes[index] = await self.spawn()
+            return process
+
+    async def __call__(self, data: bytes) -> None:
+        key = chat_key(key_decoder.decode(data))
+        index = hash(key) % len(self.processes)
+        frame = HEADER.pack(len(data)) + data
+        for attempt in range(2):
+            process = await self.process(index)
+            assert process.stdin is not None
+            try:
+                process.stdin.write(frame)
+                await process.stdin.drain()
+                return
+            except (BrokenPipeError, ConnectionResetError):
+                if attempt:
+                    raise
+                # The worker died, the next attempt restarts it.
+                await process.wait()
+
+    async def close(self) -> None:
+        """Close the pipes and wait for workers to finish their updates."""
+        for process in self.processes:
+            assert process.stdin is not None
+            process.stdin.close()
+        for process in self.processes:
+            await process.wait()
+        self.processes.clear()
+        self.locks.clear()
+
+    async def __aenter__(self) -> Sharder:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+async def handle(handler: Any, update: Any) -> None:
+    try:
+        await handler(update)
+    except Exception:
+        logger.exception("Error handling update %s", update.update_id)
+
+
+async def work(target: str, max_backlog: int, max_tasks: int) -> None:
+    """
+    Handle the updates written to stdin by a Sharder, with at most
+    `max_tasks` of them in progress.
+    """
+    handler = OrderedHandler(resolve(target), max_backlog=max_backlog)
+    decoder = get_decoder(Update)
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader),
+        sys.stdin.buffer,
+    )
+    tasks: Set[asyncio.Future[None]] = set()
+    slots = asyncio.Semaphore(max_tasks)
+
+    def done(task: asyncio.Future[None]) -> None:
+        tasks.discard(task)
+        slots.release()
+
+    while True:
+        await slots.acquire()
+        try:
+            header = await reader.readexactly(HEADER.size)
+        except asyncio.IncompleteReadError:
+            break
+        (size,) = HEADER.unpack(header)
+        data = await reader.readexactly(size)
+        try:
+            update = decoder.decode(data)
+        except msgspec.DecodeError:
+            logger.exception("Error decoding update %r", data)
+            slots.release()
+            continue
+        task = asyncio.ensure_future(handle(handler, update))
+        tasks.add(task)
+        task.add_done_callback(done)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+if __name__ == "__main__":
+    asyncio.run(work(sys.argv[1], int(sys.argv[2]), int(sys.argv[3])))
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import logging
+from ssl import SSLContext
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple
+
+import msgspec
+
+from ._base import Handler, Path
+from ._client import BaseClient
+from .codec import get_decoder
+from .schemas import Update
+
+
+logger = logging.getLogger(__name__)
+
+
+SECRET_HEADER = b"x-telegram-bot-api-secret-token"
+MAX_BODY = 1 << 20
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+}
+
+
+def response(status: int, body: bytes = b"") -> bytes:
+    head = f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+    if body:
+        head += "Content-Type: application/json\r\n"
+    return f"{head}Content-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+RESPONSES = {status: response(status) for status in REASONS}
+
+
+def reply_body(path: Path[Any]) -> Optional[bytes]:
+    """
+    Encode `path` as a webhook response body, i.e. its json parameters
+    with a `method` field, or None if it has to be sent as multipart.
+    """
+    request = path.build_request()
+    if not isinstance(request.content, bytes):
+        return None
+    method = f'{{"method":"{request.url.lstrip("/")}"'.encode()
+    if request.content == b"{}":
+        return method + b"}"
+    return method + b"," + request.content[1:]
+
+
+class Webhook:
+    """
+    Receiver of webhook updates, usable as an ASGI application or served
+    directly with `serve`. The request body is decoded straight into
+    `type` and acknowledged with 200 as soon as the handler is scheduled,
+    so Telegram's connections are never held by a slow handler. Requests
+    without the `secret_token` given to setWebhook are rejected.
+
+    With `reply_timeout` the response waits up to that many seconds for
+    the handler, and a Path it returns is sent as the response body
+    instead of a separate request. Paths returned later or carrying files
+    are called with `client`.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        *,
+        secret_token: Optional[str] = None,
+        type: Any = Update,
+        max_body: int = MAX_BODY,
+        reply_timeout: Optional[float] = None,
+        client: Optional[BaseClient] = None,
+    ) -> None:
+        self.handler = handler
+        self.secret = secret_token.encode() if secret_token else None
+        self.decoder = get_decoder(type)
+        self.max_body = max_body
+        self.reply_timeout = reply_timeout
+        self.client = client
+        self.tasks: Set[asyncio.Future[Any]] = set()
+
+    def authorized(self, token: Optional[bytes]) -> bool:
+        if self.secret is None:
+            return True
+        return token is not None and hmac.compare_digest(token, self.secret)
+
+    async def receive(
+        self,
+        method: str,
+        token: Optional[bytes],
+        body: bytes,
+    ) -> Tuple[int, bytes]:
+        """Schedule the handler for a request and return the response."""
+        if method != "POST":
+            return 405, b""
+        if not self.authorized(token):
+            return 403, b""
+        try:
+            update = self.decoder.decode(body)
+        except msgspec.DecodeError:
+            return 400, b""
+        task = self.spawn(self.handle(update))
+        if self.reply_timeout is None:
+            task.add_done_callback(self.forward)
+            return 200, b""
+        done, _ = await asyncio.wait((task,), timeout=self.reply_timeout)
+        if not done:
+            task.add_done_callback(self.forward)
+            return 200, b""
+        result = task.result()
+        if isinstance(result, Path):
+            body = reply_body(result)
+            if body is not None:
+                return 200, body
+            self.send(result)
+        return 200, b""
+
+    def spawn(self, coro: Awaitable[Any]) -> asyncio.Future[Any]:
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def handle(self, update: Any) -> Any:
+        try:
+            return await self.handler(update)
+        except Exception:
+            logger.exception(
+                "Error handling update %s", getattr(update, "update_id", None)
+            )
+
+    def forward(self, task: asyncio.Future[Any]) -> None:
+        if task.cancelled():
+            return
+        result = task.result()
+        if isinstance(result, Path):
+            self.send(result)
+
+    def send(self, path: Path[Any]) -> None:
+        if self.client is None:
+            logger.warning("No client to send %r returned by handler", path)
+            return
+        self.spawn(self.call(self.client, path))
+
+    async def call(self, client: BaseClient, path: Path[Any]) -> None:
+        try:
+            await client(path)
+        except Exception:
+            logger.exception("Error sending %r returned by handler", path)
+
+    async def close(self) -> None:
+        """Wait for the running handlers and the calls they returned."""
+        while self.tasks:
+            await asyncio.gather(*self.tasks)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await self.close()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        token = None
+        for name, value in scope["headers"]:
+            if name == SECRET_HEADER:
+                token = value
+        chunks: List[bytes] = []
+        size = 0
+        more = True
+        while more and size <= self.max_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            more = message.get("more_body", False)
+        if size > self.max_body:
+            status, body = 413, b""
+        else:
+            status, body = await self.receive(
+                scope["method"],
+                token,
+                b"".join(chunks),
+            )
+        headers = [(b"content-length", str(len(body)).encode())]
+        if body:
+            headers.append((b"content-type", b"application/json"))
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve keep-alive HTTP/1.1 requests of a single connection."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                request_line, *lines = head[:-4].split(b"\r\n")
+                method, _, target = request_line.partition(b" ")
+                headers = {}
+                for line in lines:
+                    name, _, value = line.partition(b":")
+                    headers[name.strip().lower()] = value.strip()
+                connection = headers.get(b"connection", b"").lower()
+                if target.endswith(b"HTTP/1.1"):
+                    keep_alive = connection != b"close"
+                else:
+                    keep_alive = connection == b"keep-alive"
+                length = headers.get(b"content-length")
+                if length is None or not length.isdigit():
+                    data = RESPONSES[411 if method == b"POST" else 405]
+                    keep_alive = False
+                elif int(length) > self.max_body:
+                    data = RESPONSES[413]
+                    keep_alive = False
+                else:
+                    status, body = await self.receive(
+                        method.decode("latin-1"),
+                        headers.get(SECRET_HEADER),
+                        await reader.readexactly(int(length)),
+                    )
+                    data = response(status, body) if body else RESPONSES[status]
+                writer.write(data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(
+        self,
+        host: Optional[str] = None,
+        port: int = 8080,
+        *,
+        ssl: Optional[SSLContext] = None,
+        backlog: int = 128,
+    ) -> None:
+        """
+        Serve webhook requests on `host`:`port` until cancelled. Telegram
+        opens at most `max_connections` of setWebhook at once, all served
+        by this event loop.
+        """
+        server = await asyncio.start_server(
+            self.connection,
+            host,
+            port,
+            ssl=ssl,
+            backlog=backlog,
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
@@ -0,0 +1,48 @@
+from typing import Any, Callable, Optional
+
+import httpx
+import pytest
+
+from tgx.bot.client import Client
+from tgx.bot.schemas import Chat, Message, MessageEntity, PhotoSize
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def mock_client() -> Callable[..., Client]:
+    """Factory of clients whose requests are answered by a handler."""
+
+    def make(handler: Handler, **kwargs: Any) -> Client:
+        client = Client("TOKEN", **kwargs)
+        client.http = httpx.AsyncClient(
+            base_url=client.http.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    return make
+
+
+@pytest.fixture
+def message() -> Callable[..., Message]:
+    """Factory of text or photo messages of a private chat by default."""
+
+    def make(
+        text: Optional[str] = None,
+        *entities: MessageEntity,
+        photo: bool = False,
+        chat_type: str = "private",
+    ) -> Message:
+        return Message(
+            message_id=1,
+            date=0,
+            chat=Chat(id=1, type=chat_type),
+            text=text,
+            entities=list(entities) if entities else None,
+            photo=[
+                PhotoSize(file_id="a", file_unique_id="b", width=1, height=1)
+            ] if photo else None,
+        )
+
+    return make
@@ -0,0 +1,84 @@
+import asyncio
+import os
+from typing import Any, List
+
+from tgx.bot.dedup import DedupHandler, UpdateWindow
+
+
+def test_duplicates() -> None:
+    window = UpdateWindow(8)
+    seq = [10, 11, 11, 13, 12, 12, 10, 20, 13, 14]
+    assert [window.add(i) for i in seq] == [
+        True, True, False, True, True, False, False, True, False, True
+    ]
+
+
+def test_stale_id_keeps_window() -> None:
+    window = UpdateWindow(8)
+    assert [window.add(i) for i in (10, 11, 12, 13, 2, 10)] == [
+        True, True, True, True, True, False
+    ]
+    assert window.high == 13
+
+
+def test_restart_of_sequence() -> None:
+    window = UpdateWindow(8, restart_after=3)
+    for i in (1000, 1001):
+        window.add(i)
+    assert [window.add(i) for i in (5, 6, 6, 7, 8, 7)] == [
+        True, True, False, True, True, False
+    ]
+    assert window.high == 8
+
+
+def test_jump_forward() -> None:
+    window = UpdateWindow(8)
+    assert [window.add(i) for i in (1, 10**12, 10**12)] == [True, True, False]
+
+
+def test_saved_high(tmp_path: os.PathLike) -> None:
+    path = os.path.join(tmp_path, "window")
+    window = UpdateWindow(8, path=path, save_every=2)
+    for i in (1, 2, 3, 4, 5):
+        window.add(i)
+    restored = UpdateWindow(8, path=path)
+    assert [restored.add(i) for i in (3, 4, 5, 6)] == [False, False, True, True]
+
+
+def test_close_saves_unsaved_ids(tmp_path: os.PathLike) -> None:
+    path = os.path.join(tmp_path, "window")
+    window = UpdateWindow(8, path=path, save_every=100)
+    for i in (1, 2, 3):
+        window.add(i)
+    assert not os.path.exists(path)
+    window.close()
+    restored = UpdateWindow(8, path=path)
+    assert [restored.add(i) for i in (3, 4)] == [False, True]
+    assert restored.unsaved == 1
+    restored.flush()
+    assert restored.unsaved == 0
+    with open(path) as f:
+        assert f.read() == "4"
+
+
+def test_handler_close(tmp_path: os.PathLike) -> None:
+    path = os.path.join(tmp_path, "window")
+    handled: List[Any] = []
+
+    class Update:
+        def __init__(self, update_id: int) -> None:
+            self.update_id = update_id
+
+    async def handler(update: Any) -> None:
+        handled.append(update.update_id)
+
+    async def main() -> None:
+        dedup = DedupHandler(handler, UpdateWindow(8, path=path))
+        for i in (1, 2, 2, 3):
+            await dedup(Update(i))
+        await dedup.close()
+
+    asyncio.run(main())
+    assert handled == [1, 2, 3]
+    with open(path) as f:
+        assert f.read() == "3"
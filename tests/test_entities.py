@@ -0,0 +1,66 @@
+from typing import Any, Callable
+
+from tgx.bot.entities import entity_texts, to_html, to_markdown, utf16_slice
+from tgx.bot.schemas import Message, MessageEntity
+
+Factory = Callable[..., Message]
+
+
+def entity(type: str, offset: int, length: int, **kwargs: Any) -> MessageEntity:
+    return MessageEntity(type=type, offset=offset, length=length, **kwargs)
+
+
+def test_utf16_slice_after_emoji() -> None:
+    # "👍" is two UTF-16 code units
+    assert utf16_slice("👍 hi there", 3, 2) == "hi"
+    assert utf16_slice("plain", 1, 3) == "lai"
+
+
+def test_entity_texts() -> None:
+    text = "🎉 /start 🎉 bold"
+    entities = [entity("bot_command", 3, 6), entity("bold", 13, 4)]
+    assert entity_texts(text, entities) == ["/start", "bold"]
+
+
+def test_html_emoji_offsets(message: Factory) -> None:
+    m = message("👍 a <b> 👍 c", entity("bold", 3, 5), entity("italic", 12, 1))
+    assert to_html(m) == "👍 <b>a &lt;b&gt;</b> 👍 <i>c</i>"
+
+
+def test_html_nested(message: Factory) -> None:
+    m = message(
+        "bold italic link",
+        entity("bold", 0, 16),
+        entity("italic", 5, 11),
+        entity("text_link", 12, 4, url="https://a.b/?x=1&y=2"),
+    )
+    assert to_html(m) == (
+        '<b>bold <i>italic <a href="https://a.b/?x=1&amp;y=2">link</a></i></b>'
+    )
+
+
+def test_html_pre_with_language(message: Factory) -> None:
+    m = message("x = 1 < 2", entity("pre", 0, 9, language="python"))
+    assert to_html(m) == '<pre><code class="language-python">x = 1 &lt; 2</code></pre>'
+
+
+def test_markdown_nested_and_escaped(message: Factory) -> None:
+    m = message("a.b 🎉 c_d", entity("bold", 0, 10), entity("italic", 7, 3))
+    assert to_markdown(m) == "*a\\.b 🎉 _c\\_d_*"
+
+
+def test_markdown_code_escapes(message: Factory) -> None:
+    m = message("f(`x`) * 2", entity("code", 0, 6))
+    assert to_markdown(m) == "`f(\\`x\\`)` \\* 2"
+
+
+def test_markdown_blockquote(message: Factory) -> None:
+    m = message("said:\nfirst\nsecond\nafter", entity("blockquote", 6, 12))
+    assert to_markdown(m) == "said:\n>first\n>second\nafter"
+    assert to_html(m) == "said:\n<blockquote>first\nsecond</blockquote>\nafter"
+
+
+def test_no_entities(message: Factory) -> None:
+    m = message("1 < 2.")
+    assert to_html(m) == "1 &lt; 2."
+    assert to_markdown(m) == "1 < 2\\."
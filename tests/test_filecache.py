@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from tgx.bot.filecache import Backend, FileCache, Key
+from tgx.bot.files import InputFile
+from tgx.bot.paths import SendDocument, SendMediaGroup
+from tgx.bot.schemas import InputMediaDocument
+
+
+class DictBackend(Backend):
+    def __init__(self) -> None:
+        self.ids: Dict[Key, str] = {}
+
+    def get(self, key: Key) -> Optional[str]:
+        return self.ids.get(key)
+
+    def set(self, key: Key, file_id: str) -> None:
+        self.ids[key] = file_id
+
+
+def message(i: int) -> Dict[str, Any]:
+    return {
+        "message_id": i,
+        "date": 0,
+        "chat": {"id": 1, "type": "private"},
+        "document": {"file_id": f"id{i}", "file_unique_id": f"u{i}"},
+    }
+
+
+def uploading(
+    uploads: List[httpx.Request], result: Any
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        if request.headers["Content-Type"].startswith("multipart/"):
+            uploads.append(request)
+        return httpx.Response(200, json={"ok": True, "result": result})
+
+    return handler
+
+
+def test_broadcast_uploads_once(mock_client: Callable[..., Any]) -> None:
+    uploads: List[httpx.Request] = []
+    cache = FileCache()
+    client = mock_client(uploading(uploads, message(0)), file_cache=cache)
+    file = InputFile(b"contents", filename="a.txt")
+    paths = [SendDocument(chat_id=i, document=file) for i in range(1, 6)]
+    asyncio.run(client.gather(paths))
+    assert len(uploads) == 1
+    assert list(cache.ids.values()) == ["id0"]
+    assert cache.pending == {}
+
+
+def test_groups_in_reverse_order(mock_client: Callable[..., Any]) -> None:
+    uploads: List[httpx.Request] = []
+    cache = FileCache(backend=DictBackend())
+    result = [message(0), message(1)]
+    client = mock_client(uploading(uploads, result), file_cache=cache)
+    x = InputFile(b"x", filename="x.txt")
+    y = InputFile(b"y", filename="y.txt")
+
+    def group(*files: InputFile) -> SendMediaGroup:
+        return SendMediaGroup(
+            chat_id=1, media=[InputMediaDocument(media=f) for f in files]
+        )
+
+    async def main() -> None:
+        await asyncio.wait_for(
+            asyncio.gather(client(group(x, y)), client(group(y, x))), 5
+        )
+
+    asyncio.run(main())
+    assert 1 <= len(uploads) <= 2
+    assert len(cache.ids) == 2
+    assert cache.pending == {}
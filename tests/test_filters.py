@@ -0,0 +1,74 @@
+from typing import Any, Callable, List
+
+from tgx.bot.filters import F, compile_routes
+from tgx.bot.schemas import Message
+
+Factory = Callable[..., Message]
+
+
+def test_first_matching_route(message: Factory) -> None:
+    match = compile_routes([
+        F.text.startswith("/start") & (F.chat.type == "private"),
+        (F.chat.type == "private") & F.photo,
+        None,
+    ])
+    assert match(message("/start")) == 0
+    assert match(message(photo=True)) == 1
+    assert match(message("/start", chat_type="group")) == 2
+
+
+def test_no_route(message: Factory) -> None:
+    match = compile_routes([F.text == "a", F.chat.type.in_({"group"})])
+    assert match(message("b")) == -1
+    assert match(message(chat_type="group")) == 1
+
+
+def test_func_guarded_by_cheaper_check(message: Factory) -> None:
+    calls: List[Any] = []
+
+    def command(m: Message) -> bool:
+        calls.append(m)
+        return m.text.startswith("/a")  # type: ignore[union-attr]
+
+    match = compile_routes([F.text & command])
+    assert match(message(photo=True)) == -1
+    assert calls == []
+    assert match(message("/a")) == 0
+
+
+def test_shared_func_stays_guarded(message: Factory) -> None:
+    def command(m: Message) -> bool:
+        return m.text.startswith("/a")  # type: ignore[union-attr]
+
+    match = compile_routes([F.text & command, (F.text & command) | F.photo])
+    assert match(message(photo=True)) == 1
+    assert match(message("/a")) == 0
+    assert match(message("b")) == -1
+
+
+def test_shared_predicate_evaluated_once(message: Factory) -> None:
+    calls: List[Any] = []
+
+    def check(m: Message) -> bool:
+        calls.append(m)
+        return False
+
+    match = compile_routes([
+        (F.chat.type == "private") & check,
+        (F.chat.type == "private") & check | (F.text == "x"),
+    ])
+    assert match(message("x")) == 1
+    assert len(calls) == 1
+
+
+def test_not(message: Factory) -> None:
+    match = compile_routes([~F.text, F.text])
+    assert match(message()) == 0
+    assert match(message("a")) == 1
+
+
+def test_compile_single_filter(message: Factory) -> None:
+    check = (F.text.startswith("/") | F.photo).compile()
+    assert check(message("/a"))
+    assert check(message(photo=True))
+    assert not check(message("a"))
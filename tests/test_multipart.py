@@ -0,0 +1,168 @@
+import asyncio
+import io
+import json
+import os
+from email.message import Message as Part
+from email.parser import BytesParser
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+import httpx
+import pytest
+
+from tgx.bot.files import InputFile
+from tgx.bot.paths import SendDocument, SendMediaGroup, SendMessage
+from tgx.bot.schemas import InputMediaVideo
+
+MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}}
+
+
+def parse(request: httpx.Request) -> Dict[str, Part]:
+    """Parts of a multipart/form-data request by their field name."""
+    head = f"Content-Type: {request.headers['Content-Type']}\r\n\r\n"
+    form = BytesParser().parsebytes(head.encode() + request.content)
+    assert form.is_multipart()
+    return {
+        part.get_param("name", header="Content-Disposition"): part
+        for part in form.get_payload()
+    }
+
+
+def recording(
+    requests: List[httpx.Request], result: Any = MESSAGE
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True, "result": result})
+
+    return handler
+
+
+async def stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def test_json_without_files(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+    asyncio.run(client(SendMessage(chat_id=1, text="hi")))
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(requests[0].content) == {"chat_id": 1, "text": "hi"}
+
+
+def test_file_field(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+    file = InputFile(b"contents", filename="a.txt")
+    asyncio.run(client(SendDocument(chat_id=1, document=file, caption="c")))
+    parts = parse(requests[0])
+    assert parts["chat_id"].get_payload(decode=True) == b"1"
+    assert parts["caption"].get_payload(decode=True) == b"c"
+    assert parts["document"].get_filename() == "a.txt"
+    assert parts["document"].get_payload(decode=True) == b"contents"
+
+
+def test_seekable_source_is_rewound(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+    source = io.BytesIO(b"skipcontents")
+    source.seek(4)
+    path = SendDocument(chat_id=1, document=InputFile(source))
+
+    async def main() -> None:
+        await client(path)
+        await client(path)
+
+    asyncio.run(main())
+    assert [
+        parse(r)["document"].get_payload(decode=True) for r in requests
+    ] == [b"contents", b"contents"]
+
+
+def test_stream_is_read_once(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+    file = InputFile(stream(b"con", b"tents"), filename="a.txt")
+    path = SendDocument(chat_id=1, document=file)
+
+    async def main() -> None:
+        await client(path)
+        with pytest.raises(RuntimeError):
+            await client(path)
+
+    asyncio.run(main())
+    assert len(requests) == 1
+    assert parse(requests[0])["document"].get_payload(decode=True) == (
+        b"contents"
+    )
+
+
+def test_filename_is_escaped(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+    file = InputFile(b"x", filename='a"b\r\n.txt')
+    asyncio.run(client(SendDocument(chat_id=1, document=file)))
+    assert b'filename="a%22b%0D%0A.txt"' in requests[0].content
+    assert parse(requests[0])["document"].get_payload(decode=True) == b"x"
+
+
+def test_attached_files_are_sent_once(
+    mock_client: Callable[..., Any]
+) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests, [MESSAGE, MESSAGE]))
+    thumbnail = InputFile(b"thumb", filename="t.jpg")
+    media = [
+        InputMediaVideo(
+            media=InputFile(b"video%d" % i, filename=f"{i}.mp4"),
+            thumbnail=thumbnail,
+        )
+        for i in range(2)
+    ]
+    asyncio.run(client(SendMediaGroup(chat_id=1, media=media)))
+    parts = parse(requests[0])
+    encoded = json.loads(parts["media"].get_payload(decode=True))
+    assert [m["media"] for m in encoded] == ["attach://file0", "attach://file2"]
+    assert [m["thumbnail"] for m in encoded] == ["attach://file1"] * 2
+    assert sorted(parts) == ["chat_id", "file0", "file1", "file2", "media"]
+    assert parts["file1"].get_payload(decode=True) == b"thumb"
+    assert parts["file2"].get_payload(decode=True) == b"video1"
+
+
+def test_content_length_of_sized_files(
+    mock_client: Callable[..., Any], tmp_path: os.PathLike
+) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+    filename = os.path.join(tmp_path, "a.txt")
+    with open(filename, "wb") as f:
+        f.write(b"from disk")
+
+    async def main() -> None:
+        await client(SendDocument(chat_id=1, document=InputFile(b"bytes")))
+        await client(SendDocument(chat_id=1, document=InputFile(filename)))
+
+    asyncio.run(main())
+    for request in requests:
+        assert "Transfer-Encoding" not in request.headers
+        assert int(request.headers["Content-Length"]) == len(request.content)
+    assert parse(requests[1])["document"].get_filename() == "a.txt"
+    assert parse(requests[1])["document"].get_payload(decode=True) == (
+        b"from disk"
+    )
+
+
+def test_chunked_unsized_files(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+    client = mock_client(recording(requests))
+
+    async def main() -> None:
+        for source in (io.BytesIO(b"file"), stream(b"fi", b"le")):
+            await client(SendDocument(chat_id=1, document=InputFile(source)))
+
+    asyncio.run(main())
+    for request in requests:
+        assert "Content-Length" not in request.headers
+        assert request.headers["Transfer-Encoding"] == "chunked"
+        assert parse(request)["document"].get_payload(decode=True) == b"file"
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from tgx.bot.ordering import OrderedHandler
+
+
+def key(update: Any) -> Any:
+    return update[0]
+
+
+def test_overflowing_backlog_is_handled_in_order() -> None:
+    handled: List[Any] = []
+
+    async def handler(update: Any) -> int:
+        # Doesn't suspend, like a Dispatcher without a matching route
+        handled.append(update)
+        return update[1]
+
+    async def main() -> List[int]:
+        ordered = OrderedHandler(handler, key=key, max_backlog=100)
+        updates = [(1, i) for i in range(150)]
+        results = await asyncio.wait_for(
+            asyncio.gather(*(ordered(u) for u in updates)), 5
+        )
+        assert ordered.lanes == {}
+        return results
+
+    assert asyncio.run(main()) == list(range(150))
+    assert handled == [(1, i) for i in range(150)]
+
+
+def test_order_within_chat_concurrency_across_chats() -> None:
+    log: Dict[int, List[int]] = {}
+    running: Dict[int, int] = {}
+    overlap: List[bool] = []
+
+    async def handler(update: Any) -> None:
+        chat, i = update
+        running[chat] = running.get(chat, 0) + 1
+        overlap.append(len([n for n in running.values() if n]) > 1)
+        assert running[chat] == 1
+        await asyncio.sleep(0.001 * (i % 3))
+        log.setdefault(chat, []).append(i)
+        running[chat] -= 1
+
+    async def main() -> None:
+        ordered = OrderedHandler(handler, key=key, max_backlog=2)
+        updates = [(chat, i) for i in range(20) for chat in range(3)]
+        await asyncio.wait_for(
+            asyncio.gather(*(ordered(u) for u in updates)), 5
+        )
+        assert ordered.lanes == {}
+
+    asyncio.run(main())
+    assert log == {chat: list(range(20)) for chat in range(3)}
+    assert any(overlap)
+
+
+def test_updates_without_key_are_not_queued() -> None:
+    async def handler(update: Any) -> Any:
+        return update
+
+    async def main() -> Any:
+        ordered = OrderedHandler(handler, key=lambda update: None)
+        return await ordered("update")
+
+    assert asyncio.run(main()) == "update"
+
+
+def test_errors_reach_the_caller_only() -> None:
+    async def handler(update: Any) -> Any:
+        if update[1] == 0:
+            raise ValueError(update)
+        return update[1]
+
+    async def main() -> List[Any]:
+        ordered = OrderedHandler(handler, key=key)
+        return await asyncio.gather(
+            *(ordered((1, i)) for i in range(3)), return_exceptions=True
+        )
+
+    first, *rest = asyncio.run(main())
+    assert isinstance(first, ValueError)
+    assert rest == [1, 2]
+
+
+def test_cancelled_worker_releases_callers() -> None:
+    async def handler(update: Any) -> None:
+        await asyncio.sleep(10)
+
+    async def main() -> None:
+        ordered = OrderedHandler(handler, key=key, max_backlog=1)
+        calls = [asyncio.ensure_future(ordered((1, i))) for i in range(3)]
+        await asyncio.sleep(0.01)
+        for worker in ordered.workers:
+            worker.cancel()
+        done, _ = await asyncio.wait(calls, timeout=1)
+        assert len(done) == 3
+        assert ordered.lanes == {}
+        with pytest.raises(asyncio.CancelledError):
+            await calls[-1]
+
+    asyncio.run(main())
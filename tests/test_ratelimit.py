@@ -0,0 +1,132 @@
+import asyncio
+import json
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+
+from tgx.bot._base import TelegramError
+from tgx.bot.paths import GetMe, SendChatAction, SendMessage
+from tgx.bot.ratelimit import RateLimiter
+
+MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}}
+USER = {"id": 1, "is_bot": True, "first_name": "bot"}
+
+
+def reserve(limiter: RateLimiter, chat_ids: List[Any]) -> List[float]:
+    return [round(limiter.reserve(c, now=0.0), 6) for c in chat_ids]
+
+
+def test_private_bucket() -> None:
+    limiter = RateLimiter(global_rate=1000, private_rate=1)
+    assert reserve(limiter, [1, 1, 1]) == [0, 1, 2]
+
+
+def test_group_bucket() -> None:
+    limiter = RateLimiter(global_rate=1000, group_rate=1 / 3)
+    assert reserve(limiter, [-100, -100]) == [0, 3]
+    assert reserve(RateLimiter(global_rate=1000), ["@channel"] * 2) == [0, 3]
+
+
+def test_global_bucket() -> None:
+    limiter = RateLimiter(global_rate=10, private_rate=1000)
+    assert reserve(limiter, [1, 2, 3]) == [0, 0.1, 0.2]
+
+
+def test_burst() -> None:
+    limiter = RateLimiter(global_rate=1000, private_rate=1, burst=3)
+    assert reserve(limiter, [1, 1, 1, 1]) == [0, 0, 0, 1]
+
+
+def test_pause() -> None:
+    limiter = RateLimiter()
+    limiter.pause(5)
+    assert limiter.reserve(1) == pytest.approx(5, abs=0.1)
+    assert limiter.reserve(2) == pytest.approx(5, abs=0.1)
+
+
+def limited_client(
+    mock_client: Callable[..., Any], handler: Any
+) -> Any:
+    # Record the delays instead of sleeping them
+    limiter = RateLimiter(global_rate=1000)
+    delays: List[float] = []
+
+    async def acquire(chat_id: Any) -> None:
+        delays.append(limiter.reserve(chat_id))
+
+    limiter.acquire = acquire  # type: ignore[method-assign]
+    return mock_client(handler, limiter=limiter), delays
+
+
+def test_retry_after(mock_client: Callable[..., Any]) -> None:
+    replies = [
+        {
+            "ok": False,
+            "error_code": 429,
+            "description": "Too Many Requests: retry after 7",
+            "parameters": {"retry_after": 7},
+        },
+        {"ok": True, "result": MESSAGE},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=replies.pop(0))
+
+    client, delays = limited_client(mock_client, handler)
+    message = asyncio.run(client(SendMessage(chat_id=1, text="hi")))
+    assert message.message_id == 1
+    assert delays[0] == pytest.approx(0, abs=0.1)
+    assert delays[1] == pytest.approx(7, abs=0.1)
+
+
+def test_retries_run_out(mock_client: Callable[..., Any]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "ok": False,
+            "error_code": 429,
+            "description": "Too Many Requests: retry after 1",
+            "parameters": {"retry_after": 1},
+        })
+
+    client, delays = limited_client(mock_client, handler)
+    client.limiter.retries = 2
+    with pytest.raises(TelegramError):
+        asyncio.run(client(SendMessage(chat_id=1, text="hi")))
+    assert len(delays) == 3
+
+
+def test_only_limited_paths(mock_client: Callable[..., Any]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        result = {"sendMessage": MESSAGE, "getMe": USER}.get(method, True)
+        return httpx.Response(200, json={"ok": True, "result": result})
+
+    client, delays = limited_client(mock_client, handler)
+
+    async def main() -> None:
+        await client(GetMe())
+        await client(SendChatAction(chat_id=1, action="typing"))
+        await client(SendMessage(chat_id=1, text="hi"))
+
+    asyncio.run(main())
+    assert len(delays) == 1
+    assert not GetMe.limited and not SendChatAction.limited
+    assert SendMessage.limited
+
+
+def test_other_errors_are_not_retried(
+    mock_client: Callable[..., Any]
+) -> None:
+    calls: List[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "ok": False, "error_code": 400, "description": "Bad Request"
+        })
+
+    client, delays = limited_client(mock_client, handler)
+    with pytest.raises(TelegramError):
+        asyncio.run(client(SendMessage(chat_id=1, text="hi")))
+    assert len(calls) == len(delays) == 1
@@ -0,0 +1,34 @@
+import msgspec
+import pytest
+
+from tgx.bot import storage
+from tgx.bot.codec import decode_update
+from tgx.bot.schemas import API_VERSION, Update
+
+UPDATE = decode_update(
+    b'{"update_id":1,"message":{"message_id":2,"date":0,'
+    b'"chat":{"id":3,"type":"private"},"text":"\xf0\x9f\x91\x8d hi",'
+    b'"entities":[{"offset":3,"length":2,"type":"bold"}]}}'
+)
+
+
+def test_roundtrip() -> None:
+    data = storage.encode_update(UPDATE)
+    assert storage.version(data) == API_VERSION
+    assert storage.decode_update(data) == UPDATE
+    assert storage.decode(bytearray(data), Update) == UPDATE
+
+
+def test_other_version() -> None:
+    data = msgspec.msgpack.encode("1.0") + msgspec.msgpack.encode(
+        {"update_id": 1, "added_in_1_0": True}
+    )
+    assert storage.version(data) == "1.0"
+    assert storage.decode_update(data) == Update(update_id=1)
+    with pytest.raises(ValueError):
+        storage.decode_update(data, strict=True)
+
+
+def test_not_stored() -> None:
+    with pytest.raises(ValueError):
+        storage.decode_update(msgspec.msgpack.encode(1))
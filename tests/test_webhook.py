@@ -0,0 +1,215 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+
+from tgx.bot.files import InputFile
+from tgx.bot.paths import GetMe, SendDocument, SendMessage
+from tgx.bot.schemas import Update
+from tgx.bot.webhook import Webhook, reply_body
+
+UPDATE = (
+    b'{"update_id":1,"message":{"message_id":2,"date":0,'
+    b'"chat":{"id":3,"type":"private"},"text":"hi"}}'
+)
+
+MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 3, "type": "private"}}
+
+
+def recorder() -> Tuple[List[Any], Any]:
+    updates: List[Any] = []
+
+    async def handler(update: Any) -> None:
+        updates.append(update)
+
+    return updates, handler
+
+
+def recording(
+    requests: List[httpx.Request],
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True, "result": MESSAGE})
+
+    return handler
+
+
+def test_receive() -> None:
+    updates, handler = recorder()
+
+    async def main() -> List[Tuple[int, bytes]]:
+        webhook = Webhook(handler, secret_token="secret")
+        responses = [
+            await webhook.receive("GET", b"secret", UPDATE),
+            await webhook.receive("POST", None, UPDATE),
+            await webhook.receive("POST", b"wrong", UPDATE),
+            await webhook.receive("POST", b"secret", b"{"),
+            await webhook.receive("POST", b"secret", UPDATE),
+        ]
+        await webhook.close()
+        return responses
+
+    assert asyncio.run(main()) == [
+        (405, b""), (403, b""), (403, b""), (400, b""), (200, b"")
+    ]
+    assert len(updates) == 1
+    assert isinstance(updates[0], Update)
+    assert updates[0].message.text == "hi"
+
+
+def test_handler_errors_are_logged() -> None:
+    async def handler(update: Any) -> None:
+        raise ValueError(update)
+
+    async def main() -> Tuple[int, bytes]:
+        webhook = Webhook(handler)
+        response = await webhook.receive("POST", None, UPDATE)
+        await webhook.close()
+        return response
+
+    assert asyncio.run(main()) == (200, b"")
+
+
+def test_asgi_round_trip() -> None:
+    updates, handler = recorder()
+    sent: List[Dict[str, Any]] = []
+
+    async def main() -> None:
+        webhook = Webhook(handler, secret_token="secret")
+        body = [
+            {"type": "http.request", "body": UPDATE[:10], "more_body": True},
+            {"type": "http.request", "body": UPDATE[10:]},
+        ]
+
+        async def receive() -> Dict[str, Any]:
+            return body.pop(0)
+
+        async def send(message: Dict[str, Any]) -> None:
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"x-telegram-bot-api-secret-token", b"secret")],
+        }
+        await webhook(scope, receive, send)
+        await webhook.close()
+
+    asyncio.run(main())
+    assert sent == [
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-length", b"0")],
+        },
+        {"type": "http.response.body", "body": b""},
+    ]
+    assert [u.update_id for u in updates] == [1]
+
+
+def test_asgi_body_too_large() -> None:
+    updates, handler = recorder()
+    sent: List[Dict[str, Any]] = []
+
+    async def main() -> None:
+        webhook = Webhook(handler, max_body=10)
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": UPDATE}
+
+        async def send(message: Dict[str, Any]) -> None:
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "headers": []}
+        await webhook(scope, receive, send)
+
+    asyncio.run(main())
+    assert sent[0]["status"] == 413
+    assert updates == []
+
+
+def test_keep_alive_connection() -> None:
+    updates, handler = recorder()
+    request = (
+        b"POST / HTTP/1.1\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n" % len(UPDATE)
+    ) + UPDATE
+
+    async def main() -> bytes:
+        webhook = Webhook(handler)
+        server = await asyncio.start_server(webhook.connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request + request + b"GET / HTTP/1.0\r\n\r\n")
+            data = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+        await webhook.close()
+        return data
+
+    ok = b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+    assert asyncio.run(main()) == (
+        ok + ok + b"HTTP/1.1 405 Method Not Allowed\r\nContent-Length: 0\r\n\r\n"
+    )
+    assert len(updates) == 2
+
+
+def test_reply_body() -> None:
+    assert reply_body(GetMe()) == b'{"method":"getMe"}'
+    assert json.loads(reply_body(SendMessage(chat_id=1, text="hi"))) == {
+        "method": "sendMessage", "chat_id": 1, "text": "hi"
+    }
+    document = SendDocument(chat_id=1, document=InputFile(b"x"))
+    assert reply_body(document) is None
+
+
+def test_reply_with_path(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+
+    async def handler(update: Update) -> Any:
+        if update.update_id == 1:
+            return SendMessage(chat_id=update.message.chat.id, text="hi")
+        return SendDocument(chat_id=3, document=InputFile(b"x"))
+
+    async def main() -> List[Tuple[int, bytes]]:
+        client = mock_client(recording(requests))
+        webhook = Webhook(handler, reply_timeout=1, client=client)
+        responses = [
+            await webhook.receive("POST", None, UPDATE),
+            await webhook.receive(
+                "POST", None, UPDATE.replace(b'"update_id":1', b'"update_id":2')
+            ),
+        ]
+        await webhook.close()
+        return responses
+
+    (status, body), multipart = asyncio.run(main())
+    assert status == 200
+    assert json.loads(body) == {"method": "sendMessage", "chat_id": 3, "text": "hi"}
+    # A Path with files can't be a response body, the client sends it
+    assert multipart == (200, b"")
+    assert len(requests) == 1
+    assert requests[0].url.path.endswith("/sendDocument")
+
+
+def test_late_reply_is_sent(mock_client: Callable[..., Any]) -> None:
+    requests: List[httpx.Request] = []
+
+    async def handler(update: Update) -> Any:
+        await asyncio.sleep(0.05)
+        return SendMessage(chat_id=3, text="late")
+
+    async def main() -> Tuple[int, bytes]:
+        client = mock_client(recording(requests))
+        webhook = Webhook(handler, reply_timeout=0.01, client=client)
+        response = await webhook.receive("POST", None, UPDATE)
+        assert requests == []
+        await webhook.close()
+        return response
+
+    assert asyncio.run(main()) == (200, b"")
+    assert json.loads(requests[0].content) == {"chat_id": 3, "text": "late"}